@@ -4,12 +4,9 @@ Uses HuggingFace Inference API (FREE) with fallback to rule-based generation.
 Generates personalized, company-specific cover letters with tone selection.
 """
 
-import os
-import requests
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, AsyncIterator
 
-# HuggingFace Inference API endpoint
-HF_API_URL = "https://api-inference.huggingface.co/models/mistralai/Mistral-7B-Instruct-v0.2"
+from app.ai_engine.inference_client import query_huggingface, stream_with_fallback
 
 TONE_INSTRUCTIONS = {
     "formal": "Use a very formal and respectful tone. Be traditional and courteous.",
@@ -18,51 +15,14 @@ TONE_INSTRUCTIONS = {
 }
 
 
-def get_hf_headers() -> Optional[Dict[str, str]]:
-    """Get HuggingFace API headers if API key is available."""
-    api_key = os.getenv("HUGGINGFACE_API_KEY", "")
-    if api_key and api_key != "your-huggingface-api-key-here":
-        return {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
-    return None
-
-
-def query_huggingface(prompt: str, max_tokens: int = 1000) -> Optional[str]:
-    """Send a prompt to HuggingFace Inference API."""
-    headers = get_hf_headers()
-    if not headers:
-        return None
-
-    formatted_prompt = f"<s>[INST] {prompt} [/INST]"
-    payload = {
-        "inputs": formatted_prompt,
-        "parameters": {
-            "max_new_tokens": max_tokens,
-            "temperature": 0.7,
-            "top_p": 0.9,
-            "do_sample": True,
-            "return_full_text": False,
-        }
-    }
-
-    try:
-        response = requests.post(HF_API_URL, headers=headers, json=payload, timeout=60)
-        if response.status_code == 200:
-            result = response.json()
-            if isinstance(result, list) and len(result) > 0:
-                return result[0].get("generated_text", "")
-        return None
-    except Exception:
-        return None
-
-
-def generate_cover_letter(
+def build_cover_letter_prompt(
     resume_data: Dict[str, Any],
     company_name: str,
     job_title: str,
     job_description: Optional[str] = None,
     tone: str = "professional",
-) -> Dict[str, Any]:
-    """Generate a personalized cover letter."""
+) -> str:
+    """Instruction prompt for a cover letter to company_name for job_title."""
     personal = resume_data.get("personal_info", {})
     if not isinstance(personal, dict):
         personal = {}
@@ -88,20 +48,68 @@ Requirements:
 4. Keep it concise (3-4 paragraphs)
 5. Include a strong opening and closing
 """
+    return prompt
+
+
+def _ai_result(content: str) -> Dict[str, Any]:
+    return {
+        "success": True,
+        "generated_content": content,
+        "method": "huggingface",
+    }
+
+
+async def generate_cover_letter(
+    resume_data: Dict[str, Any],
+    company_name: str,
+    job_title: str,
+    job_description: Optional[str] = None,
+    tone: str = "professional",
+) -> Dict[str, Any]:
+    """Generate a personalized cover letter."""
+    prompt = build_cover_letter_prompt(resume_data, company_name, job_title, job_description, tone)
 
     # Try HuggingFace API
-    ai_result = query_huggingface(prompt)
+    ai_result = await query_huggingface(prompt, max_tokens=1000)
     if ai_result:
-        return {
-            "success": True,
-            "generated_content": ai_result.strip(),
-            "method": "huggingface",
-        }
+        return _ai_result(ai_result.strip())
 
     # Fallback to rule-based
     return _generate_rule_based(resume_data, company_name, job_title, job_description, tone)
 
 
+async def stream_cover_letter(
+    resume_data: Dict[str, Any],
+    company_name: str,
+    job_title: str,
+    job_description: Optional[str] = None,
+    tone: str = "professional",
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Streaming generate_cover_letter: token events as the model produces them, or the
+    rule-based letter one paragraph at a time, then a done event with the full result.
+    """
+    def fallback():
+        result = _generate_rule_based(resume_data, company_name, job_title, job_description, tone)
+        paragraphs = result["generated_content"].split("\n\n")
+        return [paragraphs[0]] + ["\n\n" + paragraph for paragraph in paragraphs[1:]], result
+
+    prompt = build_cover_letter_prompt(resume_data, company_name, job_title, job_description, tone)
+    async for event in stream_with_fallback(prompt, 1000, _ai_result, fallback):
+        yield event
+
+
+def generate_cover_letter_rule_based(
+    resume_data: Dict[str, Any],
+    company_name: str,
+    job_title: str,
+    job_description: Optional[str] = None,
+    tone: str = "professional",
+) -> Dict[str, Any]:
+    """The rule-based cover letter alone, without calling the model."""
+    return _generate_rule_based(resume_data, company_name, job_title, job_description, tone)
+
+
 def _generate_rule_based(
     resume_data: Dict[str, Any],
     company_name: str,
@@ -0,0 +1,306 @@
+"""
+HuggingFace Inference API client shared by the resume and cover letter generators.
+A long-lived httpx.AsyncClient keeps connections alive (HTTP/2 when the h2 package is
+installed), so generations reuse TLS sessions and a worker can hold many in flight.
+Generations can also be streamed token by token (the endpoint's server-sent events).
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+import weakref
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from app.config import settings
+from app.ai_engine.micro_batch import MicroBatcher
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# HuggingFace Inference API endpoint (free tier, no expiry)
+HF_API_URL = "https://api-inference.huggingface.co/models/mistralai/Mistral-7B-Instruct-v0.2"
+
+
+class InferenceError(Exception):
+    """A streamed generation failed after it started."""
+
+
+def get_hf_headers() -> Optional[Dict[str, str]]:
+    """Get HuggingFace API headers if API key is available."""
+    api_key = os.getenv("HUGGINGFACE_API_KEY", "")
+    if api_key and api_key != "your-huggingface-api-key-here":
+        return {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+    return None
+
+
+def build_payload(prompt: str, max_tokens: int) -> Dict[str, Any]:
+    """Inference request body, with the prompt formatted as a Mistral instruction."""
+    return {
+        "inputs": f"<s>[INST] {prompt} [/INST]",
+        "parameters": {
+            "max_new_tokens": max_tokens,
+            "temperature": 0.7,
+            "top_p": 0.9,
+            "do_sample": True,
+            "return_full_text": False,
+        }
+    }
+
+
+def request_key(url: str, payload: Dict[str, Any]) -> str:
+    """Hash of the model URL and the full request body (formatted prompt and parameters)."""
+    raw = json.dumps([url, payload], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class InferenceClient:
+    """
+    Pooled async client for one model endpoint. Optional hooks, both keyed by request_key:
+    a response cache (async get/put, see app.services.llm_cache) answers repeated prompts,
+    and a single-flight coalescer (async do, see app.services.single_flight) lets identical
+    concurrent requests share one call. An optional circuit breaker (allow/record/timeout,
+    see app.services.circuit_breaker) skips upstream calls while the endpoint is failing
+    and sets their timeout. With batch_size > 1, prompts with the same parameters sent
+    within batch_wait seconds go upstream together as one list of inputs.
+    """
+
+    def __init__(
+        self,
+        url: str = HF_API_URL,
+        timeout: float = 60.0,
+        max_connections: int = 100,
+        http2: bool = True,
+        batch_size: int = 1,
+        batch_wait: float = 0.005,
+    ):
+        self.url = url
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.cache = None
+        self.single_flight = None
+        self.breaker = None
+        self.batcher = MicroBatcher(self._post_batch, batch_size, batch_wait) if batch_size > 1 else None
+        # Connections belong to the event loop that opened them, so each loop (the request
+        # loop, the generation worker's loop) keeps its own pool
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None:
+                client = self._clients[loop] = httpx.AsyncClient(
+                    http2=self.http2,
+                    timeout=httpx.Timeout(self.timeout, connect=10.0),
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_connections,
+                    ),
+                )
+        return client
+
+    async def query(self, prompt: str, max_tokens: int = 1500) -> Optional[str]:
+        """Send a prompt to the inference endpoint and return the generated text (None on failure)."""
+        headers = get_hf_headers()
+        if not headers:
+            return None
+        payload = build_payload(prompt, max_tokens)
+        key = request_key(self.url, payload)
+        if self.cache is not None:
+            cached = await self.cache.get(key)
+            if cached is not None:
+                return cached
+        if self.single_flight is not None:
+            return await self.single_flight.do(key, lambda: self._fetch(key, headers, payload))
+        return await self._fetch(key, headers, payload)
+
+    async def _fetch(self, key: str, headers: Dict[str, str], payload: Dict[str, Any]) -> Optional[str]:
+        breaker = self.breaker
+        if breaker is not None and not breaker.allow():
+            return None
+        text = None
+        start = time.monotonic()
+        try:
+            if self.batcher is not None:
+                group = (tuple(sorted(headers.items())), json.dumps(payload["parameters"], sort_keys=True))
+                text = await self.batcher.submit(group, payload["inputs"])
+            else:
+                response = await self._get_client().post(
+                    self.url, headers=headers, json=payload, timeout=self._timeout(),
+                )
+                result = response.json() if response.status_code == 200 else None
+                if isinstance(result, list) and len(result) > 0:
+                    text = result[0].get("generated_text", "")
+        except Exception:
+            pass
+        finally:
+            if breaker is not None:
+                breaker.record(text is not None, time.monotonic() - start)
+        if text is None:
+            return None
+        if self.cache is not None and text:
+            await self.cache.put(key, text)
+        return text
+
+    async def _post_batch(
+        self, group: Tuple[Tuple[Tuple[str, str], ...], str], inputs: List[str],
+    ) -> List[Optional[str]]:
+        """Post several prompts as one request; a failed request is None for each of them."""
+        headers, parameters = group
+        try:
+            response = await self._get_client().post(
+                self.url, headers=dict(headers), json={"inputs": inputs, "parameters": json.loads(parameters)},
+                timeout=self._timeout(),
+            )
+            result = response.json() if response.status_code == 200 else None
+        except Exception:
+            result = None
+        if not (isinstance(result, list) and len(result) == len(inputs)):
+            return [None] * len(inputs)
+        texts: List[Optional[str]] = []
+        for item in result:
+            # One list of generations per input (or a bare generation)
+            generation = item[0] if isinstance(item, list) and item else item
+            texts.append(generation.get("generated_text", "") if isinstance(generation, dict) else None)
+        return texts
+
+    def _timeout(self) -> httpx.Timeout:
+        timeout = self.breaker.timeout() if self.breaker is not None else self.timeout
+        return httpx.Timeout(timeout, connect=min(timeout, 10.0))
+
+    async def stream(self, prompt: str, max_tokens: int = 1500) -> AsyncIterator[str]:
+        """
+        Yield generated text as the endpoint produces it. Yields nothing when no API key is
+        set or the request is refused; raises InferenceError if the stream breaks off.
+        A cached response is yielded whole; streams are not coalesced by single-flight.
+        """
+        headers = get_hf_headers()
+        if not headers:
+            return
+        payload = build_payload(prompt, max_tokens)
+        key = request_key(self.url, payload)
+        if self.cache is not None:
+            cached = await self.cache.get(key)
+            if cached is not None:
+                yield cached
+                return
+        breaker = self.breaker
+        if breaker is not None and not breaker.allow():
+            return
+        parts: List[str] = []
+        succeeded: Optional[bool] = None  # unknown until the stream ends or fails
+        try:
+            async with self._get_client().stream(
+                "POST", self.url, headers=headers, json={**payload, "stream": True}, timeout=self._timeout(),
+            ) as response:
+                if response.status_code != 200:
+                    succeeded = False
+                    return
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    token = json.loads(line[5:]).get("token") or {}
+                    text = token.get("text")
+                    if text and not token.get("special"):
+                        parts.append(text)
+                        yield text
+            succeeded = True
+        except (httpx.HTTPError, ValueError) as e:
+            succeeded = False
+            raise InferenceError(str(e) or e.__class__.__name__) from e
+        finally:
+            if breaker is not None:
+                if succeeded is None:
+                    # The client stopped reading midway (closed or cancelled), which says nothing about the endpoint
+                    breaker.release()
+                else:
+                    breaker.record(succeeded)
+        if self.cache is not None and parts:
+            await self.cache.put(key, "".join(parts))
+
+    async def aclose(self, all_loops: bool = True) -> None:
+        """
+        Close the running loop's connection pool and, with all_loops, the pools of other
+        loops too (on their own loop while it runs; a stopped loop's pool is dropped).
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if all_loops:
+                clients = list(self._clients.items())
+                self._clients.clear()
+            else:
+                client = self._clients.pop(loop, None)
+                clients = [(loop, client)] if client is not None else []
+        for owner, client in clients:
+            try:
+                if owner is loop:
+                    await client.aclose()
+                elif owner.is_running():
+                    await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(client.aclose(), owner))
+            except RuntimeError:
+                pass  # its event loop closed meanwhile
+
+
+inference_client = InferenceClient(
+    timeout=settings.HF_TIMEOUT_SECONDS,
+    max_connections=settings.HF_MAX_CONNECTIONS,
+    batch_size=settings.HF_BATCH_SIZE,
+    batch_wait=settings.HF_BATCH_WAIT_MS / 1000,
+)
+
+
+async def query_huggingface(prompt: str, max_tokens: int = 1500) -> Optional[str]:
+    """Send a prompt to HuggingFace Inference API and return the response."""
+    return await inference_client.query(prompt, max_tokens)
+
+
+async def stream_huggingface(prompt: str, max_tokens: int = 1500) -> AsyncIterator[str]:
+    """Stream a HuggingFace Inference API generation as text chunks."""
+    async for text in inference_client.stream(prompt, max_tokens):
+        yield text
+
+
+async def stream_with_fallback(
+    prompt: str,
+    max_tokens: int,
+    ai_result: Callable[[str], Dict[str, Any]],
+    fallback: Callable[[], Tuple[List[str], Dict[str, Any]]],
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream a generation as events: {"event": "token", "text"} for each chunk, then
+    {"event": "done", "result"} with the same result the non-streaming generator returns.
+    If the model yields nothing the rule-based chunks from fallback() are streamed instead;
+    if it breaks off midway a {"event": "reset"} tells the client to discard what it got.
+    """
+    parts: List[str] = []
+    try:
+        async for text in stream_huggingface(prompt, max_tokens):
+            parts.append(text)
+            yield {"event": "token", "text": text}
+    except InferenceError as e:
+        print(f"Streamed generation failed, falling back to rule-based: {e}")
+        if parts:
+            yield {"event": "reset"}
+        parts = []
+    content = "".join(parts).strip()
+    if content:
+        yield {"event": "done", "result": ai_result(content)}
+        return
+    if parts:
+        yield {"event": "reset"}  # only whitespace came through
+    chunks, result = fallback()
+    for text in chunks:
+        yield {"event": "token", "text": text}
+    yield {"event": "done", "result": result}
@@ -0,0 +1,101 @@
+"""
+Inverted index with top-K retrieval.
+Posting lists map term ids to precomputed document weights (normalized TF-IDF),
+so a query only touches the postings of its own terms. Top-K search uses
+max-score pruning: once the remaining terms' upper bounds cannot lift a new
+document into the top K, only already-seen candidates are scored.
+"""
+
+import heapq
+import math
+import threading
+from typing import Dict, List, Tuple, Hashable
+
+
+def normalize_weights(weights: Dict[str, float]) -> Dict[str, float]:
+    """Scale a term-weight vector to unit length (dot products become cosine similarities)."""
+    norm = math.sqrt(sum(w * w for w in weights.values()))
+    if not norm:
+        return {}
+    return {term: w / norm for term, w in weights.items() if w}
+
+
+class InvertedIndex:
+    """Thread-safe, incrementally updatable inverted index over weighted term vectors."""
+
+    def __init__(self):
+        self.term_ids: Dict[str, int] = {}
+        self.postings: Dict[int, Dict[Hashable, float]] = {}  # term id -> {doc id: weight}
+        self.max_weight: Dict[int, float] = {}                # term id -> upper bound of its weights
+        self.doc_terms: Dict[Hashable, List[int]] = {}        # doc id -> term ids (for removal)
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self.doc_terms)
+
+    def __contains__(self, doc_id: Hashable) -> bool:
+        return doc_id in self.doc_terms
+
+    def add(self, doc_id: Hashable, weights: Dict[str, float]) -> None:
+        """Index (or re-index) a document from its unit-length term weights."""
+        with self._lock:
+            if doc_id in self.doc_terms:
+                self.remove(doc_id)
+            term_list = []
+            for term, weight in weights.items():
+                term_id = self.term_ids.setdefault(term, len(self.term_ids))
+                self.postings.setdefault(term_id, {})[doc_id] = weight
+                if weight > self.max_weight.get(term_id, 0.0):
+                    self.max_weight[term_id] = weight
+                term_list.append(term_id)
+            self.doc_terms[doc_id] = term_list
+
+    def remove(self, doc_id: Hashable) -> None:
+        """Drop a document. Upper bounds are left as-is; they stay valid, only looser."""
+        with self._lock:
+            for term_id in self.doc_terms.pop(doc_id, ()):
+                posting = self.postings.get(term_id)
+                if posting is not None:
+                    posting.pop(doc_id, None)
+                    if not posting:
+                        del self.postings[term_id]
+                        self.max_weight.pop(term_id, None)
+
+    def search(self, query: Dict[str, float], k: int = 10) -> List[Tuple[Hashable, float]]:
+        """
+        Return the top-k (doc id, score) pairs for a weighted query, best first.
+        Scores are dot products, i.e. cosine similarities for unit-length vectors.
+        """
+        if k <= 0:
+            return []
+        with self._lock:
+            terms = []
+            for term, q_weight in query.items():
+                term_id = self.term_ids.get(term)
+                if term_id is None or term_id not in self.postings or q_weight <= 0:
+                    continue
+                terms.append((q_weight * self.max_weight[term_id], q_weight, self.postings[term_id]))
+            # Highest-impact terms first, so the threshold rises as early as possible
+            terms.sort(key=lambda t: t[0], reverse=True)
+
+            remaining = sum(t[0] for t in terms)
+            scores: Dict[Hashable, float] = {}
+            threshold = 0.0
+            for upper_bound, q_weight, posting in terms:
+                remaining = max(0.0, remaining - upper_bound)  # guard against float drift
+                if len(scores) >= k and upper_bound + remaining <= threshold:
+                    # Max-score: documents not seen yet cannot reach the top k any more
+                    for doc_id in scores:
+                        weight = posting.get(doc_id)
+                        if weight is not None:
+                            scores[doc_id] += q_weight * weight
+                else:
+                    for doc_id, weight in posting.items():
+                        scores[doc_id] = scores.get(doc_id, 0.0) + q_weight * weight
+                if len(scores) >= k:
+                    threshold = heapq.nlargest(k, scores.values())[-1]
+                    # Drop candidates that cannot catch up with the current k-th score
+                    if remaining < threshold:
+                        scores = {d: s for d, s in scores.items() if s + remaining >= threshold}
+
+        return heapq.nlargest(k, scores.items(), key=lambda item: item[1])
@@ -0,0 +1,77 @@
+"""
+Micro-batching of concurrent requests.
+Items submitted within a short window that share a group key are handed to one send call
+as a list, and each caller gets its own element of the result. Used by the inference
+client to post many prompts with the same generation parameters as one batched request.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Set, Tuple
+
+Batch = List[Tuple[Any, asyncio.Future]]
+
+
+class MicroBatcher:
+    """
+    Collects items for up to max_wait seconds or max_size items per group, then calls
+    send(group, items), which returns one result per item in order.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[Hashable, List[Any]], Awaitable[List[Any]]],
+        max_size: int = 8,
+        max_wait: float = 0.005,
+    ):
+        self.send = send
+        self.max_size = max_size
+        self.max_wait = max_wait
+        self.batches = 0
+        self.items = 0
+        self._pending: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], Batch] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit(self, group: Hashable, item: Any) -> Any:
+        """Add an item to the open batch for its group and wait for its result."""
+        loop = asyncio.get_running_loop()
+        key = (loop, group)
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = []
+            loop.call_later(self.max_wait, self._flush, key, batch)
+        future = loop.create_future()
+        batch.append((item, future))
+        if len(batch) >= self.max_size:
+            self._flush(key, batch)
+        return await future
+
+    def _flush(self, key: Tuple[asyncio.AbstractEventLoop, Hashable], batch: Batch) -> None:
+        if self._pending.get(key) is not batch:
+            return  # already sent when it filled up
+        del self._pending[key]
+        task = key[0].create_task(self._send(key[1], batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, group: Hashable, batch: Batch) -> None:
+        self.batches += 1
+        self.items += len(batch)
+        try:
+            results = await self.send(group, [item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(f"Batch of {len(batch)} items returned {len(results)} results")
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():  # the caller may have given up
+                future.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "mean_batch_size": round(self.items / self.batches, 2) if self.batches else 0.0,
+        }
@@ -0,0 +1,120 @@
+"""
+MinHash signatures and LSH banding for near-duplicate text detection.
+Texts are compared as sets of word shingles; two signatures agree on a position with
+probability equal to the Jaccard similarity of the shingle sets, and banding the
+signature into an LSH table finds likely near-duplicates without a full scan.
+"""
+
+import operator
+import random
+import zlib
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Universal hashing (a * x + b) mod p over 32-bit shingle hashes. With a, b < 2**32 the
+# product stays below 2**64, so the NumPy path can use uint64 without overflow.
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+
+Signature = Tuple[int, ...]
+
+
+def shingles(tokens: List[str], size: int = 3) -> Set[str]:
+    """Overlapping word n-grams of a token list (the whole list if it is shorter than size)."""
+    if len(tokens) <= size:
+        return {" ".join(tokens)} if tokens else set()
+    return {" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+
+class MinHasher:
+    """Computes fixed-length MinHash signatures; identical seeds give comparable signatures."""
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.a = [rng.randint(1, MAX_HASH) for _ in range(num_perm)]
+        self.b = [rng.randint(0, MAX_HASH) for _ in range(num_perm)]
+        if NUMPY_AVAILABLE:
+            self._a = np.array(self.a, dtype=np.uint64)[:, None]
+            self._b = np.array(self.b, dtype=np.uint64)[:, None]
+
+    def signature(self, shingle_set: Iterable[str]) -> Signature:
+        hashes = [zlib.crc32(s.encode("utf-8")) for s in shingle_set]
+        if not hashes:
+            return (MAX_HASH,) * self.num_perm
+        if NUMPY_AVAILABLE:
+            x = np.array(hashes, dtype=np.uint64)
+            values = ((self._a * x + self._b) % MERSENNE_PRIME) & MAX_HASH
+            return tuple(int(v) for v in values.min(axis=1))
+        return tuple(
+            min(((a * x + b) % MERSENNE_PRIME) & MAX_HASH for x in hashes)
+            for a, b in zip(self.a, self.b)
+        )
+
+
+def estimate_jaccard(a: Signature, b: Signature) -> float:
+    """Fraction of agreeing signature positions: an unbiased Jaccard estimate."""
+    if not a:
+        return 0.0
+    return sum(map(operator.eq, a, b)) / len(a)
+
+
+class LSHIndex:
+    """
+    Banded LSH table over MinHash signatures (bands * rows must equal the signature length).
+    Keys sharing any band bucket with a query are candidates; candidates are then
+    verified against the full signature.
+    """
+
+    def __init__(self, bands: int = 8, rows: int = 8):
+        self.bands = bands
+        self.rows = rows
+        self._buckets: List[Dict[Signature, Set[Hashable]]] = [{} for _ in range(bands)]
+        self._signatures: Dict[Hashable, Signature] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _band_keys(self, signature: Signature):
+        rows = self.rows
+        for band in range(self.bands):
+            yield band, signature[band * rows:(band + 1) * rows]
+
+    def add(self, key: Hashable, signature: Signature) -> None:
+        self.remove(key)
+        self._signatures[key] = signature
+        for band, band_key in self._band_keys(signature):
+            self._buckets[band].setdefault(band_key, set()).add(key)
+
+    def remove(self, key: Hashable) -> None:
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for band, band_key in self._band_keys(signature):
+            bucket = self._buckets[band].get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band][band_key]
+
+    def candidates(self, signature: Signature) -> Set[Hashable]:
+        found: Set[Hashable] = set()
+        for band, band_key in self._band_keys(signature):
+            bucket = self._buckets[band].get(band_key)
+            if bucket:
+                found |= bucket
+        return found
+
+    def nearest(self, signature: Signature, threshold: float) -> Optional[Tuple[Hashable, float]]:
+        """Most similar indexed key with estimated Jaccard >= threshold, or None."""
+        best = None
+        for key in self.candidates(signature):
+            similarity = estimate_jaccard(signature, self._signatures[key])
+            if similarity >= threshold and (best is None or similarity > best[1]):
+                best = (key, similarity)
+        return best
@@ -0,0 +1,109 @@
+"""
+Compressed prefix trie (radix tree) for autocomplete.
+Every node stores its top-K completions, precomputed when the trie is built, so a lookup
+only walks the query's characters and returns a ready-made list.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# (key, value, score): key is the searchable text, value what a completion returns
+Entry = Tuple[str, str, float]
+
+
+class _Node:
+    __slots__ = ("edges", "entries", "top")
+
+    def __init__(self):
+        self.edges: Dict[str, Tuple[str, "_Node"]] = {}  # first char -> (edge label, child)
+        self.entries: List[Tuple[str, float]] = []  # values whose key ends here
+        self.top: List[Tuple[str, float]] = []
+
+
+class PrefixTrie:
+    """Immutable radix tree over (key, value, score) entries; build a new one to update."""
+
+    def __init__(self, entries: Iterable[Entry], top_k: int = 10):
+        self.top_k = top_k
+        self._root = _Node()
+        self.size = 0
+        for key, value, score in entries:
+            if key:
+                self._insert(key, value, score)
+                self.size += 1
+        self._finalize(self._root)
+
+    def _insert(self, key: str, value: str, score: float) -> None:
+        node = self._root
+        while True:
+            if not key:
+                node.entries.append((value, score))
+                return
+            edge = node.edges.get(key[0])
+            if edge is None:
+                leaf = _Node()
+                leaf.entries.append((value, score))
+                node.edges[key[0]] = (key, leaf)
+                return
+            label, child = edge
+            common = _common_prefix_length(label, key)
+            if common < len(label):
+                # Split the edge at the point where the key diverges
+                middle = _Node()
+                middle.edges[label[common]] = (label[common:], child)
+                node.edges[key[0]] = (label[:common], middle)
+                child = middle
+            node, key = child, key[common:]
+
+    def _finalize(self, root: _Node) -> None:
+        """Fill every node's top-K list bottom-up (iteratively, so deep keys cannot overflow the stack)."""
+        order = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(child for _, child in node.edges.values())
+        for node in reversed(order):
+            candidates = list(node.entries)
+            for _, child in node.edges.values():
+                candidates.extend(child.top)
+            node.top = _best(candidates, self.top_k)
+
+    def complete(self, prefix: str, limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """Best (value, score) completions of a prefix, highest score first."""
+        node = self._root
+        rest = prefix
+        while rest:
+            edge = node.edges.get(rest[0])
+            if edge is None:
+                return []
+            label, child = edge
+            if rest.startswith(label):
+                rest = rest[len(label):]
+                node = child
+            elif label.startswith(rest):
+                node, rest = child, ""
+            else:
+                return []
+        return node.top[:limit or self.top_k]
+
+
+def _common_prefix_length(a: str, b: str) -> int:
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+
+def _best(candidates: List[Tuple[str, float]], k: int) -> List[Tuple[str, float]]:
+    """Top k by score (shorter, then alphabetical values first on ties), one entry per value."""
+    candidates.sort(key=lambda c: (-c[1], len(c[0]), c[0]))
+    seen = set()
+    best = []
+    for value, score in candidates:
+        if value not in seen:
+            seen.add(value)
+            best.append((value, score))
+            if len(best) == k:
+                break
+    return best
@@ -4,13 +4,9 @@ Uses HuggingFace Inference API (FREE) with fallback to rule-based generation.
 Generates ATS-friendly resumes with optimized keywords and action verbs.
 """
 
-import os
-import json
-import requests
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, AsyncIterator
 
-# HuggingFace Inference API endpoint (free tier, no expiry)
-HF_API_URL = "https://api-inference.huggingface.co/models/mistralai/Mistral-7B-Instruct-v0.2"
+from app.ai_engine.inference_client import query_huggingface, stream_with_fallback
 
 # Professional action verbs for resume bullet points
 ACTION_VERBS = {
@@ -28,45 +24,6 @@ ACTION_VERBS = {
 }
 
 
-def get_hf_headers() -> Optional[Dict[str, str]]:
-    """Get HuggingFace API headers if API key is available."""
-    api_key = os.getenv("HUGGINGFACE_API_KEY", "")
-    if api_key and api_key != "your-huggingface-api-key-here":
-        return {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
-    return None
-
-
-def query_huggingface(prompt: str, max_tokens: int = 1500) -> Optional[str]:
-    """Send a prompt to HuggingFace Inference API and return the response."""
-    headers = get_hf_headers()
-    if not headers:
-        return None
-
-    # Format as instruction for Mistral
-    formatted_prompt = f"<s>[INST] {prompt} [/INST]"
-
-    payload = {
-        "inputs": formatted_prompt,
-        "parameters": {
-            "max_new_tokens": max_tokens,
-            "temperature": 0.7,
-            "top_p": 0.9,
-            "do_sample": True,
-            "return_full_text": False,
-        }
-    }
-
-    try:
-        response = requests.post(HF_API_URL, headers=headers, json=payload, timeout=60)
-        if response.status_code == 200:
-            result = response.json()
-            if isinstance(result, list) and len(result) > 0:
-                return result[0].get("generated_text", "")
-        return None
-    except Exception:
-        return None
-
-
 def enhance_bullet_point(bullet: str) -> str:
     """Enhance a bullet point with action verbs and professional language."""
     bullet = bullet.strip()
@@ -90,10 +47,8 @@ def enhance_bullet_point(bullet: str) -> str:
     return bullet
 
 
-def generate_resume_with_ai(resume_data: Dict[str, Any], job_description: Optional[str] = None) -> Dict[str, Any]:
-    """
-    Generate an ATS-friendly resume using HuggingFace AI or rule-based approach.
-    """
+def build_resume_prompt(resume_data: Dict[str, Any], job_description: Optional[str] = None) -> str:
+    """Instruction prompt for generating a resume from the user's resume data."""
     personal = resume_data.get("personal_info", {})
     name = personal.get("name", "Candidate") if isinstance(personal, dict) else "Candidate"
 
@@ -120,23 +75,70 @@ Requirements:
 4. Use professional formatting with clear sections
 5. Sections: PROFESSIONAL SUMMARY, EDUCATION, SKILLS, EXPERIENCE, PROJECTS, CERTIFICATIONS, ACHIEVEMENTS
 """
+    return prompt
+
+
+def _ai_result(content: str) -> Dict[str, Any]:
+    return {
+        "success": True,
+        "generated_content": content,
+        "method": "huggingface",
+        "keywords_optimized": True,
+    }
+
 
+async def generate_resume_with_ai(resume_data: Dict[str, Any], job_description: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Generate an ATS-friendly resume using HuggingFace AI or rule-based approach.
+    """
     # Try HuggingFace API first
-    ai_result = query_huggingface(prompt)
+    ai_result = await query_huggingface(build_resume_prompt(resume_data, job_description))
     if ai_result:
-        return {
-            "success": True,
-            "generated_content": ai_result.strip(),
-            "method": "huggingface",
-            "keywords_optimized": True,
-        }
+        return _ai_result(ai_result.strip())
 
     # Fallback to rule-based
     return _generate_rule_based(resume_data, job_description)
 
 
+async def stream_resume_with_ai(
+    resume_data: Dict[str, Any], job_description: Optional[str] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Streaming generate_resume_with_ai: token events as the model produces them, or the
+    rule-based resume one section at a time, then a done event with the full result.
+    """
+    def fallback():
+        sections = _rule_based_sections(resume_data)
+        chunks = [sections[0]] + ["\n" + section for section in sections[1:]]
+        return chunks, _rule_based_result("\n".join(sections), job_description)
+
+    async for event in stream_with_fallback(
+        build_resume_prompt(resume_data, job_description), 1500, _ai_result, fallback,
+    ):
+        yield event
+
+
+def generate_resume_rule_based(resume_data: Dict[str, Any], job_description: Optional[str] = None) -> Dict[str, Any]:
+    """The rule-based resume alone, without calling the model."""
+    return _generate_rule_based(resume_data, job_description)
+
+
 def _generate_rule_based(resume_data: Dict[str, Any], job_description: Optional[str]) -> Dict[str, Any]:
     """Generate resume content using rule-based approach."""
+    return _rule_based_result("\n".join(_rule_based_sections(resume_data)), job_description)
+
+
+def _rule_based_result(content: str, job_description: Optional[str]) -> Dict[str, Any]:
+    return {
+        "success": True,
+        "generated_content": content,
+        "method": "rule_based",
+        "keywords_optimized": job_description is not None,
+    }
+
+
+def _rule_based_sections(resume_data: Dict[str, Any]) -> List[str]:
+    """Rule-based resume as a list of sections (header first), each a block of lines."""
     personal = resume_data.get("personal_info", {})
     if not isinstance(personal, dict):
         personal = {}
@@ -147,12 +149,13 @@ def _generate_rule_based(resume_data: Dict[str, Any], job_description: Optional[
     github = personal.get("github", "")
     location = personal.get("location", "")
 
-    lines = []
-    lines.append(f"{'=' * 60}")
+    sections = []
+    lines = [f"{'=' * 60}"]
     lines.append(f"{name.upper()}")
     contact_parts = [p for p in [email, phone, location, linkedin, github] if p]
     lines.append(" | ".join(contact_parts))
     lines.append(f"{'=' * 60}")
+    sections.append(lines)
 
     # Professional Summary
     target_role = resume_data.get("target_job_role", "Software Professional")
@@ -162,59 +165,58 @@ def _generate_rule_based(resume_data: Dict[str, Any], job_description: Optional[
             skills_flat.extend(skill_group.get("items", []))
     top_skills = ", ".join(skills_flat[:5]) if skills_flat else "various technologies"
 
-    lines.append(f"\nPROFESSIONAL SUMMARY")
-    lines.append("-" * 40)
+    lines = [f"\nPROFESSIONAL SUMMARY", "-" * 40]
     lines.append(f"Results-driven {target_role} with expertise in {top_skills}. "
                  f"Proven track record of delivering high-quality solutions and contributing to team success. "
                  f"Seeking opportunities to leverage technical skills and drive innovation.")
+    sections.append(lines)
 
     # Education
     education = resume_data.get("education") or []
     if education:
-        lines.append(f"\nEDUCATION")
-        lines.append("-" * 40)
+        lines = [f"\nEDUCATION", "-" * 40]
         for edu in education:
             if isinstance(edu, dict):
                 lines.append(f"  {edu.get('degree', '')} — {edu.get('institution', '')} ({edu.get('year', '')})")
                 if edu.get("gpa"):
                     lines.append(f"  GPA: {edu['gpa']}")
+        sections.append(lines)
 
     # Skills
     skills = resume_data.get("skills") or []
     if skills:
-        lines.append(f"\nTECHNICAL SKILLS")
-        lines.append("-" * 40)
+        lines = [f"\nTECHNICAL SKILLS", "-" * 40]
         for sg in skills:
             if isinstance(sg, dict):
                 lines.append(f"  {sg.get('category', 'General')}: {', '.join(sg.get('items', []))}")
+        sections.append(lines)
 
     # Experience
     experience = resume_data.get("experience") or []
     if experience:
-        lines.append(f"\nPROFESSIONAL EXPERIENCE")
-        lines.append("-" * 40)
+        lines = [f"\nPROFESSIONAL EXPERIENCE", "-" * 40]
         for exp in experience:
             if isinstance(exp, dict):
                 lines.append(f"  {exp.get('role', '')} — {exp.get('company', '')} ({exp.get('duration', '')})")
                 for bullet in (exp.get("bullets") or []):
                     lines.append(f"    • {enhance_bullet_point(bullet)}")
+        sections.append(lines)
 
     # Internships
     internships = resume_data.get("internships") or []
     if internships:
-        lines.append(f"\nINTERNSHIPS")
-        lines.append("-" * 40)
+        lines = [f"\nINTERNSHIPS", "-" * 40]
         for intern in internships:
             if isinstance(intern, dict):
                 lines.append(f"  {intern.get('role', '')} — {intern.get('company', '')} ({intern.get('duration', '')})")
                 if intern.get("description"):
                     lines.append(f"    • {enhance_bullet_point(intern['description'])}")
+        sections.append(lines)
 
     # Projects
     projects = resume_data.get("projects") or []
     if projects:
-        lines.append(f"\nPROJECTS")
-        lines.append("-" * 40)
+        lines = [f"\nPROJECTS", "-" * 40]
         for proj in projects:
             if isinstance(proj, dict):
                 lines.append(f"  {proj.get('name', '')}")
@@ -223,28 +225,24 @@ def _generate_rule_based(resume_data: Dict[str, Any], job_description: Optional[
                 techs = proj.get("technologies", [])
                 if techs:
                     lines.append(f"    Technologies: {', '.join(techs)}")
+        sections.append(lines)
 
     # Certifications
     certs = resume_data.get("certifications") or []
     if certs:
-        lines.append(f"\nCERTIFICATIONS")
-        lines.append("-" * 40)
+        lines = [f"\nCERTIFICATIONS", "-" * 40]
         for cert in certs:
             if isinstance(cert, dict):
                 lines.append(f"  • {cert.get('name', '')} — {cert.get('issuer', '')} ({cert.get('date', '')})")
+        sections.append(lines)
 
     # Achievements
     achievements = resume_data.get("achievements") or []
     if achievements:
-        lines.append(f"\nACHIEVEMENTS")
-        lines.append("-" * 40)
+        lines = [f"\nACHIEVEMENTS", "-" * 40]
         for ach in achievements:
             if isinstance(ach, dict):
                 lines.append(f"  • {ach.get('title', '')} — {ach.get('description', '')}")
+        sections.append(lines)
 
-    return {
-        "success": True,
-        "generated_content": "\n".join(lines),
-        "method": "rule_based",
-        "keywords_optimized": job_description is not None,
-    }
+    return ["\n".join(lines) for lines in sections]
@@ -6,30 +6,40 @@ Provides percentage score, missing keywords, and improvement suggestions.
 
 import re
 import math
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Iterable, Callable
 from collections import Counter
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+# Common stop words excluded from scoring
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'is', 'are', 'was', 'were', 'be', 'been',
+    'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'could', 'should', 'may', 'might', 'shall', 'can', 'this', 'that',
+    'these', 'those', 'i', 'me', 'my', 'we', 'our', 'you', 'your', 'he',
+    'she', 'it', 'they', 'them', 'their', 'what', 'which', 'who', 'whom',
+    'not', 'no', 'nor', 'as', 'if', 'then', 'else', 'when', 'up', 'out',
+    'about', 'into', 'over', 'after', 'before', 'between', 'under',
+    'again', 'further', 'than', 'once', 'here', 'there', 'all', 'each',
+    'every', 'both', 'few', 'more', 'most', 'other', 'some', 'such',
+    'only', 'own', 'same', 'so', 'very', 'just', 'because', 'also',
+})
+
+SCORED_SECTIONS = ["education", "skills", "projects", "experience", "internships", "certifications", "achievements"]
+
+_NON_WORD_RE = re.compile(r'[^a-zA-Z0-9\s\+\#]')
+
 
 def tokenize(text: str) -> List[str]:
     """Tokenize text into lowercase words, removing punctuation."""
-    text = text.lower()
-    text = re.sub(r'[^a-zA-Z0-9\s\+\#]', ' ', text)
-    words = text.split()
-    # Remove common stop words
-    stop_words = {
-        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-        'of', 'with', 'by', 'from', 'is', 'are', 'was', 'were', 'be', 'been',
-        'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-        'could', 'should', 'may', 'might', 'shall', 'can', 'this', 'that',
-        'these', 'those', 'i', 'me', 'my', 'we', 'our', 'you', 'your', 'he',
-        'she', 'it', 'they', 'them', 'their', 'what', 'which', 'who', 'whom',
-        'not', 'no', 'nor', 'as', 'if', 'then', 'else', 'when', 'up', 'out',
-        'about', 'into', 'over', 'after', 'before', 'between', 'under',
-        'again', 'further', 'than', 'once', 'here', 'there', 'all', 'each',
-        'every', 'both', 'few', 'more', 'most', 'other', 'some', 'such',
-        'only', 'own', 'same', 'so', 'very', 'just', 'because', 'also',
-    }
-    return [w for w in words if w not in stop_words and len(w) > 1]
+    text = _NON_WORD_RE.sub(' ', text.lower())
+    return [w for w in text.split() if w not in STOP_WORDS and len(w) > 1]
 
 
 def compute_tf(tokens: List[str]) -> Dict[str, float]:
@@ -51,6 +61,14 @@ def compute_idf(doc1_tokens: List[str], doc2_tokens: List[str]) -> Dict[str, flo
     return idf
 
 
+def corpus_idf(doc_freq: Dict[str, int], n_docs: int, terms: Iterable[str]) -> Dict[str, float]:
+    """
+    Look up IDF weights for the given terms from corpus-wide document frequencies.
+    Uses the same smoothing as compute_idf; unseen terms get the maximum weight.
+    """
+    return {term: math.log((n_docs + 1) / (doc_freq.get(term, 0) + 1)) + 1 for term in terms}
+
+
 def cosine_similarity(vec1: Dict[str, float], vec2: Dict[str, float]) -> float:
     """Compute cosine similarity between two TF-IDF vectors."""
     all_terms = set(vec1.keys()) | set(vec2.keys())
@@ -60,15 +78,15 @@ def cosine_similarity(vec1: Dict[str, float], vec2: Dict[str, float]) -> float:
     return dot_product / (mag1 * mag2)
 
 
-def extract_resume_text(resume_data: Dict[str, Any]) -> str:
-    """Extract all text from resume data into a single string."""
-    parts = []
+def extract_section_texts(resume_data: Dict[str, Any]) -> Dict[str, str]:
+    """Extract the scored text of each resume section, in document order."""
+    texts = {}
 
     personal = resume_data.get("personal_info", {})
-    if isinstance(personal, dict):
-        parts.append(personal.get("name", ""))
+    texts["personal_info"] = (personal.get("name", "") or "") if isinstance(personal, dict) else ""
 
-    for section in ["education", "skills", "projects", "experience", "internships", "certifications", "achievements"]:
+    for section in SCORED_SECTIONS:
+        parts = []
         items = resume_data.get(section) or []
         for item in items:
             if isinstance(item, dict):
@@ -77,65 +95,81 @@ def extract_resume_text(resume_data: Dict[str, Any]) -> str:
                         parts.append(value)
                     elif isinstance(value, list):
                         parts.extend([str(v) for v in value])
+        texts[section] = " ".join(parts)
 
-    if resume_data.get("target_job_role"):
-        parts.append(resume_data["target_job_role"])
-    if resume_data.get("generated_content"):
-        parts.append(resume_data["generated_content"])
+    texts["target_job_role"] = resume_data.get("target_job_role") or ""
+    texts["generated_content"] = resume_data.get("generated_content") or ""
+    return texts
 
-    return " ".join(parts)
 
+def extract_resume_text(resume_data: Dict[str, Any]) -> str:
+    """Extract all text from resume data into a single string."""
+    return " ".join(extract_section_texts(resume_data).values())
 
-def analyze_resume_score(
+
+def section_term_counts(text: str) -> Dict[str, int]:
+    """Raw term counts of one section; section counts add up to the whole-resume counts."""
+    return dict(Counter(tokenize(text)))
+
+
+IdfLookup = Callable[[Iterable[str]], Dict[str, float]]
+
+SCORING_MODES = ("tfidf", "bm25")
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+
+def build_resume_profile(
     resume_data: Dict[str, Any],
-    job_description: str,
+    term_counts: Optional[Dict[str, int]] = None,
 ) -> Dict[str, Any]:
     """
-    Analyze resume against job description using TF-IDF cosine similarity.
-    Returns overall score, missing keywords, and suggestions.
+    Tokenize a resume once and precompute everything that does not depend on the job description.
+    The profile can be reused to score the same resume against many job descriptions.
+    term_counts (e.g. merged cached section vectors) skips tokenizing the resume text.
     """
-    resume_text = extract_resume_text(resume_data)
-    resume_tokens = tokenize(resume_text)
-    jd_tokens = tokenize(job_description)
+    if term_counts is None:
+        term_counts = section_term_counts(extract_resume_text(resume_data))
+    token_count = sum(term_counts.values())
 
-    if not resume_tokens or not jd_tokens:
-        return {
-            "overall_score": 0.0,
-            "keyword_match_score": 0.0,
-            "format_score": 50.0,
-            "content_score": 0.0,
-            "missing_keywords": [],
-            "suggestions": ["Please provide more details in your resume."],
-            "detailed_analysis": "Insufficient data to analyze.",
-        }
+    # Format score (based on resume completeness)
+    sections_present = sum(1 for section in SCORED_SECTIONS if resume_data.get(section))
+    format_score = round((sections_present / len(SCORED_SECTIONS)) * 100, 1)
 
-    # Compute TF-IDF vectors
-    idf = compute_idf(resume_tokens, jd_tokens)
-    resume_tf = compute_tf(resume_tokens)
-    jd_tf = compute_tf(jd_tokens)
+    # Content score (based on detail level)
+    content_score = min(100, round(token_count / 2, 1))
 
-    resume_tfidf = {word: tf * idf.get(word, 1) for word, tf in resume_tf.items()}
-    jd_tfidf = {word: tf * idf.get(word, 1) for word, tf in jd_tf.items()}
+    return {
+        "tf": {word: count / token_count for word, count in term_counts.items() if count > 0},
+        "token_count": token_count,
+        "format_score": format_score,
+        "content_score": content_score,
+        "has_experience": bool(resume_data.get("experience") or resume_data.get("internships")),
+    }
 
-    # Cosine similarity score
-    similarity = cosine_similarity(resume_tfidf, jd_tfidf)
+
+def _empty_result() -> Dict[str, Any]:
+    return {
+        "overall_score": 0.0,
+        "keyword_match_score": 0.0,
+        "format_score": 50.0,
+        "content_score": 0.0,
+        "missing_keywords": [],
+        "suggestions": ["Please provide more details in your resume."],
+        "detailed_analysis": "Insufficient data to analyze.",
+    }
+
+
+def _build_result(profile: Dict[str, Any], jd_tf: Dict[str, float], similarity: float) -> Dict[str, Any]:
+    """Turn a keyword similarity into the full score report for one resume/JD pair."""
     keyword_score = round(similarity * 100, 1)
+    format_score = profile["format_score"]
+    content_score = profile["content_score"]
 
     # Find missing keywords (important JD terms not in resume)
     jd_important = sorted(jd_tf.items(), key=lambda x: x[1], reverse=True)[:30]
-    resume_word_set = set(resume_tokens)
-    missing_keywords = [word for word, _ in jd_important if word not in resume_word_set][:15]
-
-    # Format score (based on resume completeness)
-    sections_present = 0
-    total_sections = 7
-    for section in ["education", "skills", "projects", "experience", "internships", "certifications", "achievements"]:
-        if resume_data.get(section):
-            sections_present += 1
-    format_score = round((sections_present / total_sections) * 100, 1)
-
-    # Content score (based on detail level)
-    content_score = min(100, round(len(resume_tokens) / 2, 1))
+    resume_tf = profile["tf"]
+    missing_keywords = [word for word, _ in jd_important if word not in resume_tf][:15]
 
     # Overall weighted score
     overall_score = round(
@@ -156,7 +190,7 @@ def analyze_resume_score(
         suggestions.append("Add more sections to your resume (projects, certifications, achievements).")
     if content_score < 50:
         suggestions.append("Add more detail and bullet points to your experience and projects.")
-    if not resume_data.get("experience") and not resume_data.get("internships"):
+    if not profile["has_experience"]:
         suggestions.append("Add work experience or internships to strengthen your resume.")
     if not suggestions:
         suggestions.append("Great resume! Consider tailoring it further for each specific job application.")
@@ -183,3 +217,207 @@ Suggestions:
         "suggestions": suggestions,
         "detailed_analysis": detailed_analysis,
     }
+
+
+def bm25_similarity(
+    profile: Dict[str, Any],
+    jd_terms: Iterable[str],
+    idf: Dict[str, float],
+    avg_doc_length: Optional[float] = None,
+    k1: float = BM25_K1,
+    b: float = BM25_B,
+) -> float:
+    """
+    BM25 score of a resume (the document) for the JD's unique terms (the query), scaled to 0..1.
+    A JD term found once in an average-length resume contributes its full IDF, so 1.0 means
+    every JD term is covered at least that well. Cost is O(unique JD terms).
+    """
+    resume_tf = profile["tf"]
+    doc_length = profile["token_count"]
+    length_norm = k1 * (1 - b + b * doc_length / (avg_doc_length or doc_length or 1))
+
+    score = 0.0
+    max_score = 0.0
+    for term in jd_terms:
+        weight = idf.get(term, 1.0)
+        max_score += weight
+        tf = resume_tf.get(term)
+        if tf:
+            count = tf * doc_length
+            score += weight * count * (k1 + 1) / (count + length_norm)
+    return min(1.0, score / max_score) if max_score else 0.0
+
+
+def analyze_resume_score(
+    resume_data: Dict[str, Any],
+    job_description: str,
+    idf_lookup: Optional[IdfLookup] = None,
+    profile: Optional[Dict[str, Any]] = None,
+    mode: str = "tfidf",
+    avg_doc_length: Optional[float] = None,
+    jd_tf: Optional[Dict[str, float]] = None,
+) -> Dict[str, Any]:
+    """
+    Analyze resume against job description using TF-IDF cosine similarity
+    (mode="tfidf") or BM25 (mode="bm25").
+    Returns overall score, missing keywords, and suggestions.
+
+    idf_lookup maps a set of terms to their IDF weights (see app.services.corpus);
+    for BM25 it must return BM25 IDF weights. Without it, TF-IDF falls back to the
+    two-document resume/JD estimate and BM25 weighs all terms equally.
+    avg_doc_length is the corpus average token count used by BM25 length normalization.
+    A precomputed profile from build_resume_profile skips re-tokenizing the resume, and
+    a precomputed jd_tf (compute_tf of the JD tokens) skips re-tokenizing the JD.
+    """
+    if mode not in SCORING_MODES:
+        raise ValueError(f"Unknown scoring mode: {mode}")
+    if profile is None:
+        profile = build_resume_profile(resume_data)
+    resume_tf = profile["tf"]
+    if jd_tf is None:
+        jd_tf = compute_tf(tokenize(job_description))
+
+    if not resume_tf or not jd_tf:
+        return _empty_result()
+
+    if mode == "bm25":
+        idf = idf_lookup(jd_tf.keys()) if idf_lookup is not None else {}
+        return _build_result(profile, jd_tf, bm25_similarity(profile, jd_tf.keys(), idf, avg_doc_length))
+
+    # Compute TF-IDF vectors
+    if idf_lookup is not None:
+        idf = idf_lookup(resume_tf.keys() | jd_tf.keys())
+    else:
+        idf = compute_idf(list(resume_tf), list(jd_tf))
+
+    resume_tfidf = {word: tf * idf.get(word, 1) for word, tf in resume_tf.items()}
+    jd_tfidf = {word: tf * idf.get(word, 1) for word, tf in jd_tf.items()}
+
+    # Cosine similarity score
+    similarity = cosine_similarity(resume_tfidf, jd_tfidf)
+    return _build_result(profile, jd_tf, similarity)
+
+
+def score_resume_against_many(
+    resume_data: Dict[str, Any],
+    job_descriptions: List[str],
+    idf_lookup: Optional[IdfLookup] = None,
+    profile: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Score one resume against many job descriptions in a single pass.
+    The resume is tokenized once and all cosine similarities are computed together
+    as a sparse matrix-vector product (NumPy when available, pure Python otherwise).
+    Returns one result per job description, in input order.
+    """
+    if profile is None:
+        profile = build_resume_profile(resume_data)
+    resume_tf = profile["tf"]
+    jd_tfs = [compute_tf(tokens) if tokens else {} for tokens in (tokenize(jd) for jd in job_descriptions)]
+    if not resume_tf:
+        return [_empty_result() for _ in job_descriptions]
+
+    vocabulary = set(resume_tf)
+    for jd_tf in jd_tfs:
+        vocabulary.update(jd_tf)
+    if idf_lookup is not None:
+        idf = idf_lookup(vocabulary)
+    else:
+        # Without corpus statistics, treat the batch itself as the corpus
+        doc_freq = Counter(resume_tf)
+        for jd_tf in jd_tfs:
+            doc_freq.update(jd_tf.keys())
+        idf = corpus_idf(doc_freq, len(jd_tfs) + 1, vocabulary)
+
+    if NUMPY_AVAILABLE:
+        similarities = _batch_cosine_numpy(resume_tf, jd_tfs, idf)
+    else:
+        resume_tfidf = {word: tf * idf[word] for word, tf in resume_tf.items()}
+        similarities = [
+            cosine_similarity(resume_tfidf, {word: tf * idf[word] for word, tf in jd_tf.items()})
+            for jd_tf in jd_tfs
+        ]
+
+    return [
+        _build_result(profile, jd_tf, float(sim)) if jd_tf else _empty_result()
+        for jd_tf, sim in zip(jd_tfs, similarities)
+    ]
+
+
+def _batch_cosine_numpy(
+    resume_tf: Dict[str, float],
+    jd_tfs: List[Dict[str, float]],
+    idf: Dict[str, float],
+) -> List[float]:
+    """Cosine similarity of one TF-IDF vector against the rows of a CSR term matrix."""
+    term_ids: Dict[str, int] = {}
+    indptr = [0]
+    indices: List[int] = []
+    data: List[float] = []
+    for jd_tf in jd_tfs:
+        for word, tf in jd_tf.items():
+            indices.append(term_ids.setdefault(word, len(term_ids)))
+            data.append(tf * idf[word])
+        indptr.append(len(indices))
+
+    resume_vec = np.zeros(len(term_ids) + 1)
+    for word, tf in resume_tf.items():
+        term_id = term_ids.get(word)
+        if term_id is not None:
+            resume_vec[term_id] = tf * idf[word]
+    resume_norm = math.sqrt(sum((tf * idf[word]) ** 2 for word, tf in resume_tf.items())) or 1
+
+    # A trailing zero entry (pointing at the spare zero slot of resume_vec) keeps every
+    # row start a valid reduceat index, including trailing empty rows.
+    indices.append(len(term_ids))
+    data.append(0.0)
+    indptr_arr = np.asarray(indptr)
+    data_arr = np.asarray(data)
+    empty_rows = indptr_arr[:-1] == indptr_arr[1:]
+
+    dots = np.add.reduceat(data_arr * resume_vec[np.asarray(indices)], indptr_arr[:-1])
+    norms = np.sqrt(np.add.reduceat(data_arr ** 2, indptr_arr[:-1]))
+    dots[empty_rows] = 0.0
+    norms[empty_rows | (norms == 0)] = 1.0
+    return (dots / (norms * resume_norm)).tolist()
+
+
+def rank_resumes_for_job(
+    profiles: List[Dict[str, Any]],
+    job_description: str,
+    idf_lookup: Optional[IdfLookup] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Score many resume profiles against one job description.
+    The JD is tokenized and weighted once; each resume costs one pass over its cached term vector.
+    Returns one result per profile, in input order.
+    """
+    jd_tokens = tokenize(job_description)
+    if not jd_tokens:
+        return [_empty_result() for _ in profiles]
+    jd_tf = compute_tf(jd_tokens)
+
+    vocabulary = set(jd_tf)
+    for profile in profiles:
+        vocabulary.update(profile["tf"])
+    if idf_lookup is not None:
+        idf = idf_lookup(vocabulary)
+    else:
+        doc_freq = Counter(jd_tf.keys())
+        for profile in profiles:
+            doc_freq.update(profile["tf"].keys())
+        idf = corpus_idf(doc_freq, len(profiles) + 1, vocabulary)
+
+    jd_tfidf = {word: tf * idf[word] for word, tf in jd_tf.items()}
+    jd_norm = math.sqrt(sum(v ** 2 for v in jd_tfidf.values())) or 1
+
+    results = []
+    for profile in profiles:
+        resume_tf = profile["tf"]
+        if not resume_tf:
+            results.append(_empty_result())
+            continue
+        dot = sum(weight * resume_tf[word] * idf[word] for word, weight in jd_tfidf.items() if word in resume_tf)
+        resume_norm = math.sqrt(sum((tf * idf[word]) ** 2 for word, tf in resume_tf.items())) or 1
+        results.append(_build_result(profile, jd_tf, dot / (jd_norm * resume_norm)))
+    return results
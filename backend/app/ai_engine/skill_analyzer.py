@@ -4,105 +4,193 @@ Extracts required skills from job descriptions using NLP,
 compares with user skills, and recommends missing skills.
 """
 
-import re
-from typing import Dict, Any, List, Optional
-
-# Comprehensive skill dictionary for extraction
-TECH_SKILLS = {
-    # Programming Languages
-    "python", "java", "javascript", "typescript", "c++", "c#", "ruby", "go", "rust",
-    "swift", "kotlin", "php", "scala", "r", "matlab", "perl", "dart", "lua",
-    # Web Frameworks
-    "react", "reactjs", "angular", "vue", "vuejs", "nextjs", "django", "flask",
-    "fastapi", "express", "nodejs", "spring", "rails", "laravel", "svelte",
-    # Databases
-    "sql", "mysql", "postgresql", "mongodb", "redis", "elasticsearch", "dynamodb",
-    "cassandra", "sqlite", "oracle", "firebase", "supabase",
-    # Cloud & DevOps
-    "aws", "azure", "gcp", "docker", "kubernetes", "jenkins", "terraform",
-    "ansible", "ci/cd", "linux", "git", "github", "gitlab",
-    # AI/ML
-    "machine learning", "deep learning", "tensorflow", "pytorch", "keras",
-    "nlp", "computer vision", "opencv", "scikit-learn", "pandas", "numpy",
-    "neural networks", "transformers", "huggingface", "openai",
-    # Data
-    "data analysis", "data science", "big data", "hadoop", "spark", "tableau",
-    "power bi", "etl", "data engineering", "data visualization",
-    # Mobile
-    "android", "ios", "react native", "flutter", "xamarin",
-    # Tools & Concepts
-    "agile", "scrum", "rest api", "graphql", "microservices", "api",
-    "html", "css", "tailwind", "bootstrap", "sass", "webpack",
-    "testing", "junit", "pytest", "selenium", "cypress",
-    "security", "blockchain", "iot", "embedded systems",
-}
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Any, List, Optional, Sequence, Set, Tuple
+
+from app.config import settings
+from app.ai_engine.skill_taxonomy import DEFAULT_SNAPSHOT_PATH, DEFAULT_SOURCE_PATH, TaxonomyStore
+
+# Skills, aliases, and categories come from the taxonomy data file (app/data/skill_taxonomy.json)
+skill_taxonomy = TaxonomyStore(
+    source_path=settings.SKILL_TAXONOMY_PATH or DEFAULT_SOURCE_PATH,
+    snapshot_path=settings.SKILL_TAXONOMY_SNAPSHOT or DEFAULT_SNAPSHOT_PATH,
+    check_seconds=settings.SKILL_TAXONOMY_CHECK_SECONDS,
+)
 
 
 def extract_skills_from_text(text: str) -> List[str]:
-    """Extract technical skills from text using pattern matching."""
-    text_lower = text.lower()
-    found_skills = []
+    """Extract technical skills (and their known aliases) from text in a single pass."""
+    return sorted(skill_taxonomy.current().find(text))
+
+
+# Batch extraction fans chunks of texts out to worker processes. Workers are started with
+# forkserver/spawn rather than forked from the (threaded) server process, and are kept
+# alive between batches; each one maps the taxonomy snapshot once.
+_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def extraction_workers(workers: Optional[int] = None) -> int:
+    """Worker processes used for batch extraction (SKILL_EXTRACTION_WORKERS, default one per core)."""
+    return max(1, workers or settings.SKILL_EXTRACTION_WORKERS or os.cpu_count() or 1)
+
 
-    for skill in TECH_SKILLS:
-        # Use word boundary matching for accuracy
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        if re.search(pattern, text_lower):
-            found_skills.append(skill)
+def _extraction_pool(workers: int) -> ProcessPoolExecutor:
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context(_START_METHOD),
+                initializer=_warm_worker,
+            )
+            _pool_workers = workers
+        return _pool
 
-    # Also extract capitalized skill mentions (e.g., AWS, GCP, SQL)
-    words = re.findall(r'\b[A-Z][A-Za-z\+\#]+\b', text)
-    for word in words:
-        if word.lower() in TECH_SKILLS and word.lower() not in found_skills:
-            found_skills.append(word.lower())
 
-    return sorted(set(found_skills))
+def _warm_worker() -> None:
+    skill_taxonomy.current()
+
+
+def _extract_chunk(texts: Sequence[str]) -> List[List[str]]:
+    taxonomy = skill_taxonomy.current()
+    return [sorted(taxonomy.find(text)) for text in texts]
+
+
+def extract_skills_batch(
+    texts: Sequence[str],
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> Tuple[List[List[str]], int]:
+    """
+    Extract skills from many texts (as extract_skills_from_text would, in order) across a
+    process pool. Batches that fit in one chunk, or a single worker, run in-process.
+    Returns the skills and the number of worker processes that actually ran (1 in-process).
+    """
+    workers = extraction_workers(workers)
+    chunk_size = chunk_size or settings.SKILL_EXTRACTION_CHUNK_SIZE
+    if workers == 1 or len(texts) <= chunk_size:
+        return _extract_chunk(texts), 1
+    # At least one chunk per worker; larger chunks amortize pickling and IPC
+    size = min(chunk_size, -(-len(texts) // workers))
+    chunks = [texts[i:i + size] for i in range(0, len(texts), size)]
+    results: List[List[str]] = []
+    for part in _extraction_pool(workers).map(_extract_chunk, chunks):
+        results.extend(part)
+    return results, min(workers, len(chunks))
 
 
 def normalize_skill(skill: str) -> str:
     """Normalize skill name for comparison."""
-    skill = skill.lower().strip()
-    # Common aliases
-    aliases = {
-        "js": "javascript",
-        "ts": "typescript",
-        "py": "python",
-        "react.js": "react",
-        "reactjs": "react",
-        "node.js": "nodejs",
-        "vue.js": "vue",
-        "vuejs": "vue",
-        "next.js": "nextjs",
-        "c sharp": "c#",
-        "cpp": "c++",
-        "postgres": "postgresql",
-        "mongo": "mongodb",
-        "k8s": "kubernetes",
-        "ml": "machine learning",
-        "dl": "deep learning",
-        "ai": "artificial intelligence",
+    return skill_taxonomy.current().normalize(skill)
+
+
+def role_item(job_role: Optional[str]) -> str:
+    """Key of a job role among skill co-occurrence items ("" for no role)."""
+    role = " ".join((job_role or "").lower().split())
+    return f"role:{role}" if role else ""
+
+
+def rank_by_affinity(
+    skills: List[str],
+    context: Set[str],
+    skill_neighbours: Callable[[str], Dict[str, float]],
+) -> Dict[str, float]:
+    """
+    Affinity of each skill to a context (the user's skills and role item): the summed
+    co-occurrence weights of the skill's precomputed neighbours that are in the context.
+    """
+    return {
+        skill: sum(weight for other, weight in skill_neighbours(skill).items() if other in context)
+        for skill in skills
     }
-    return aliases.get(skill, skill)
+
+
+def _as_list(value: Any) -> List[str]:
+    """Resume list fields may be stored as a list or as comma/newline separated text."""
+    if isinstance(value, list):
+        return [str(v) for v in value if v]
+    if isinstance(value, str):
+        return [v.strip() for v in value.replace("\n", ",").split(",") if v.strip()]
+    return []
+
+
+def extract_resume_skills(resume_data: Dict[str, Any]) -> Set[str]:
+    """
+    Normalized skill set of a resume: listed skills and project technologies, plus skills
+    mentioned in project descriptions and experience/internship bullets.
+    """
+    skills: Set[str] = set()
+    for group in resume_data.get("skills") or []:
+        if isinstance(group, dict):
+            skills.update(normalize_skill(s) for s in _as_list(group.get("items")))
+        elif isinstance(group, str):
+            skills.add(normalize_skill(group))
+
+    texts = []
+    for project in resume_data.get("projects") or []:
+        if isinstance(project, dict):
+            skills.update(normalize_skill(s) for s in _as_list(project.get("technologies")))
+            texts.append(str(project.get("description") or ""))
+    for section in ("experience", "internships"):
+        for entry in resume_data.get(section) or []:
+            if isinstance(entry, dict):
+                texts.extend(_as_list(entry.get("bullets")))
+                texts.append(str(entry.get("description") or ""))
+    skills.update(extract_skills_from_text("\n".join(texts)))
+    skills.discard("")
+    return skills
 
 
 def analyze_skill_gap(
     job_description: str,
     user_skills: List[str],
     job_role: Optional[str] = None,
+    required_skills: Optional[List[str]] = None,
+    user_skill_set: Optional[Set[str]] = None,
+    skill_neighbours: Optional[Callable[[str], Dict[str, float]]] = None,
 ) -> Dict[str, Any]:
     """
     Perform skill gap analysis between job description and user skills.
     Returns required skills, missing skills, match percentage, and recommendations.
+    Pass required_skills when they were already extracted from this job description, and
+    user_skill_set when user_skills are already normalized (see extract_resume_skills).
+    With skill_neighbours (co-occurrence neighbour lists per skill), missing skills are
+    ranked by how strongly they co-occur with the user's skills and the job role.
     """
     # Extract required skills from job description
-    required_skills = extract_skills_from_text(job_description)
+    if required_skills is None:
+        required_skills = extract_skills_from_text(job_description)
 
     # Normalize user skills
-    normalized_user_skills = [normalize_skill(s) for s in user_skills]
-    user_skill_set = set(normalized_user_skills)
-
-    # Find matching and missing skills
-    matching_skills = [s for s in required_skills if normalize_skill(s) in user_skill_set]
-    missing_skills = [s for s in required_skills if normalize_skill(s) not in user_skill_set]
+    if user_skill_set is None:
+        user_skill_set = {normalize_skill(s) for s in user_skills}
+
+    # Find matching and missing skills (extracted skills are already normalized)
+    matching_skills = [s for s in required_skills if s in user_skill_set]
+    missing_skills = [s for s in required_skills if s not in user_skill_set]
+
+    related: Dict[str, List[str]] = {}
+    if skill_neighbours is not None and missing_skills:
+        context = set(user_skill_set)
+        role = role_item(job_role)
+        if role:
+            context.add(role)
+        affinity = rank_by_affinity(missing_skills, context, skill_neighbours)
+        missing_skills.sort(key=lambda s: affinity[s], reverse=True)
+        for skill in missing_skills:
+            neighbours = skill_neighbours(skill)
+            related[skill] = [
+                other for other in sorted(neighbours, key=neighbours.get, reverse=True)
+                if other in user_skill_set
+            ][:2]
 
     # Calculate match percentage
     if required_skills:
@@ -119,7 +207,11 @@ def analyze_skill_gap(
 
         # Suggest learning resources
         for skill in high_priority[:3]:
-            recommendations.append(f"📚 Learn {skill}: Try online courses on Coursera, Udemy, or official documentation")
+            if related.get(skill):
+                recommendations.append(f"📚 Learn {skill}: it is often required alongside your "
+                                       f"{' and '.join(related[skill])} experience")
+            else:
+                recommendations.append(f"📚 Learn {skill}: Try online courses on Coursera, Udemy, or official documentation")
 
     if match_percentage >= 80:
         recommendations.append("✅ Strong skill match! Focus on showcasing these skills with concrete projects.")
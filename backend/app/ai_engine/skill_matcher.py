@@ -0,0 +1,95 @@
+"""
+Multi-pattern skill matcher (Aho-Corasick).
+All skill names and aliases are compiled once into one automaton, and a text is scanned
+in a single left-to-right pass regardless of how many skills the dictionary holds.
+"""
+
+from collections import deque
+from typing import Dict, List, Set, Tuple
+
+# (pattern length, skill, starts with a word char, ends with a word char)
+_Output = Tuple[int, str, bool, bool]
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+class SkillMatcher:
+    """
+    Aho-Corasick automaton over lower-cased skill surface forms.
+    A match only counts on word boundaries (like regex \\b): a pattern edge that is a word
+    character must not touch another word character in the text, so "go" does not match
+    inside "google" while "c++" and "ci/cd" still match next to punctuation.
+    """
+
+    def __init__(self, patterns: Dict[str, str]):
+        """patterns maps a surface form (e.g. "k8s") to the skill it reports (e.g. "kubernetes")."""
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[_Output]] = [[]]
+        for surface, skill in patterns.items():
+            surface = surface.lower()
+            if surface:
+                self._insert(surface, skill)
+        self._link()
+
+    def __len__(self) -> int:
+        return len(self._goto)
+
+    def tables(self) -> Tuple[List[Dict[str, int]], List[int], List[List[_Output]]]:
+        """Goto transitions, failure links, and outputs per state (state 0 is the root)."""
+        return self._goto, self._fail, self._out
+
+    def _insert(self, surface: str, skill: str) -> None:
+        state = 0
+        for ch in surface:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append((len(surface), skill, _is_word_char(surface[0]), _is_word_char(surface[-1])))
+
+    def _link(self) -> None:
+        """Breadth-first failure links; each state inherits the outputs of its failure state."""
+        goto, fail, out = self._goto, self._fail, self._out
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                if state:
+                    f = fail[state]
+                    while f and ch not in goto[f]:
+                        f = fail[f]
+                    fail[nxt] = goto[f].get(ch, 0)
+                out[nxt] = out[nxt] + out[fail[nxt]]
+
+    def find(self, text: str) -> Set[str]:
+        """Skills whose surface forms occur in text on word boundaries (case-insensitive)."""
+        text = text.lower()
+        goto, fail, out = self._goto, self._fail, self._out
+        n = len(text)
+        found: Set[str] = set()
+        state = 0
+        for i, ch in enumerate(text):
+            nxt = goto[state].get(ch)
+            while nxt is None and state:
+                state = fail[state]
+                nxt = goto[state].get(ch)
+            state = nxt if nxt is not None else 0
+            if out[state]:
+                for length, skill, word_start, word_end in out[state]:
+                    if skill in found:
+                        continue
+                    start = i - length + 1
+                    if word_start and start > 0 and _is_word_char(text[start - 1]):
+                        continue
+                    if word_end and i + 1 < n and _is_word_char(text[i + 1]):
+                        continue
+                    found.add(skill)
+        return found
@@ -0,0 +1,373 @@
+"""
+Skill taxonomy: skills, aliases, and categories loaded from a JSON data file.
+
+The taxonomy is compiled into a flat binary snapshot (the skill matcher automaton as
+CSR-style uint32 arrays plus a string table) that is memory-mapped on load, so starting
+a worker only parses a small header. The snapshot records the SHA-256 of its source file
+and is rebuilt whenever the source changes. Build it ahead of deployment with:
+
+    python -m app.ai_engine.skill_taxonomy [source.json] [snapshot.bin]
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from app.ai_engine.skill_matcher import SkillMatcher
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+DEFAULT_SOURCE_PATH = DATA_DIR / "skill_taxonomy.json"
+DEFAULT_SNAPSHOT_PATH = DATA_DIR / "skill_taxonomy.bin"
+
+MAGIC = b"SKTX"
+FORMAT_VERSION = 1
+NONE = 0xFFFFFFFF
+WORD_START = 1
+WORD_END = 2
+# Upper bound on states kept materialized as dicts (the hot part of the trie)
+NODE_CACHE_STATES = 65536
+
+_HEADER = struct.Struct("<4sI32sI")  # magic, format version, source sha256, section count
+_SECTION = struct.Struct("<QQ")  # byte offset, item count
+# Every section is a uint32 array except the UTF-8 string blob
+SECTIONS = (
+    "edge_start", "edge_char", "edge_target", "fail", "out_start", "out_pattern",
+    "pattern_length", "pattern_skill", "pattern_flags",
+    "skill_category", "category_parent", "string_offsets", "strings",
+)
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def compile_taxonomy(source: Dict[str, Any], source_hash: bytes = b"") -> bytes:
+    """Compile a parsed taxonomy document into snapshot bytes."""
+    categories: List[str] = []
+    parents: Dict[str, Optional[str]] = {}
+    for category in source.get("categories", []):
+        categories.append(category["name"])
+        parents[category["name"]] = category.get("parent")
+
+    skills: List[str] = []
+    skill_categories: List[Optional[str]] = []
+    patterns: Dict[str, str] = {}
+    for entry in source.get("skills", []):
+        name = entry["name"].lower().strip()
+        if name in patterns and patterns[name] == name:
+            continue  # duplicate entry
+        skills.append(name)
+        skill_categories.append(entry.get("category"))
+        patterns[name] = name
+    for entry in source.get("skills", []):
+        name = entry["name"].lower().strip()
+        for alias in entry.get("aliases", []):
+            alias = alias.lower().strip()
+            if alias and alias not in patterns:
+                patterns[alias] = name
+
+    # Categories referenced but not declared become roots
+    for name in list(skill_categories) + [p for p in parents.values()]:
+        if name and name not in parents:
+            categories.append(name)
+            parents[name] = None
+    category_ids = {name: i for i, name in enumerate(categories)}
+    skill_ids = {name: i for i, name in enumerate(skills)}
+
+    goto, fail, out = SkillMatcher(patterns).tables()
+    pattern_ids: Dict[tuple, int] = {}
+    arrays: Dict[str, List[int]] = {name: [] for name in SECTIONS[:-1]}
+    for state, transitions in enumerate(goto):
+        arrays["edge_start"].append(len(arrays["edge_char"]))
+        for ch, target in sorted(transitions.items(), key=lambda item: ord(item[0])):
+            arrays["edge_char"].append(ord(ch))
+            arrays["edge_target"].append(target)
+        arrays["out_start"].append(len(arrays["out_pattern"]))
+        for output in out[state]:
+            if output not in pattern_ids:
+                length, skill, word_start, word_end = output
+                pattern_ids[output] = len(pattern_ids)
+                arrays["pattern_length"].append(length)
+                arrays["pattern_skill"].append(skill_ids[skill])
+                arrays["pattern_flags"].append((WORD_START if word_start else 0) | (WORD_END if word_end else 0))
+            arrays["out_pattern"].append(pattern_ids[output])
+    arrays["edge_start"].append(len(arrays["edge_char"]))
+    arrays["out_start"].append(len(arrays["out_pattern"]))
+    arrays["fail"] = list(fail)
+    arrays["skill_category"] = [category_ids[c] if c else NONE for c in skill_categories]
+    arrays["category_parent"] = [category_ids[parents[c]] if parents[c] else NONE for c in categories]
+
+    blob = bytearray()
+    for text in skills + categories:
+        arrays["string_offsets"].append(len(blob))
+        blob += text.encode("utf-8")
+    arrays["string_offsets"].append(len(blob))
+
+    payloads = [(struct.pack(f"<{len(arrays[name])}I", *arrays[name]), len(arrays[name])) for name in SECTIONS[:-1]]
+    payloads.append((bytes(blob), len(blob)))
+
+    offset = _HEADER.size + _SECTION.size * len(SECTIONS)
+    table = bytearray()
+    body = bytearray()
+    for payload, count in payloads:
+        padding = -(offset + len(body)) % 8  # keep every array 8-byte aligned
+        body += b"\0" * padding
+        table += _SECTION.pack(offset + len(body), count)
+        body += payload
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, source_hash.ljust(32, b"\0"), len(SECTIONS))
+    return header + bytes(table) + bytes(body)
+
+
+class SkillTaxonomy:
+    """
+    Read-only view over a compiled snapshot (bytes or a memory map).
+    Provides single-pass skill extraction, alias normalization, and category lookup.
+    """
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+        view = memoryview(buffer)
+        magic, version, source_hash, n_sections = _HEADER.unpack_from(view, 0)
+        if magic != MAGIC or version != FORMAT_VERSION or n_sections != len(SECTIONS):
+            raise ValueError("Not a skill taxonomy snapshot of this format version")
+        self.source_hash = source_hash
+        sections = {}
+        for i, name in enumerate(SECTIONS):
+            offset, count = _SECTION.unpack_from(view, _HEADER.size + i * _SECTION.size)
+            if name == "strings":
+                sections[name] = view[offset:offset + count]
+            else:
+                sections[name] = view[offset:offset + 4 * count].cast("I")
+        self._edge_start = sections["edge_start"]
+        self._edge_char = sections["edge_char"]
+        self._edge_target = sections["edge_target"]
+        self._fail = sections["fail"]
+        self._out_start = sections["out_start"]
+        self._out_pattern = sections["out_pattern"]
+        self._pattern_length = sections["pattern_length"]
+        self._pattern_skill = sections["pattern_skill"]
+        self._pattern_flags = sections["pattern_flags"]
+        self._skill_category = sections["skill_category"]
+        self._category_parent = sections["category_parent"]
+        self._string_offsets = sections["string_offsets"]
+        self._strings = sections["strings"]
+        self.skill_count = len(self._skill_category)
+        self._nodes: Dict[int, Tuple[Dict[int, int], Tuple[Tuple[int, int, int], ...]]] = {}
+        self._names: Dict[int, str] = {}
+
+    def _string(self, index: int) -> str:
+        name = self._names.get(index)
+        if name is None:
+            start, end = self._string_offsets[index], self._string_offsets[index + 1]
+            name = str(self._strings[start:end], "utf-8")
+            self._names[index] = name
+        return name
+
+    def _node(self, state: int) -> Tuple[Dict[int, int], Tuple[Tuple[int, int, int], ...]]:
+        """
+        (transitions, outputs) of a state, materialized from the arrays on first visit;
+        outputs are (pattern length, skill id, boundary flags).
+        """
+        node = self._nodes.get(state)
+        if node is None:
+            lo, hi = self._edge_start[state], self._edge_start[state + 1]
+            edges = dict(zip(self._edge_char[lo:hi], self._edge_target[lo:hi]))
+            outputs = tuple(
+                (self._pattern_length[p], self._pattern_skill[p], self._pattern_flags[p])
+                for p in self._out_pattern[self._out_start[state]:self._out_start[state + 1]]
+            )
+            node = (edges, outputs)
+            if len(self._nodes) < NODE_CACHE_STATES:
+                self._nodes[state] = node
+        return node
+
+    def _next(self, state: int, code: int) -> Optional[int]:
+        return self._node(state)[0].get(code)
+
+    def find(self, text: str) -> Set[str]:
+        """Skills (or their aliases) that occur in text on word boundaries, case-insensitive."""
+        text = text.lower()
+        fail, nodes, load = self._fail, self._nodes, self._node
+        n = len(text)
+        found: Set[int] = set()
+        state = 0
+        node = load(0)
+        for i, ch in enumerate(text):
+            code = ord(ch)
+            nxt = node[0].get(code)
+            while nxt is None and state:
+                state = fail[state]
+                node = nodes.get(state) or load(state)
+                nxt = node[0].get(code)
+            state = nxt if nxt is not None else 0
+            node = nodes.get(state) or load(state)
+            for length, skill, flags in node[1]:
+                if skill in found:
+                    continue
+                begin = i - length + 1
+                if flags & WORD_START and begin > 0 and _is_word_char(text[begin - 1]):
+                    continue
+                if flags & WORD_END and i + 1 < n and _is_word_char(text[i + 1]):
+                    continue
+                found.add(skill)
+        return {self._string(skill) for skill in found}
+
+    def _skill_id(self, name: str) -> Optional[int]:
+        """Exact lookup of a skill name or alias by walking the automaton's trie edges."""
+        name = name.lower().strip()
+        if not name:
+            return None
+        state = 0
+        for ch in name:
+            state = self._next(state, ord(ch))
+            if state is None:
+                return None
+        for j in range(self._out_start[state], self._out_start[state + 1]):
+            pattern = self._out_pattern[j]
+            if self._pattern_length[pattern] == len(name):
+                return self._pattern_skill[pattern]
+        return None
+
+    def normalize(self, name: str) -> str:
+        """Canonical skill name for a skill or alias; unknown names are lower-cased and stripped."""
+        skill = self._skill_id(name)
+        return self._string(skill) if skill is not None else name.lower().strip()
+
+    def categories(self, name: str) -> List[str]:
+        """Category of a skill followed by its parent categories, most specific first."""
+        skill = self._skill_id(name)
+        if skill is None:
+            return []
+        path = []
+        category = self._skill_category[skill]
+        while category != NONE and len(path) < 32:
+            path.append(self._string(self.skill_count + category))
+            category = self._category_parent[category]
+        return path
+
+    def skill_names(self) -> List[str]:
+        return [self._string(i) for i in range(self.skill_count)]
+
+    def surface_forms(self) -> List[Tuple[str, str]]:
+        """Every (name or alias, canonical skill) pair, by walking the automaton's trie edges."""
+        forms = []
+        stack = [(0, "")]
+        while stack:
+            state, prefix = stack.pop()
+            for j in range(self._out_start[state], self._out_start[state + 1]):
+                pattern = self._out_pattern[j]
+                if self._pattern_length[pattern] == len(prefix):
+                    forms.append((prefix, self._string(self._pattern_skill[pattern])))
+            for i in range(self._edge_start[state], self._edge_start[state + 1]):
+                stack.append((self._edge_target[i], prefix + chr(self._edge_char[i])))
+        return forms
+
+    def category(self, name: str) -> Optional[str]:
+        """Most specific category of a skill or alias, if it has one."""
+        path = self.categories(name)
+        return path[0] if path else None
+
+
+def _open_snapshot(path: Path) -> Optional[SkillTaxonomy]:
+    try:
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return SkillTaxonomy(buffer)
+    except (OSError, ValueError, struct.error):
+        return None
+
+
+def _write_atomically(path: Path, data: bytes) -> None:
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def load_taxonomy(source_path: Path = DEFAULT_SOURCE_PATH, snapshot_path: Path = DEFAULT_SNAPSHOT_PATH) -> SkillTaxonomy:
+    """
+    Load the taxonomy from its snapshot when it matches the source file, otherwise compile
+    the source and try to save a fresh snapshot (a read-only filesystem just skips the save).
+    Without a source file, an existing snapshot is used as-is.
+    """
+    snapshot = _open_snapshot(snapshot_path)
+    try:
+        raw = Path(source_path).read_bytes()
+    except FileNotFoundError:
+        if snapshot is None:
+            raise
+        return snapshot
+    source_hash = hashlib.sha256(raw).digest()
+    if snapshot is not None and snapshot.source_hash == source_hash:
+        return snapshot
+
+    data = compile_taxonomy(json.loads(raw), source_hash)
+    try:
+        _write_atomically(Path(snapshot_path), data)
+    except OSError:
+        return SkillTaxonomy(data)
+    return _open_snapshot(snapshot_path) or SkillTaxonomy(data)
+
+
+class TaxonomyStore:
+    """
+    Holds the current taxonomy and reloads it when the source file's mtime changes
+    (checked at most every check_seconds). A reload builds the new taxonomy completely
+    before swapping the reference, so readers always see one consistent version.
+    """
+
+    def __init__(self, source_path: Path = DEFAULT_SOURCE_PATH, snapshot_path: Path = DEFAULT_SNAPSHOT_PATH,
+                 check_seconds: float = 30):
+        self.source_path = Path(source_path)
+        self.snapshot_path = Path(snapshot_path)
+        self.check_seconds = check_seconds
+        self._taxonomy: Optional[SkillTaxonomy] = None
+        self._mtime: Optional[float] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _source_mtime(self) -> Optional[float]:
+        try:
+            return self.source_path.stat().st_mtime
+        except OSError:
+            return None
+
+    def current(self) -> SkillTaxonomy:
+        taxonomy = self._taxonomy
+        if taxonomy is not None and time.monotonic() - self._checked_at < self.check_seconds:
+            return taxonomy
+        with self._lock:
+            if self._taxonomy is None or time.monotonic() - self._checked_at >= self.check_seconds:
+                mtime = self._source_mtime()
+                if self._taxonomy is None or mtime != self._mtime:
+                    try:
+                        self._taxonomy = load_taxonomy(self.source_path, self.snapshot_path)
+                        self._mtime = mtime
+                    except (OSError, ValueError, KeyError) as e:
+                        if self._taxonomy is None:
+                            raise
+                        print(f"Skill taxonomy reload failed, keeping the previous version: {e}")
+                self._checked_at = time.monotonic()
+            return self._taxonomy
+
+
+if __name__ == "__main__":
+    source = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SOURCE_PATH
+    target = Path(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_SNAPSHOT_PATH
+    raw = source.read_bytes()
+    data = compile_taxonomy(json.loads(raw), hashlib.sha256(raw).digest())
+    _write_atomically(target, data)
+    print(f"Wrote {target} ({len(data)} bytes, {SkillTaxonomy(data).skill_count} skills)")
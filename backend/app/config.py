@@ -26,6 +26,58 @@ class Settings(BaseSettings):
 
     # HuggingFace (FREE API)
     HUGGINGFACE_API_KEY: str = ""
+    HF_TIMEOUT_SECONDS: float = 60.0
+    HF_MAX_CONNECTIONS: int = 100
+
+    # Circuit breaker: open (rule-based only) when this share of recent calls fails, probe again after a cool-down.
+    # Call timeouts follow observed p95 latency times the multiplier, between the min and HF_TIMEOUT_SECONDS.
+    HF_BREAKER_FAILURE_RATE: float = 0.5
+    HF_BREAKER_MIN_CALLS: int = 10
+    HF_BREAKER_WINDOW_SECONDS: float = 60.0
+    HF_BREAKER_OPEN_SECONDS: float = 30.0
+    HF_TIMEOUT_MIN_SECONDS: float = 5.0
+    HF_TIMEOUT_P95_MULTIPLIER: float = 2.0
+
+    # Micro-batching: prompts sent within the wait window go upstream together as one list of inputs.
+    # 1 disables it; only raise it for endpoints that accept batched inputs.
+    HF_BATCH_SIZE: int = 1
+    HF_BATCH_WAIT_MS: float = 5.0
+
+    # Cache of model responses by (model URL, prompt, parameters); the SQL tier is optional
+    LLM_CACHE_SIZE: int = 1024
+    LLM_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+    LLM_CACHE_TTL_SECONDS: int = 86400
+    LLM_CACHE_PERSISTENT: bool = False
+    LLM_CACHE_PERSISTENT_MAX_ENTRIES: int = 50000
+
+    # Identical concurrent generations share one upstream call (across workers via the database when shared)
+    GENERATION_SINGLE_FLIGHT_SHARED: bool = False
+    GENERATION_SINGLE_FLIGHT_POLL_SECONDS: float = 0.25
+
+    # Background generation jobs: concurrent jobs per worker process and queue poll interval
+    GENERATION_JOB_CONCURRENCY: int = 8
+    GENERATION_JOB_POLL_SECONDS: float = 2.0
+
+    # Resume scoring corpus (seconds between reloads of the shared IDF table)
+    CORPUS_REFRESH_SECONDS: int = 300
+    SCORE_CACHE_SIZE: int = 4096
+
+    # Near-duplicate job descriptions (MinHash Jaccard estimate) share extracted features
+    JD_FEATURE_CACHE_SIZE: int = 2048
+    JD_DUPLICATE_THRESHOLD: float = 0.9
+
+    # Skill co-occurrence neighbours (refreshed every CORPUS_REFRESH_SECONDS, rebuilt to drop deletions)
+    SKILL_COOCCURRENCE_REBUILD_SECONDS: int = 3600
+    SKILL_NEIGHBOURS_TOP_N: int = 20
+
+    # Skill taxonomy data file and its compiled snapshot (empty = bundled app/data files)
+    SKILL_TAXONOMY_PATH: str = ""
+    SKILL_TAXONOMY_SNAPSHOT: str = ""
+    SKILL_TAXONOMY_CHECK_SECONDS: int = 30
+
+    # Batch skill extraction process pool (0 workers = one per CPU core)
+    SKILL_EXTRACTION_WORKERS: int = 0
+    SKILL_EXTRACTION_CHUNK_SIZE: int = 64
 
     # Google OAuth
     GOOGLE_CLIENT_ID: str = ""
@@ -11,18 +11,37 @@ import os
 
 from app.config import settings
 from app.database import engine, Base
+from app.ai_engine.inference_client import inference_client
+from app.services.generation_jobs import generation_worker
+from app.services.llm_cache import llm_cache
+from app.services.single_flight import single_flight
+from app.services.circuit_breaker import inference_breaker
+from app.services.skill_cooccurrence import skill_cooccurrence
+from app.services.skill_suggest import skill_suggester
 
 # Import all routes
-from app.routes import auth, resume, cover_letter, portfolio, admin, ai_features
+from app.routes import auth, resume, cover_letter, portfolio, admin, ai_features, job_description, skills
+
+# Repeated prompts are answered from the response cache; identical concurrent ones share a call
+inference_client.cache = llm_cache
+inference_client.single_flight = single_flight
+inference_client.breaker = inference_breaker
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Application lifespan: create tables on startup."""
+    """Application lifespan: create tables and start background refreshers and workers on startup."""
     from app.models import models  # noqa: F401
     Base.metadata.create_all(bind=engine)
     print("Database tables created/verified")
+    skill_cooccurrence.start()
+    skill_suggester.start()
+    generation_worker.start()
     yield
+    generation_worker.stop()
+    skill_cooccurrence.stop()
+    skill_suggester.stop()
+    await inference_client.aclose()
     print("Application shutting down")
 
 
@@ -49,6 +68,8 @@ app.include_router(cover_letter.router)
 app.include_router(portfolio.router)
 app.include_router(admin.router)
 app.include_router(ai_features.router)
+app.include_router(job_description.router)
+app.include_router(skills.router)
 
 
 @app.get("/", tags=["Health"])
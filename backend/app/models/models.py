@@ -70,12 +70,24 @@ class Resume(Base):
 
     # Relationships
     user = relationship("User", back_populates="resumes")
+    section_vectors = relationship("ResumeSectionVector", cascade="all, delete-orphan")
 
     __table_args__ = (
         Index("idx_resume_user_id", "user_id"),
     )
 
 
+class ResumeSectionVector(Base):
+    """Cached term counts of one resume section, used to score resumes without re-tokenizing."""
+    __tablename__ = "resume_section_vectors"
+
+    resume_id = Column(Integer, ForeignKey("resumes.id", ondelete="CASCADE"), primary_key=True)
+    section = Column(String(50), primary_key=True)
+    content_hash = Column(String(64), nullable=False)
+    term_counts = Column(JSON, nullable=False)  # {term: count}
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
 class CoverLetter(Base):
     """AI-generated cover letters."""
     __tablename__ = "cover_letters"
@@ -132,12 +144,24 @@ class JobDescription(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     user = relationship("User", back_populates="job_descriptions")
+    vector = relationship("JobDescriptionVector", uselist=False, cascade="all, delete-orphan")
 
     __table_args__ = (
         Index("idx_job_desc_user_id", "user_id"),
     )
 
 
+class JobDescriptionVector(Base):
+    """Term counts of a stored job description, computed once at ingest."""
+    __tablename__ = "job_description_vectors"
+
+    job_description_id = Column(Integer, ForeignKey("job_descriptions.id", ondelete="CASCADE"), primary_key=True)
+    content_hash = Column(String(64), nullable=False)  # hash of the normalized description
+    term_counts = Column(JSON, nullable=False)  # {term: count}
+    token_count = Column(Integer, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
 class ResumeScore(Base):
     """Resume scoring results from AI analysis."""
     __tablename__ = "resume_scores"
@@ -162,6 +186,58 @@ class ResumeScore(Base):
     )
 
 
+class ScoreCacheEntry(Base):
+    """Persistent tier of the score cache: content hash of (resume, JD) -> stored score row."""
+    __tablename__ = "score_cache_entries"
+
+    cache_key = Column(String(64), primary_key=True)
+    score_id = Column(Integer, ForeignKey("resume_scores.id", ondelete="CASCADE"), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class LLMResponseCacheEntry(Base):
+    """Persistent tier of the LLM response cache: hash of (model URL, prompt, parameters) -> generated text."""
+    __tablename__ = "llm_response_cache"
+
+    cache_key = Column(String(64), primary_key=True)
+    response = Column(Text, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+
+
+class GenerationJob(Base):
+    """Queued AI generation (resume or cover letter), run by the generation worker pool."""
+    __tablename__ = "generation_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    kind = Column(String(20), nullable=False)  # resume, cover_letter
+    # queued, running, succeeded, failed; hedged upgrades can also end superseded or kept_rule_based
+    status = Column(String(20), nullable=False, default="queued")
+    params = Column(JSON, nullable=False)  # the generate request's fields
+    result = Column(JSON, nullable=True)  # the generator's output
+    error = Column(Text, nullable=True)
+    worker = Column(String(32), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("idx_generation_jobs_status", "status", "id"),
+    )
+
+
+class InflightGeneration(Base):
+    """Cross-worker single-flight lock of an inference request, holding its result once finished."""
+    __tablename__ = "inflight_generations"
+
+    request_key = Column(String(64), primary_key=True)
+    owner = Column(String(32), nullable=False)  # unique per claim
+    started_at = Column(DateTime(timezone=True), nullable=False)
+    finished_at = Column(DateTime(timezone=True), nullable=True, index=True)
+    response = Column(Text, nullable=True)
+
+
 class SkillAnalysis(Base):
     """Skill gap analysis results."""
     __tablename__ = "skill_analyses"
@@ -181,3 +257,37 @@ class SkillAnalysis(Base):
     __table_args__ = (
         Index("idx_skill_analysis_user_id", "user_id"),
     )
+
+
+class SkillDemand(Base):
+    """
+    Materialized skill demand: how often a skill was required in skill analyses for a job
+    role, per month. Role "*" aggregates all roles, bucket "all" all months, and skill "*"
+    counts the analyses themselves.
+    """
+    __tablename__ = "skill_demand"
+
+    job_role = Column(String(200), primary_key=True)  # normalized role
+    bucket = Column(String(7), primary_key=True)  # "YYYY-MM" or "all"
+    skill = Column(String(100), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("idx_skill_demand_rank", "job_role", "bucket", "count"),
+    )
+
+
+class CorpusTerm(Base):
+    """Document frequency of each scoring term across stored resumes and job descriptions."""
+    __tablename__ = "corpus_terms"
+
+    term = Column(String(100), primary_key=True)
+    doc_freq = Column(Integer, nullable=False, default=0)
+
+
+class CorpusStat(Base):
+    """Collection-wide counters for the scoring corpus (e.g. doc_count)."""
+    __tablename__ = "corpus_stats"
+
+    name = Column(String(50), primary_key=True)
+    value = Column(Float, nullable=False, default=0)
@@ -2,14 +2,28 @@
 Admin dashboard routes: analytics and system management.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+import time
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from typing import List
+from typing import List, Optional
 from app.database import get_db
 from app.models.models import User, Resume, CoverLetter, Portfolio, ResumeScore
-from app.schemas.schemas import AdminDashboardResponse, UserResponse
+from app.schemas.schemas import (
+    AdminDashboardResponse, UserResponse,
+    CandidateSearchRequest, CandidateMatchItem, CandidateSearchResponse,
+    SkillDemandItem, SkillDemandResponse,
+    SkillExtractionBatchRequest, SkillExtractionBatchResponse, LLMCacheStatsResponse,
+    SingleFlightStatsResponse, InferenceBreakerStatsResponse,
+)
 from app.utils.auth import get_current_admin
+from app.ai_engine.skill_analyzer import extract_skills_batch
+from app.services.circuit_breaker import inference_breaker
+from app.services.llm_cache import llm_cache
+from app.services.resume_index import get_resume_index
+from app.services.single_flight import single_flight
+from app.services.skill_demand import ALL_TIME, demand_role, top_skills
 
 router = APIRouter(prefix="/api/admin", tags=["Admin"])
 
@@ -75,3 +89,97 @@ def toggle_user_active(
     user.is_active = not user.is_active
     db.commit()
     return {"message": f"User {'activated' if user.is_active else 'deactivated'} successfully"}
+
+
+@router.post("/candidates/search", response_model=CandidateSearchResponse)
+def search_candidates(
+    req: CandidateSearchRequest,
+    current_user: User = Depends(get_current_admin),
+    db: Session = Depends(get_db),
+):
+    """Find the resumes across the platform that best match a job description (paginated)."""
+    offset = (req.page - 1) * req.page_size
+    # One extra hit tells whether another page exists
+    hits = get_resume_index(db).search(db, req.job_description, offset + req.page_size + 1)
+    page_hits = hits[offset:offset + req.page_size]
+
+    resumes = {r.id: r for r in db.query(Resume).filter(Resume.id.in_([rid for rid, _ in page_hits]))}
+    results = []
+    for rank, (resume_id, similarity) in enumerate(page_hits, start=offset + 1):
+        resume = resumes.get(resume_id)
+        if resume is None:  # deleted by another worker since indexing
+            continue
+        results.append(CandidateMatchItem(
+            rank=rank,
+            resume_id=resume.id,
+            user_id=resume.user_id,
+            title=resume.title,
+            candidate_name=(resume.personal_info or {}).get("name"),
+            target_job_role=resume.target_job_role,
+            match_score=round(similarity * 100, 1),
+        ))
+    return CandidateSearchResponse(
+        page=req.page,
+        page_size=req.page_size,
+        has_more=len(hits) > offset + req.page_size,
+        results=results,
+    )
+
+
+@router.get("/analytics/skill-demand", response_model=SkillDemandResponse)
+def get_skill_demand(
+    job_role: Optional[str] = None,
+    month: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}$"),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_admin),
+    db: Session = Depends(get_db),
+):
+    """Most demanded skills in skill analyses for a job role (all roles by default), all time or one month."""
+    bucket = month or ALL_TIME
+    total, skills = top_skills(db, job_role, bucket, limit)
+    db.commit()  # keep a one-time backfill of older analyses
+    return SkillDemandResponse(
+        job_role=demand_role(job_role) if job_role else None,
+        bucket=bucket,
+        total_analyses=total,
+        skills=[
+            SkillDemandItem(skill=skill, count=count, share=round(count / total * 100, 1) if total else 0.0)
+            for skill, count in skills
+        ],
+    )
+
+
+@router.post("/skills/extract-batch", response_model=SkillExtractionBatchResponse)
+def extract_skills_bulk(
+    data: SkillExtractionBatchRequest,
+    current_user: User = Depends(get_current_admin),
+):
+    """Extract skills from many job descriptions across the extraction process pool."""
+    start = time.perf_counter()
+    skills, workers = extract_skills_batch(data.job_descriptions)
+    seconds = time.perf_counter() - start
+    return SkillExtractionBatchResponse(
+        skills=skills,
+        count=len(skills),
+        workers=workers,
+        seconds=round(seconds, 4),
+        jds_per_second=round(len(skills) / seconds, 1) if seconds else 0.0,
+    )
+
+
+@router.get("/metrics/llm-cache", response_model=LLMCacheStatsResponse)
+def get_llm_cache_stats(current_user: User = Depends(get_current_admin)):
+    """Hit/miss counters and size of the model response cache."""
+    return LLMCacheStatsResponse(**llm_cache.stats())
+
+
+@router.get("/metrics/single-flight", response_model=SingleFlightStatsResponse)
+def get_single_flight_stats(current_user: User = Depends(get_current_admin)):
+    """How many generation requests were coalesced into another request's upstream call."""
+    return SingleFlightStatsResponse(**single_flight.stats())
+
+
+@router.get("/metrics/inference-breaker", response_model=InferenceBreakerStatsResponse)
+def get_inference_breaker_stats(current_user: User = Depends(get_current_admin)):
+    """Circuit breaker state, recent failure rate, latency percentiles and current timeout of the model endpoint."""
+    return InferenceBreakerStatsResponse(**inference_breaker.stats())
@@ -3,89 +3,308 @@ AI Feature routes: resume generation, cover letter, scoring, skill analysis, por
 These endpoints tie the AI engine to the API layer.
 """
 
+import json
 from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.database import get_db
-from app.models.models import User, Resume, CoverLetter, Portfolio, ResumeScore, SkillAnalysis
+from app.models.models import User, Resume, CoverLetter, Portfolio, ResumeScore, SkillAnalysis, JobDescription, GenerationJob
 from app.schemas.schemas import (
     AIResumeGenerateRequest, AICoverLetterGenerateRequest, AIPortfolioGenerateRequest,
     AIGenerationResponse, ResumeScoreRequest, ResumeScoreResponse,
-    SkillAnalysisRequest, SkillAnalysisResponse
+    ResumeScoreBatchRequest, ResumeScoreBatchItem, ResumeScoreBatchResponse,
+    ResumeRankRequest, ResumeRankItem, ResumeRankResponse,
+    JobMatchRequest, JobMatchItem, JobMatchResponse,
+    SkillAnalysisRequest, SkillAnalysisResponse, GenerationJobResponse, HedgedGenerationResponse
 )
-from app.utils.auth import get_current_user
-from app.ai_engine.resume_generator import generate_resume_with_ai
-from app.ai_engine.cover_letter_generator import generate_cover_letter
-from app.ai_engine.resume_scorer import analyze_resume_score
-from app.ai_engine.skill_analyzer import analyze_skill_gap
+from app.utils.auth import get_current_user, get_current_user_id
+from app.ai_engine.resume_generator import generate_resume_with_ai, generate_resume_rule_based, stream_resume_with_ai
+from app.ai_engine.cover_letter_generator import (
+    generate_cover_letter, generate_cover_letter_rule_based, stream_cover_letter,
+)
+from app.ai_engine.resume_scorer import analyze_resume_score, score_resume_against_many, rank_resumes_for_job
+from app.ai_engine.skill_analyzer import analyze_skill_gap, normalize_skill
 from app.ai_engine.portfolio_generator import generate_portfolio
 from app.ai_engine.pdf_generator import generate_resume_pdf
+from app.services.corpus import get_corpus_index
+from app.services.generation import (
+    load_resume_generation, load_cover_letter_generation, store_generated_resume, store_generated_cover_letter,
+    with_session,
+)
+from app.services.generation_jobs import submit_job, generation_worker
+from app.services.documents import resume_scoring_data, job_description_vector, job_description_tf
+from app.services.resume_profiles import get_resume_profile
+from app.services.jd_features import jd_features
+from app.services.job_index import get_job_index
+from app.services.resume_skills import get_resume_skills
+from app.services.score_cache import score_cache
+from app.services.skill_cooccurrence import skill_cooccurrence
+from app.services.skill_demand import record_analysis
 
 router = APIRouter(prefix="/api/ai", tags=["AI Features"])
 
 
+def _store_scores(db: Session, user_id: int, scored: List[Tuple[int, Dict[str, Any]]]) -> List[ResumeScoreResponse]:
+    """Insert many (resume_id, result) score rows with one INSERT ... RETURNING; the caller commits."""
+    if not scored:
+        return []
+    scores = db.scalars(
+        insert(ResumeScore).returning(ResumeScore, sort_by_parameter_order=True),
+        [
+            {
+                "user_id": user_id,
+                "resume_id": resume_id,
+                "overall_score": result["overall_score"],
+                "keyword_match_score": result["keyword_match_score"],
+                "format_score": result["format_score"],
+                "content_score": result["content_score"],
+                "missing_keywords": result["missing_keywords"],
+                "suggestions": result["suggestions"],
+                "detailed_analysis": result["detailed_analysis"],
+            }
+            for resume_id, result in scored
+        ],
+    ).all()
+    return [ResumeScoreResponse.model_validate(score) for score in scores]
+
+
+def _job_description_features(
+    db: Session, user_id: int, job_description: Optional[str], job_description_id: Optional[int],
+) -> Dict[str, Any]:
+    """
+    Term vector and skills of the JD a request refers to, as {"key", "text", "tf", "required_skills"}.
+    A stored JD (job_description_id) uses what was extracted at ingest; pasted text shares
+    the features of its near-duplicates (see app.services.jd_features).
+    """
+    if job_description_id is not None:
+        jd = db.query(JobDescription).filter(
+            JobDescription.id == job_description_id, JobDescription.user_id == user_id
+        ).first()
+        if not jd:
+            raise HTTPException(status_code=404, detail="Job description not found")
+        vector = job_description_vector(jd)
+        return {
+            "key": vector.content_hash,
+            "text": jd.description,
+            "tf": job_description_tf(vector),
+            "required_skills": jd.required_skills,
+        }
+    if not job_description:
+        raise HTTPException(status_code=400, detail="job_description or job_description_id is required")
+    # Near-duplicate JDs share the first copy's term vector and score cache entries
+    return jd_features.lookup(job_description)
+
+
 @router.post("/generate-resume", response_model=AIGenerationResponse)
-def ai_generate_resume(
+async def ai_generate_resume(
     req: AIResumeGenerateRequest,
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ):
     """Generate an ATS-optimized resume using AI."""
-    resume = db.query(Resume).filter(Resume.id == req.resume_id, Resume.user_id == current_user.id).first()
-    if not resume:
-        raise HTTPException(status_code=404, detail="Resume not found")
-
-    resume_data = {
-        "personal_info": resume.personal_info,
-        "education": resume.education,
-        "skills": resume.skills,
-        "projects": resume.projects,
-        "experience": resume.experience,
-        "internships": resume.internships,
-        "certifications": resume.certifications,
-        "achievements": resume.achievements,
-        "target_job_role": resume.target_job_role,
-    }
+    try:
+        resume_data = await run_in_threadpool(load_resume_generation, db, user_id, req.resume_id)
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
 
-    result = generate_resume_with_ai(resume_data, req.job_description)
+    result = await generate_resume_with_ai(resume_data, req.job_description)
 
     if result.get("success"):
-        resume.generated_content = result["generated_content"]
-        db.commit()
+        await run_in_threadpool(store_generated_resume, db, user_id, req.resume_id, result["generated_content"])
 
     return AIGenerationResponse(success=result["success"], message="Resume generated successfully", data=result)
 
 
 @router.post("/generate-cover-letter", response_model=AIGenerationResponse)
-def ai_generate_cover_letter(
+async def ai_generate_cover_letter(
     req: AICoverLetterGenerateRequest,
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ):
     """Generate a personalized cover letter."""
+    try:
+        args = await run_in_threadpool(
+            load_cover_letter_generation, db, user_id, req.cover_letter_id, req.resume_id,
+        )
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    result = await generate_cover_letter(**args)
+
+    if result.get("success"):
+        await run_in_threadpool(
+            store_generated_cover_letter, db, user_id, req.cover_letter_id, result["generated_content"],
+        )
+
+    return AIGenerationResponse(success=result["success"], message="Cover letter generated", data=result)
+
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def _sse_generation(
+    events: AsyncIterator[Dict[str, Any]],
+    store: Callable[[Session, int, int, str], str],
+    user_id: int,
+    target_id: int,
+) -> AsyncIterator[str]:
+    """
+    Relay generator events as server-sent events: "token" ({"text"}), "reset" (discard the
+    text so far) and finally "done" with the full result, sent once the content is stored.
+    """
+    async for event in events:
+        if event["event"] == "token":
+            yield _sse("token", {"text": event["text"]})
+        elif event["event"] == "reset":
+            yield _sse("reset", {})
+        else:
+            result = event["result"]
+            if result.get("success"):
+                # The request's session may already be closed; store with a session of our own
+                await run_in_threadpool(with_session, store, user_id, target_id, result["generated_content"])
+            yield _sse("done", result)
+
+
+def _sse_response(body: AsyncIterator[str]) -> StreamingResponse:
+    return StreamingResponse(
+        body,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/generate-resume/stream")
+async def ai_generate_resume_stream(
+    req: AIResumeGenerateRequest,
+    user_id: int = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+):
+    """Generate a resume, streaming it to the client as server-sent events."""
+    try:
+        resume_data = await run_in_threadpool(load_resume_generation, db, user_id, req.resume_id)
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    events = stream_resume_with_ai(resume_data, req.job_description)
+    return _sse_response(_sse_generation(events, store_generated_resume, user_id, req.resume_id))
+
+
+@router.post("/generate-cover-letter/stream")
+async def ai_generate_cover_letter_stream(
+    req: AICoverLetterGenerateRequest,
+    user_id: int = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+):
+    """Generate a cover letter, streaming it to the client as server-sent events."""
+    try:
+        args = await run_in_threadpool(
+            load_cover_letter_generation, db, user_id, req.cover_letter_id, req.resume_id,
+        )
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    events = stream_cover_letter(**args)
+    return _sse_response(_sse_generation(events, store_generated_cover_letter, user_id, req.cover_letter_id))
+
+
+@router.post("/generate-resume/hedged", response_model=HedgedGenerationResponse)
+def ai_generate_resume_hedged(
+    req: AIResumeGenerateRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Store and return the rule-based resume at once, and queue a job that replaces it with
+    the model's resume when that arrives (poll the returned job).
+    """
+    try:
+        resume_data = load_resume_generation(db, current_user.id, req.resume_id)
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    result = generate_resume_rule_based(resume_data, req.job_description)
+    content = result["generated_content"]
+    store_generated_resume(db, current_user.id, req.resume_id, content)
+    job = _submit(db, current_user.id, "resume", {**req.model_dump(), "upgrade": True, "replaces": content})
+    return HedgedGenerationResponse(success=True, message="Resume generated; AI version pending", data=result, job=job)
+
+
+@router.post("/generate-cover-letter/hedged", response_model=HedgedGenerationResponse)
+def ai_generate_cover_letter_hedged(
+    req: AICoverLetterGenerateRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Store and return the rule-based cover letter at once, and queue a job that replaces it
+    with the model's letter when that arrives (poll the returned job).
+    """
+    try:
+        args = load_cover_letter_generation(db, current_user.id, req.cover_letter_id, req.resume_id)
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    result = generate_cover_letter_rule_based(**args)
+    content = result["generated_content"]
+    store_generated_cover_letter(db, current_user.id, req.cover_letter_id, content)
+    job = _submit(db, current_user.id, "cover_letter", {**req.model_dump(), "upgrade": True, "replaces": content})
+    return HedgedGenerationResponse(
+        success=True, message="Cover letter generated; AI version pending", data=result, job=job,
+    )
+
+
+@router.post("/jobs/generate-resume", response_model=GenerationJobResponse, status_code=202)
+def submit_resume_generation(
+    req: AIResumeGenerateRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Queue resume generation and return the job at once; poll GET /api/ai/jobs/{job_id}."""
+    resume = db.query(Resume).filter(Resume.id == req.resume_id, Resume.user_id == current_user.id).first()
+    if not resume:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    return _submit(db, current_user.id, "resume", req.model_dump())
+
+
+@router.post("/jobs/generate-cover-letter", response_model=GenerationJobResponse, status_code=202)
+def submit_cover_letter_generation(
+    req: AICoverLetterGenerateRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Queue cover letter generation and return the job at once; poll GET /api/ai/jobs/{job_id}."""
     cl = db.query(CoverLetter).filter(CoverLetter.id == req.cover_letter_id, CoverLetter.user_id == current_user.id).first()
     if not cl:
         raise HTTPException(status_code=404, detail="Cover letter not found")
-
     resume = db.query(Resume).filter(Resume.id == req.resume_id, Resume.user_id == current_user.id).first()
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
+    return _submit(db, current_user.id, "cover_letter", req.model_dump())
 
-    resume_data = {
-        "personal_info": resume.personal_info,
-        "skills": resume.skills,
-        "experience": resume.experience,
-        "projects": resume.projects,
-        "education": resume.education,
-        "internships": resume.internships,
-    }
 
-    result = generate_cover_letter(resume_data, cl.company_name, cl.job_title, cl.job_description, cl.tone)
+def _submit(db: Session, user_id: int, kind: str, params: Dict[str, Any]) -> GenerationJob:
+    job = submit_job(db, user_id, kind, params)
+    db.commit()
+    db.refresh(job)
+    generation_worker.notify()
+    return job
 
-    if result.get("success"):
-        cl.generated_content = result["generated_content"]
-        db.commit()
 
-    return AIGenerationResponse(success=result["success"], message="Cover letter generated", data=result)
+@router.get("/jobs/{job_id}", response_model=GenerationJobResponse)
+def get_generation_job(
+    job_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Status of a generation job, with the generated content once it has succeeded."""
+    job = db.query(GenerationJob).filter(GenerationJob.id == job_id, GenerationJob.user_id == current_user.id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Generation job not found")
+    return job
 
 
 @router.post("/score-resume", response_model=ResumeScoreResponse)
@@ -99,20 +318,23 @@ def ai_score_resume(
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
 
-    resume_data = {
-        "personal_info": resume.personal_info,
-        "education": resume.education,
-        "skills": resume.skills,
-        "projects": resume.projects,
-        "experience": resume.experience,
-        "internships": resume.internships,
-        "certifications": resume.certifications,
-        "achievements": resume.achievements,
-        "generated_content": resume.generated_content,
-        "target_job_role": resume.target_job_role,
-    }
-
-    result = analyze_resume_score(resume_data, req.job_description)
+    # Unchanged resume + same JD: return the stored score instead of recomputing
+    features = _job_description_features(db, current_user.id, req.job_description, req.job_description_id)
+    cache_key = score_cache.key_for(resume, features["key"], mode=req.mode)
+    if req.use_cache:
+        cached = score_cache.get(db, cache_key)
+        if cached is not None:
+            return ResumeScoreResponse(**cached, cached=True)
+
+    corpus = get_corpus_index()
+    result = analyze_resume_score(
+        resume_scoring_data(resume), features["text"],
+        idf_lookup=corpus.bm25_idf if req.mode == "bm25" else corpus.idf,
+        profile=get_resume_profile(db, resume),
+        mode=req.mode,
+        avg_doc_length=corpus.avg_doc_length,
+        jd_tf=features["tf"],
+    )
 
     score = ResumeScore(
         user_id=current_user.id,
@@ -126,9 +348,102 @@ def ai_score_resume(
         detailed_analysis=result["detailed_analysis"],
     )
     db.add(score)
+    db.flush()
+    fields = score_cache.put(db, cache_key, score)
     db.commit()
-    db.refresh(score)
-    return score
+    return ResumeScoreResponse(**fields)
+
+
+@router.post("/score-resume/batch", response_model=ResumeScoreBatchResponse)
+def ai_score_resume_batch(
+    req: ResumeScoreBatchRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Score one resume against many job descriptions and return them ranked best first."""
+    resume = db.query(Resume).filter(Resume.id == req.resume_id, Resume.user_id == current_user.id).first()
+    if not resume:
+        raise HTTPException(status_code=404, detail="Resume not found")
+
+    corpus = get_corpus_index()
+    results = score_resume_against_many(
+        resume_scoring_data(resume), req.job_descriptions,
+        idf_lookup=corpus.idf, profile=get_resume_profile(db, resume),
+    )
+    responses = _store_scores(db, current_user.id, [(resume.id, result) for result in results])
+    db.commit()
+
+    ranked = sorted(range(len(responses)), key=lambda i: responses[i].overall_score, reverse=True)
+    return ResumeScoreBatchResponse(
+        resume_id=resume.id,
+        results=[
+            ResumeScoreBatchItem(rank=rank, job_index=i, score=responses[i])
+            for rank, i in enumerate(ranked, start=1)
+        ],
+    )
+
+
+@router.post("/rank-resumes", response_model=ResumeRankResponse)
+def ai_rank_resumes(
+    req: ResumeRankRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Rank all of the current user's resumes against one job description."""
+    resumes = db.query(Resume).filter(Resume.user_id == current_user.id).all()
+    if not resumes:
+        raise HTTPException(status_code=404, detail="No resumes found")
+
+    corpus = get_corpus_index()
+    results = rank_resumes_for_job(
+        [get_resume_profile(db, resume) for resume in resumes], req.job_description, idf_lookup=corpus.idf,
+    )
+    responses = _store_scores(db, current_user.id, [(resume.id, result) for resume, result in zip(resumes, results)])
+    db.commit()
+
+    ranked = sorted(range(len(resumes)), key=lambda i: responses[i].overall_score, reverse=True)[:req.top_k]
+    return ResumeRankResponse(
+        total_resumes=len(resumes),
+        results=[
+            ResumeRankItem(rank=rank, resume_id=resumes[i].id, title=resumes[i].title, score=responses[i])
+            for rank, i in enumerate(ranked, start=1)
+        ],
+    )
+
+
+@router.post("/match-jobs", response_model=JobMatchResponse)
+def ai_match_jobs(
+    req: JobMatchRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Find the stored job descriptions that best match a resume."""
+    resume = db.query(Resume).filter(Resume.id == req.resume_id, Resume.user_id == current_user.id).first()
+    if not resume:
+        raise HTTPException(status_code=404, detail="Resume not found")
+
+    profile = get_resume_profile(db, resume)
+    hits = get_job_index(db).search(db, current_user.id, profile["tf"], req.top_k)
+    db.commit()  # persist any refreshed section vectors
+
+    jds = {
+        jd.id: jd for jd in db.query(JobDescription).filter(
+            JobDescription.id.in_([jd_id for jd_id, _ in hits]), JobDescription.user_id == current_user.id,
+        )
+    }
+    results = []
+    for jd_id, similarity in hits:
+        jd = jds.get(jd_id)
+        if jd is None:  # deleted by another worker since indexing
+            continue
+        results.append(JobMatchItem(
+            rank=len(results) + 1,
+            job_description_id=jd.id,
+            title=jd.title,
+            company=jd.company,
+            match_score=round(similarity * 100, 1),
+        ))
+    return JobMatchResponse(resume_id=resume.id, results=results)
 
 
 @router.post("/skill-analysis", response_model=SkillAnalysisResponse)
@@ -138,7 +453,25 @@ def ai_skill_analysis(
     db: Session = Depends(get_db),
 ):
     """Analyze skill gaps between user skills and job requirements."""
-    result = analyze_skill_gap(req.job_description, req.user_skills, req.job_role)
+    user_skills = req.user_skills or []
+    user_skill_set = None
+    if req.resume_id is not None:
+        resume = db.query(Resume).filter(Resume.id == req.resume_id, Resume.user_id == current_user.id).first()
+        if not resume:
+            raise HTTPException(status_code=404, detail="Resume not found")
+        resume_skills = get_resume_skills(resume)
+        user_skill_set = resume_skills | {normalize_skill(s) for s in user_skills} if user_skills else resume_skills
+        user_skills = sorted(user_skill_set)
+    elif req.user_skills is None:
+        raise HTTPException(status_code=400, detail="user_skills or resume_id is required")
+
+    features = _job_description_features(db, current_user.id, req.job_description, req.job_description_id)
+    result = analyze_skill_gap(
+        features["text"], user_skills, req.job_role,
+        required_skills=jd_features.required_skills(features),
+        user_skill_set=user_skill_set,
+        skill_neighbours=skill_cooccurrence.neighbours,
+    )
 
     analysis = SkillAnalysis(
         user_id=current_user.id,
@@ -150,6 +483,7 @@ def ai_skill_analysis(
         recommendations=result["recommendations"],
     )
     db.add(analysis)
+    record_analysis(db, result["job_role"], result["required_skills"])
     db.commit()
     db.refresh(analysis)
     return analysis
@@ -0,0 +1,111 @@
+"""
+Job Description routes: store (one or in bulk), list, get, delete job descriptions.
+Skills and term vectors are extracted once at ingest; stored JDs feed the scoring corpus
+and the job matching index.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from typing import List
+from app.database import get_db
+from app.models.models import User, JobDescription
+from app.schemas.schemas import JobDescriptionCreate, JobDescriptionBulkCreate, JobDescriptionResponse
+from app.utils.auth import get_current_user
+from app.ai_engine.skill_analyzer import extract_skills_batch
+from app.services.corpus import get_corpus_index
+from app.services.documents import ingest_job_description, job_description_vector
+from app.services.jd_features import jd_features
+from app.services.job_index import get_job_index
+
+router = APIRouter(prefix="/api/job-descriptions", tags=["Job Descriptions"])
+
+
+@router.post("/", response_model=JobDescriptionResponse, status_code=status.HTTP_201_CREATED)
+def create_job_description(
+    data: JobDescriptionCreate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Store a job description, extracting its skills and term vector once at ingest."""
+    return _ingest(db, current_user.id, [data])[0]
+
+
+@router.post("/bulk", response_model=List[JobDescriptionResponse], status_code=status.HTTP_201_CREATED)
+def create_job_descriptions_bulk(
+    data: JobDescriptionBulkCreate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Store many job descriptions in one transaction."""
+    return _ingest(db, current_user.id, data.job_descriptions)
+
+
+def _ingest(db: Session, user_id: int, items: List[JobDescriptionCreate]) -> List[JobDescription]:
+    """Store JDs with their extracted skills and term vectors, and add them to the corpus and matching index."""
+    corpus = get_corpus_index()
+    skills, _ = extract_skills_batch([item.description for item in items])
+    jds = []
+    for item, required_skills in zip(items, skills):
+        jd = JobDescription(
+            user_id=user_id,
+            title=item.title,
+            company=item.company,
+            description=item.description,
+        )
+        tokens = ingest_job_description(jd, required_skills)
+        corpus.record_change(db, new_terms=set(tokens), new_length=len(tokens))
+        db.add(jd)
+        jds.append(jd)
+    db.commit()
+    index = get_job_index(db)
+    for jd in jds:
+        db.refresh(jd)
+        index.add(db, jd)
+        jd_features.lookup(jd.description)  # pasted copies of this posting reuse its features
+    return jds
+
+
+@router.get("/", response_model=List[JobDescriptionResponse])
+def get_all_job_descriptions(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Get all job descriptions stored by the current user."""
+    return db.query(JobDescription).filter(
+        JobDescription.user_id == current_user.id
+    ).order_by(JobDescription.created_at.desc()).all()
+
+
+@router.get("/{job_description_id}", response_model=JobDescriptionResponse)
+def get_job_description(
+    job_description_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Get a specific job description."""
+    jd = db.query(JobDescription).filter(
+        JobDescription.id == job_description_id, JobDescription.user_id == current_user.id
+    ).first()
+    if not jd:
+        raise HTTPException(status_code=404, detail="Job description not found")
+    return jd
+
+
+@router.delete("/{job_description_id}")
+def delete_job_description(
+    job_description_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Delete a job description and drop it from the matching index."""
+    jd = db.query(JobDescription).filter(
+        JobDescription.id == job_description_id, JobDescription.user_id == current_user.id
+    ).first()
+    if not jd:
+        raise HTTPException(status_code=404, detail="Job description not found")
+    vector = job_description_vector(jd)
+    get_corpus_index().record_change(db, old_terms=set(vector.term_counts), old_length=vector.token_count)
+    db.delete(jd)
+    db.commit()
+    get_job_index(db).remove(job_description_id)
+    return {"message": "Job description deleted successfully"}
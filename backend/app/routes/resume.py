@@ -9,6 +9,11 @@ from app.database import get_db
 from app.models.models import User, Resume
 from app.schemas.schemas import ResumeCreate, ResumeUpdate, ResumeResponse
 from app.utils.auth import get_current_user
+from app.services.corpus import get_corpus_index
+from app.services.documents import resume_scoring_data
+from app.services.resume_profiles import get_resume_profile, refresh_section_vectors, changed_sections
+from app.services.resume_index import get_resume_index
+from app.services.skill_suggest import skill_suggester
 
 router = APIRouter(prefix="/api/resumes", tags=["Resumes"])
 
@@ -20,6 +25,7 @@ def create_resume(
     db: Session = Depends(get_db),
 ):
     """Create a new resume."""
+    corpus = get_corpus_index()
     resume = Resume(
         user_id=current_user.id,
         title=data.title,
@@ -35,8 +41,13 @@ def create_resume(
         preferred_company=data.preferred_company,
     )
     db.add(resume)
+    db.flush()
+    profile = refresh_section_vectors(db, resume)
+    corpus.record_change(db, new_terms=set(profile["tf"]), new_length=profile["token_count"])
     db.commit()
     db.refresh(resume)
+    get_resume_index(db).add(db, resume, profile)
+    skill_suggester.observe(resume.id, resume.skills)
     return resume
 
 
@@ -74,6 +85,10 @@ def update_resume(
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
 
+    corpus = get_corpus_index()
+    old_data = resume_scoring_data(resume)
+    old_profile = get_resume_profile(db, resume)
+
     resume.title = data.title
     resume.personal_info = data.personal_info.model_dump() if data.personal_info else resume.personal_info
     resume.education = [e.model_dump() for e in data.education] if data.education else resume.education
@@ -86,8 +101,16 @@ def update_resume(
     resume.target_job_role = data.target_job_role or resume.target_job_role
     resume.preferred_company = data.preferred_company or resume.preferred_company
 
+    # Re-tokenize only the sections this update actually changed
+    profile = refresh_section_vectors(db, resume, changed_sections(old_data, resume_scoring_data(resume)))
+    corpus.record_change(
+        db, set(old_profile["tf"]), set(profile["tf"]),
+        old_length=old_profile["token_count"], new_length=profile["token_count"],
+    )
     db.commit()
     db.refresh(resume)
+    get_resume_index(db).add(db, resume, profile)
+    skill_suggester.observe(resume.id, resume.skills)
     return resume
 
 
@@ -101,6 +124,9 @@ def delete_resume(
     resume = db.query(Resume).filter(Resume.id == resume_id, Resume.user_id == current_user.id).first()
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
+    profile = get_resume_profile(db, resume)
+    get_corpus_index().record_change(db, old_terms=set(profile["tf"]), old_length=profile["token_count"])
     db.delete(resume)
     db.commit()
+    get_resume_index(db).remove(resume_id)
     return {"message": "Resume deleted successfully"}
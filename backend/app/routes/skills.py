@@ -0,0 +1,32 @@
+"""
+Skill routes: autocomplete over the skill taxonomy and skills listed on stored resumes.
+"""
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.models.models import User
+from app.schemas.schemas import SkillSuggestion, SkillSuggestResponse
+from app.utils.auth import get_current_user
+from app.ai_engine.skill_analyzer import skill_taxonomy
+from app.services.skill_suggest import skill_suggester, normalize_query
+
+router = APIRouter(prefix="/api/skills", tags=["Skills"])
+
+
+@router.get("/suggest", response_model=SkillSuggestResponse)
+def suggest_skills(
+    q: str = Query(..., max_length=100),
+    limit: int = Query(10, ge=1, le=10),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Skills completing a typed prefix, most popular first."""
+    taxonomy = skill_taxonomy.current()
+    return SkillSuggestResponse(
+        query=normalize_query(q),
+        suggestions=[
+            SkillSuggestion(skill=skill, category=taxonomy.category(skill), popularity=popularity)
+            for skill, popularity in skill_suggester.suggest(db, q, limit)
+        ],
+    )
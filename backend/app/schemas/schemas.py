@@ -4,7 +4,7 @@ All API input and output models defined here.
 """
 
 from pydantic import BaseModel, EmailStr, Field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime
 
 
@@ -203,6 +203,9 @@ class JobDescriptionCreate(BaseModel):
     company: Optional[str] = None
     description: str
 
+class JobDescriptionBulkCreate(BaseModel):
+    job_descriptions: List[JobDescriptionCreate] = Field(..., min_length=1, max_length=200)
+
 class JobDescriptionResponse(BaseModel):
     id: int
     user_id: int
@@ -220,7 +223,10 @@ class JobDescriptionResponse(BaseModel):
 
 class ResumeScoreRequest(BaseModel):
     resume_id: int
-    job_description: str
+    job_description: Optional[str] = None
+    job_description_id: Optional[int] = None  # a stored JD; used instead of job_description
+    use_cache: bool = True  # reuse the stored score of an identical resume/JD pair
+    mode: Literal["tfidf", "bm25"] = "tfidf"
 
 class ResumeScoreResponse(BaseModel):
     id: int
@@ -233,17 +239,62 @@ class ResumeScoreResponse(BaseModel):
     suggestions: Optional[List[str]] = None
     detailed_analysis: Optional[str] = None
     created_at: Optional[datetime] = None
+    cached: bool = False
 
     class Config:
         from_attributes = True
 
+class ResumeScoreBatchRequest(BaseModel):
+    resume_id: int
+    job_descriptions: List[str] = Field(..., min_length=1, max_length=200)
+
+class ResumeScoreBatchItem(BaseModel):
+    rank: int
+    job_index: int  # position in the request's job_descriptions list
+    score: ResumeScoreResponse
+
+class ResumeScoreBatchResponse(BaseModel):
+    resume_id: int
+    results: List[ResumeScoreBatchItem]
+
+class JobMatchRequest(BaseModel):
+    resume_id: int
+    top_k: int = Field(10, ge=1, le=100)
+
+class JobMatchItem(BaseModel):
+    rank: int
+    job_description_id: int
+    title: str
+    company: Optional[str] = None
+    match_score: float  # cosine similarity of TF-IDF vectors, in percent
+
+class JobMatchResponse(BaseModel):
+    resume_id: int
+    results: List[JobMatchItem]
+
+class ResumeRankRequest(BaseModel):
+    job_description: str
+    top_k: int = Field(5, ge=1, le=50)
+
+class ResumeRankItem(BaseModel):
+    rank: int
+    resume_id: int
+    title: str
+    score: ResumeScoreResponse
+
+class ResumeRankResponse(BaseModel):
+    total_resumes: int
+    results: List[ResumeRankItem]
+
 
 # ─────────────────── Skill Analysis Schemas ───────────────────
 
 class SkillAnalysisRequest(BaseModel):
     job_role: str
-    job_description: str
-    user_skills: List[str]
+    job_description: Optional[str] = None
+    job_description_id: Optional[int] = None  # a stored JD; used instead of job_description
+    user_skills: Optional[List[str]] = None
+    resume_id: Optional[int] = None  # analyze the skills of a stored resume (plus any user_skills)
 
 class SkillAnalysisResponse(BaseModel):
     id: int
@@ -259,6 +310,16 @@ class SkillAnalysisResponse(BaseModel):
         from_attributes = True
 
 
+class SkillSuggestion(BaseModel):
+    skill: str
+    category: Optional[str] = None
+    popularity: int  # number of stored resumes listing the skill
+
+class SkillSuggestResponse(BaseModel):
+    query: str
+    suggestions: List[SkillSuggestion]
+
+
 # ─────────────────── AI Generation Schemas ───────────────────
 
 class AIResumeGenerateRequest(BaseModel):
@@ -278,9 +339,99 @@ class AIGenerationResponse(BaseModel):
     message: str
     data: Optional[Dict[str, Any]] = None
 
+class GenerationJobResponse(BaseModel):
+    id: int
+    kind: str
+    status: str  # queued, running, succeeded, failed, superseded, kept_rule_based
+    result: Optional[Dict[str, Any]] = None  # same as AIGenerationResponse.data once succeeded
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class HedgedGenerationResponse(BaseModel):
+    success: bool
+    message: str
+    data: Dict[str, Any]  # the rule-based result, already stored
+    job: GenerationJobResponse  # replaces it with the model's result; poll GET /api/ai/jobs/{id}
+
 
 # ─────────────────── Admin Schemas ───────────────────
 
+class CandidateSearchRequest(BaseModel):
+    job_description: str
+    page: int = Field(1, ge=1)
+    page_size: int = Field(20, ge=1, le=100)
+
+class CandidateMatchItem(BaseModel):
+    rank: int
+    resume_id: int
+    user_id: int
+    title: str
+    candidate_name: Optional[str] = None
+    target_job_role: Optional[str] = None
+    match_score: float  # cosine similarity of TF-IDF vectors, in percent
+
+class CandidateSearchResponse(BaseModel):
+    page: int
+    page_size: int
+    has_more: bool
+    results: List[CandidateMatchItem]
+
+class SkillDemandItem(BaseModel):
+    skill: str
+    count: int
+    share: float  # percent of the role's analyses that required the skill
+
+class SkillDemandResponse(BaseModel):
+    job_role: Optional[str] = None  # None = all roles
+    bucket: str  # "YYYY-MM" or "all"
+    total_analyses: int
+    skills: List[SkillDemandItem]
+
+class SkillExtractionBatchRequest(BaseModel):
+    job_descriptions: List[str] = Field(..., min_length=1, max_length=10000)
+
+class SkillExtractionBatchResponse(BaseModel):
+    skills: List[List[str]]  # per job description, in request order
+    count: int
+    workers: int  # worker processes that ran the batch (1 when it ran in-process)
+    seconds: float
+    jds_per_second: float
+
+class LLMCacheStatsResponse(BaseModel):
+    entries: int
+    bytes: int
+    memory_hits: int
+    persistent_hits: int
+    misses: int
+    hit_rate: float
+    evictions: int
+    expirations: int
+    persistent: bool
+    errors: int
+
+class SingleFlightStatsResponse(BaseModel):
+    in_flight: int
+    leaders: int
+    followers: int  # callers that joined a call already running in this worker
+    remote_followers: int  # calls answered by another worker's result
+    shared: bool
+
+class InferenceBreakerStatsResponse(BaseModel):
+    state: str  # closed, open or half_open
+    window_calls: int
+    window_failures: int
+    failure_rate: float
+    opened: int
+    rejected: int  # calls sent to the rule-based generators while open
+    latency_p50_ms: Optional[float] = None
+    latency_p95_ms: Optional[float] = None
+    timeout_seconds: float
+
 class AdminDashboardResponse(BaseModel):
     total_users: int
     total_resumes: int
@@ -0,0 +1,144 @@
+"""
+Circuit breaker and adaptive timeout for the inference endpoint.
+Tracks the outcome of recent upstream calls; once too many of them fail the breaker opens
+and generations go straight to the rule-based generators instead of waiting out a cold or
+rate-limited model. After a cool-down one probe call is let through, and its outcome
+closes or re-opens the breaker. Call timeouts follow the observed p95 latency.
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from app.config import settings
+
+# Successful call latencies kept for the percentile estimates
+LATENCY_SAMPLES = 200
+
+
+class CircuitBreaker:
+    """Failure-rate circuit breaker (closed → open → half-open) with a p95-based timeout."""
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        min_calls: int = 10,
+        window_seconds: float = 60.0,
+        open_seconds: float = 30.0,
+        min_timeout: float = 5.0,
+        max_timeout: float = 60.0,
+        timeout_multiplier: float = 2.0,
+    ):
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.window_seconds = window_seconds
+        self.open_seconds = open_seconds
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.timeout_multiplier = timeout_multiplier
+        self.state = "closed"
+        self.opened = 0
+        self.rejected = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a call may go upstream now (False means use the fallback)."""
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and time.monotonic() - self._opened_at >= self.open_seconds:
+                self.state = "half_open"
+            if self.state == "half_open" and not self._probing:
+                self._probing = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record(self, success: bool, latency: Optional[float] = None) -> None:
+        """Report the outcome of an allowed call (latency only for complete, non-streamed calls)."""
+        now = time.monotonic()
+        with self._lock:
+            if success and latency is not None:
+                self._latencies.append(latency)
+            if self.state == "open":
+                return  # a call that started before the breaker opened
+            if self.state == "half_open":
+                self._probing = False
+                if success:
+                    self.state = "closed"
+                    self._outcomes.clear()
+                else:
+                    self._open(now)
+                return
+            self._outcomes.append((now, success))
+            self._trim(now)
+            calls = len(self._outcomes)
+            failures = sum(1 for _, ok in self._outcomes if not ok)
+            if calls >= self.min_calls and failures / calls >= self.failure_rate:
+                self._open(now)
+
+    def release(self) -> None:
+        """End an allowed call without an outcome (the caller gave up), freeing the probe slot."""
+        with self._lock:
+            self._probing = False
+
+    def _open(self, now: float) -> None:
+        self.state = "open"
+        self.opened += 1
+        self._opened_at = now
+        self._outcomes.clear()
+
+    def _trim(self, now: float) -> None:
+        while self._outcomes and now - self._outcomes[0][0] > self.window_seconds:
+            self._outcomes.popleft()
+
+    def _percentile(self, q: float) -> Optional[float]:
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1)]
+
+    def timeout(self) -> float:
+        """Upstream call timeout: a multiple of the p95 latency, within [min_timeout, max_timeout]."""
+        with self._lock:
+            # Probes get the full timeout, so an endpoint that became slower can still close the breaker
+            if self.state != "closed" or len(self._latencies) < self.min_calls:
+                return self.max_timeout
+            p95 = self._percentile(0.95)
+        return max(self.min_timeout, min(self.max_timeout, p95 * self.timeout_multiplier))
+
+    def stats(self) -> Dict[str, Any]:
+        timeout = self.timeout()
+        with self._lock:
+            self._trim(time.monotonic())
+            calls = len(self._outcomes)
+            failures = sum(1 for _, ok in self._outcomes if not ok)
+            p50, p95 = self._percentile(0.5), self._percentile(0.95)
+            return {
+                "state": self.state,
+                "window_calls": calls,
+                "window_failures": failures,
+                "failure_rate": round(failures / calls, 4) if calls else 0.0,
+                "opened": self.opened,
+                "rejected": self.rejected,
+                "latency_p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+                "latency_p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+                "timeout_seconds": round(timeout, 3),
+            }
+
+
+inference_breaker = CircuitBreaker(
+    failure_rate=settings.HF_BREAKER_FAILURE_RATE,
+    min_calls=settings.HF_BREAKER_MIN_CALLS,
+    window_seconds=settings.HF_BREAKER_WINDOW_SECONDS,
+    open_seconds=settings.HF_BREAKER_OPEN_SECONDS,
+    min_timeout=settings.HF_TIMEOUT_MIN_SECONDS,
+    max_timeout=settings.HF_TIMEOUT_SECONDS,
+    timeout_multiplier=settings.HF_TIMEOUT_P95_MULTIPLIER,
+)
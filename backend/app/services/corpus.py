@@ -0,0 +1,203 @@
+"""
+Corpus-wide IDF index for resume scoring.
+Document frequencies of every scoring term across stored resumes and job descriptions
+are persisted in `corpus_terms`, loaded into memory once per worker, and updated
+incrementally whenever a document is added, changed, or removed. In-memory counts follow
+the table: a change is applied to them only once the transaction that wrote it commits.
+"""
+
+import itertools
+import math
+import threading
+import time
+from typing import Dict, Iterable, Optional, Set
+
+from sqlalchemy import bindparam, event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.ai_engine.inverted_index import normalize_weights
+from app.models.models import CorpusTerm, CorpusStat, Resume, JobDescription
+from app.services.documents import resume_scoring_data, job_description_tokens
+from app.utils.db import upsert_add
+from app.ai_engine.resume_scorer import tokenize, extract_resume_text, corpus_idf
+
+MAX_TERM_LENGTH = 100
+DOC_COUNT = "doc_count"
+TOTAL_LENGTH = "total_length"
+# Session.info key for changes recorded in the session's open transaction
+PENDING_CHANGES = "corpus_pending_changes"
+
+
+class CorpusIndex:
+    """In-memory document-frequency table backed by the corpus_terms table."""
+
+    def __init__(self, refresh_seconds: int = 300):
+        self.refresh_seconds = refresh_seconds
+        self.doc_freq: Dict[str, int] = {}
+        self.doc_count = 0
+        self.total_length = 0.0
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    # ── Lookups ──
+
+    def idf(self, terms: Iterable[str]) -> Dict[str, float]:
+        """IDF weights for the given terms: O(len(terms)) dictionary lookups."""
+        return corpus_idf(self.doc_freq, self.doc_count, terms)
+
+    def bm25_idf(self, terms: Iterable[str]) -> Dict[str, float]:
+        """BM25 (Robertson-Sparck Jones, non-negative) IDF weights for the given terms."""
+        n = self.doc_count
+        df = self.doc_freq
+        return {t: math.log(1 + (n - df.get(t, 0) + 0.5) / (df.get(t, 0) + 0.5)) for t in terms}
+
+    @property
+    def avg_doc_length(self) -> float:
+        return self.total_length / self.doc_count if self.doc_count else 0.0
+
+    def tfidf(self, tf: Dict[str, float]) -> Dict[str, float]:
+        """Unit-length TF-IDF vector for a term-frequency vector."""
+        idf = self.idf(tf.keys())
+        return normalize_weights({term: value * idf[term] for term, value in tf.items()})
+
+    # ── Loading ──
+
+    def ensure_loaded(self) -> "CorpusIndex":
+        """Load the table on first use and reload it periodically to pick up other workers' writes."""
+        loaded_at = self._loaded_at
+        if loaded_at is not None and time.monotonic() - loaded_at < self.refresh_seconds:
+            return self
+        with self._lock:
+            if self._loaded_at is None or time.monotonic() - self._loaded_at >= self.refresh_seconds:
+                self._load()
+        return self
+
+    def _load(self) -> None:
+        """
+        Read the committed table in a session of its own, so the counts never include a caller's
+        uncommitted changes (those are applied when it commits) and its transaction is left alone.
+        """
+        db = SessionLocal()
+        try:
+            if not self._read(db):
+                self._rebuild(db)
+        finally:
+            db.close()
+        self._loaded_at = time.monotonic()
+
+    def _read(self, db: Session) -> bool:
+        stats = {stat.name: stat.value for stat in db.query(CorpusStat)}
+        if DOC_COUNT not in stats or TOTAL_LENGTH not in stats:
+            return False
+        self.doc_count = int(stats[DOC_COUNT])
+        self.total_length = stats[TOTAL_LENGTH]
+        self.doc_freq = {term: df for term, df in db.query(CorpusTerm.term, CorpusTerm.doc_freq) if df > 0}
+        return True
+
+    def _rebuild(self, db: Session) -> None:
+        """Build the table from every stored resume and job description (first run only)."""
+        doc_freq: Dict[str, int] = {}
+        doc_count = 0
+        total_length = 0
+        documents = (
+            tokenize(extract_resume_text(resume_scoring_data(resume)))
+            for resume in db.query(Resume).yield_per(500)
+        )
+        jd_documents = (job_description_tokens(jd) for jd in db.query(JobDescription).yield_per(500))
+        for tokens in itertools.chain(documents, jd_documents):
+            for term in set(tokens):
+                doc_freq[term] = doc_freq.get(term, 0) + 1
+            doc_count += 1
+            total_length += len(tokens)
+        doc_freq = {t: df for t, df in doc_freq.items() if len(t) <= MAX_TERM_LENGTH}
+
+        try:
+            db.query(CorpusTerm).delete()
+            db.query(CorpusStat).filter(CorpusStat.name.in_([DOC_COUNT, TOTAL_LENGTH])).delete()
+            if doc_freq:
+                db.bulk_insert_mappings(CorpusTerm, [{"term": t, "doc_freq": df} for t, df in doc_freq.items()])
+            db.add(CorpusStat(name=DOC_COUNT, value=doc_count))
+            db.add(CorpusStat(name=TOTAL_LENGTH, value=total_length))
+            db.commit()
+        except IntegrityError:
+            # Another worker built it first; use theirs
+            db.rollback()
+            self._read(db)
+            return
+
+        self.doc_freq = doc_freq
+        self.doc_count = doc_count
+        self.total_length = float(total_length)
+
+    # ── Incremental updates ──
+
+    def record_change(
+        self,
+        db: Session,
+        old_terms: Optional[Set[str]] = None,
+        new_terms: Optional[Set[str]] = None,
+        old_length: int = 0,
+        new_length: int = 0,
+    ) -> None:
+        """
+        Apply one document change to the table.
+        old_terms=None means the document is new; new_terms=None means it was deleted.
+        Lengths are token counts, used for the BM25 average document length.
+        Writes join the caller's transaction; the caller commits, and the in-memory counts
+        pick the change up only then (a rollback drops it).
+        """
+        doc_delta = (1 if old_terms is None else 0) - (1 if new_terms is None else 0)
+        old_terms = {t for t in (old_terms or ()) if len(t) <= MAX_TERM_LENGTH}
+        new_terms = {t for t in (new_terms or ()) if len(t) <= MAX_TERM_LENGTH}
+        added = new_terms - old_terms
+        removed = old_terms - new_terms
+
+        upsert_add(db, CorpusTerm, "term", "doc_freq", {t: 1 for t in added})
+        if removed:
+            table = CorpusTerm.__table__
+            db.execute(
+                table.update()
+                .where(table.c.term == bindparam("t"))
+                .values(doc_freq=table.c.doc_freq - 1),
+                [{"t": t} for t in removed],
+            )
+        length_delta = new_length - old_length
+        stat_deltas = {name: delta for name, delta in ((DOC_COUNT, doc_delta), (TOTAL_LENGTH, length_delta)) if delta}
+        upsert_add(db, CorpusStat, "name", "value", stat_deltas)
+
+        db.info.setdefault(PENDING_CHANGES, []).append((added, removed, doc_delta, length_delta))
+
+    def _apply(self, added: Set[str], removed: Set[str], doc_delta: int, length_delta: int) -> None:
+        with self._lock:
+            for t in added:
+                self.doc_freq[t] = self.doc_freq.get(t, 0) + 1
+            for t in removed:
+                df = self.doc_freq.get(t, 0) - 1
+                if df > 0:
+                    self.doc_freq[t] = df
+                else:
+                    self.doc_freq.pop(t, None)
+            self.doc_count = max(0, self.doc_count + doc_delta)
+            self.total_length = max(0.0, self.total_length + length_delta)
+
+
+corpus_index = CorpusIndex(refresh_seconds=settings.CORPUS_REFRESH_SECONDS)
+
+
+def get_corpus_index() -> CorpusIndex:
+    """Return the worker-wide corpus index, loading it on first use."""
+    return corpus_index.ensure_loaded()
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _apply_committed_changes(session: Session) -> None:
+    for change in session.info.pop(PENDING_CHANGES, ()):
+        corpus_index._apply(*change)
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _drop_rolled_back_changes(session: Session) -> None:
+    session.info.pop(PENDING_CHANGES, None)
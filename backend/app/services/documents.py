@@ -0,0 +1,72 @@
+"""
+Helpers that turn stored resumes and job descriptions into scoring input.
+Shared by the routes and the indexing services so every consumer sees the same text.
+"""
+
+import hashlib
+from collections import Counter
+from typing import Dict, Any, List, Optional
+from app.models.models import Resume, JobDescription, JobDescriptionVector
+from app.ai_engine.resume_scorer import tokenize
+from app.ai_engine.skill_analyzer import extract_skills_from_text
+
+
+def resume_scoring_data(resume: Resume) -> Dict[str, Any]:
+    """Collect the resume fields used by the scorer."""
+    return {
+        "personal_info": resume.personal_info,
+        "education": resume.education,
+        "skills": resume.skills,
+        "projects": resume.projects,
+        "experience": resume.experience,
+        "internships": resume.internships,
+        "certifications": resume.certifications,
+        "achievements": resume.achievements,
+        "generated_content": resume.generated_content,
+        "target_job_role": resume.target_job_role,
+    }
+
+
+def normalize_job_description(text: str) -> str:
+    """Case- and whitespace-insensitive form of a JD (scoring ignores both)."""
+    return " ".join(text.lower().split())
+
+
+def job_description_hash(text: str) -> str:
+    """Content hash of a JD's normalized text; equal for copies that only differ in case or spacing."""
+    return hashlib.sha256(normalize_job_description(text).encode("utf-8")).hexdigest()
+
+
+def job_description_tokens(jd: JobDescription) -> List[str]:
+    """Scoring tokens of a stored job description."""
+    return tokenize(jd.description or "")
+
+
+def ingest_job_description(jd: JobDescription, required_skills: Optional[List[str]] = None) -> List[str]:
+    """
+    Extract the required skills and term counts of a job description and attach them
+    to it, so scoring and skill analysis never reprocess its text. Returns its tokens.
+    Bulk ingest passes skills already extracted in a batch.
+    """
+    text = jd.description or ""
+    tokens = tokenize(text)
+    jd.required_skills = required_skills if required_skills is not None else extract_skills_from_text(text)
+    vector = jd.vector or JobDescriptionVector()
+    vector.content_hash = job_description_hash(text)
+    vector.term_counts = dict(Counter(tokens))
+    vector.token_count = len(tokens)
+    jd.vector = vector
+    return tokens
+
+
+def job_description_vector(jd: JobDescription) -> JobDescriptionVector:
+    """Stored term vector of a JD, backfilled for rows stored before ingestion existed (the caller commits)."""
+    if jd.vector is None or jd.required_skills is None:
+        ingest_job_description(jd)
+    return jd.vector
+
+
+def job_description_tf(vector: JobDescriptionVector) -> Dict[str, float]:
+    """Term frequencies (as compute_tf returns them) from a stored JD vector."""
+    total = vector.token_count or 1
+    return {term: count / total for term, count in vector.term_counts.items()}
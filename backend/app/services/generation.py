@@ -0,0 +1,138 @@
+"""
+Loading AI generation inputs and storing generated content.
+These are synchronous; async routes run them in the threadpool, so database I/O never
+blocks the event loop and no connection is held while the model generates.
+"""
+
+from typing import Any, Dict, Optional
+from sqlalchemy.orm import Session
+from app.database import SessionLocal
+from app.models.models import Resume, CoverLetter
+from app.services.corpus import get_corpus_index
+from app.services.resume_index import get_resume_index
+from app.services.resume_profiles import get_resume_profile, refresh_section_vectors
+
+RESUME_FIELDS = (
+    "personal_info", "education", "skills", "projects", "experience",
+    "internships", "certifications", "achievements", "target_job_role",
+)
+COVER_LETTER_RESUME_FIELDS = ("personal_info", "skills", "experience", "projects", "education", "internships")
+
+# Outcomes of storing generated content
+STORED = "stored"
+MISSING = "missing"  # the resume or cover letter was deleted meanwhile
+SUPERSEDED = "superseded"  # its content changed since the expected text was stored
+
+
+def _get_resume(db: Session, user_id: int, resume_id: int) -> Optional[Resume]:
+    return db.query(Resume).filter(Resume.id == resume_id, Resume.user_id == user_id).first()
+
+
+def _get_cover_letter(db: Session, user_id: int, cover_letter_id: int) -> Optional[CoverLetter]:
+    return db.query(CoverLetter).filter(CoverLetter.id == cover_letter_id, CoverLetter.user_id == user_id).first()
+
+
+def with_session(fn, *args):
+    """Call fn(db, *args) with a session of its own, for work outside a request's session."""
+    db = SessionLocal()
+    try:
+        return fn(db, *args)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def load_resume_generation(db: Session, user_id: int, resume_id: int) -> Dict[str, Any]:
+    """Resume data for generate_resume_with_ai. Raises LookupError if the user has no such resume."""
+    try:
+        resume = _get_resume(db, user_id, resume_id)
+        if not resume:
+            raise LookupError("Resume not found")
+        return {field: getattr(resume, field) for field in RESUME_FIELDS}
+    finally:
+        db.rollback()  # release the connection before the caller waits on the model
+
+
+def load_cover_letter_generation(db: Session, user_id: int, cover_letter_id: int, resume_id: int) -> Dict[str, Any]:
+    """
+    Keyword arguments for generate_cover_letter (resume_data, company_name, job_title,
+    job_description, tone). Raises LookupError if the cover letter or resume is not found.
+    """
+    try:
+        cl = _get_cover_letter(db, user_id, cover_letter_id)
+        if not cl:
+            raise LookupError("Cover letter not found")
+        resume = _get_resume(db, user_id, resume_id)
+        if not resume:
+            raise LookupError("Resume not found")
+        return {
+            "resume_data": {field: getattr(resume, field) for field in COVER_LETTER_RESUME_FIELDS},
+            "company_name": cl.company_name,
+            "job_title": cl.job_title,
+            "job_description": cl.job_description,
+            "tone": cl.tone,
+        }
+    finally:
+        db.rollback()
+
+
+def store_generated_resume(
+    db: Session, user_id: int, resume_id: int, content: str, expected: Optional[str] = None,
+) -> str:
+    """
+    Save generated resume content and re-index the resume. With expected, only replace
+    content that still equals it. Returns STORED, MISSING or SUPERSEDED.
+    """
+    # Lock the resume so concurrent generations for it apply their index updates in turn
+    resume = (
+        db.query(Resume)
+        .filter(Resume.id == resume_id, Resume.user_id == user_id)
+        .with_for_update()
+        .first()
+    )
+    if not resume:
+        db.rollback()
+        return MISSING
+    if expected is not None and resume.generated_content != expected:
+        db.rollback()
+        return SUPERSEDED
+    if resume.generated_content == content:
+        db.rollback()
+        return STORED
+    corpus = get_corpus_index()
+    old_profile = get_resume_profile(db, resume)
+    resume.generated_content = content
+    profile = refresh_section_vectors(db, resume, ["generated_content"])
+    corpus.record_change(
+        db, set(old_profile["tf"]), set(profile["tf"]),
+        old_length=old_profile["token_count"], new_length=profile["token_count"],
+    )
+    db.commit()
+    get_resume_index(db).add(db, resume, profile)
+    return STORED
+
+
+def store_generated_cover_letter(
+    db: Session, user_id: int, cover_letter_id: int, content: str, expected: Optional[str] = None,
+) -> str:
+    """
+    Save generated cover letter content. With expected, only replace content that still
+    equals it. Returns STORED, MISSING or SUPERSEDED.
+    """
+    cl = (
+        db.query(CoverLetter)
+        .filter(CoverLetter.id == cover_letter_id, CoverLetter.user_id == user_id)
+        .with_for_update()
+        .first()
+    )
+    if not cl:
+        db.rollback()
+        return MISSING
+    if expected is not None and cl.generated_content != expected:
+        db.rollback()
+        return SUPERSEDED
+    cl.generated_content = content
+    db.commit()
+    return STORED
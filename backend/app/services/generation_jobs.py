@@ -0,0 +1,206 @@
+"""
+Background AI generation jobs.
+Submitting stores a generation_jobs row and returns at once; a worker pool in each app
+process claims queued rows (a conditional status update, so several processes can share
+the queue), runs the generator, stores its output on the resume or cover letter, and
+records the result on the job for clients polling its status.
+"""
+
+import asyncio
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Set
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.models import GenerationJob
+from app.ai_engine.inference_client import inference_client
+from app.ai_engine.resume_generator import generate_resume_with_ai
+from app.ai_engine.cover_letter_generator import generate_cover_letter
+from app.services.generation import (
+    load_resume_generation, load_cover_letter_generation, store_generated_resume, store_generated_cover_letter,
+    with_session, MISSING, SUPERSEDED,
+)
+
+JOB_KINDS = ("resume", "cover_letter")
+# Claim candidates fetched per query; losing races for all of them just means polling again
+CLAIM_BATCH = 8
+# Running jobs older than this (their worker died) go back to the queue
+REQUEUE_AFTER = timedelta(seconds=settings.HF_TIMEOUT_SECONDS + 120)
+REQUEUE_CHECK_SECONDS = 60
+
+
+def submit_job(db: Session, user_id: int, kind: str, params: Dict[str, Any]) -> GenerationJob:
+    """
+    Queue a generation job (the caller commits, then calls generation_worker.notify()).
+    With params["upgrade"] the job only stores a model result, and only while the content is
+    still the rule-based text in params["replaces"]; otherwise it ends as "superseded", or
+    as "kept_rule_based" when the model does not answer.
+    """
+    if kind not in JOB_KINDS:
+        raise ValueError(f"Unknown generation job kind: {kind}")
+    job = GenerationJob(user_id=user_id, kind=kind, status="queued", params=params)
+    db.add(job)
+    db.flush()
+    return job
+
+
+def claim_next_job(db: Session, worker: str) -> Optional[int]:
+    """Mark the oldest queued job as running for this worker and return its id."""
+    candidates = [
+        job_id for (job_id,) in
+        db.query(GenerationJob.id).filter(GenerationJob.status == "queued").order_by(GenerationJob.id).limit(CLAIM_BATCH)
+    ]
+    for job_id in candidates:
+        claimed = db.query(GenerationJob).filter(
+            GenerationJob.id == job_id, GenerationJob.status == "queued",
+        ).update({
+            "status": "running", "worker": worker, "started_at": datetime.now(timezone.utc),
+        }, synchronize_session=False)
+        db.commit()
+        if claimed:
+            return job_id
+    return None
+
+
+def requeue_stale_jobs(db: Session) -> int:
+    """Put jobs whose worker stopped reporting back in the queue."""
+    cutoff = datetime.now(timezone.utc) - REQUEUE_AFTER
+    count = db.query(GenerationJob).filter(
+        GenerationJob.status == "running", GenerationJob.started_at < cutoff,
+    ).update({"status": "queued", "worker": None}, synchronize_session=False)
+    db.commit()
+    return count
+
+
+def finish_job(
+    db: Session,
+    job_id: int,
+    worker: str,
+    result: Optional[Dict[str, Any]],
+    error: Optional[str] = None,
+    status: Optional[str] = None,
+) -> bool:
+    """
+    Record a job's outcome if this worker still holds its claim. Returns False (and records
+    nothing) when the job was requeued and claimed again, so only one run finishes it.
+    """
+    finished = db.query(GenerationJob).filter(
+        GenerationJob.id == job_id, GenerationJob.worker == worker, GenerationJob.status == "running",
+    ).update({
+        "status": status or ("failed" if error else "succeeded"),
+        "result": result,
+        "error": error,
+        "finished_at": datetime.now(timezone.utc),
+    }, synchronize_session=False)
+    db.commit()
+    return bool(finished)
+
+
+async def run_job(job_id: int, worker: str) -> None:
+    """Run one job claimed by this worker to completion, recording its result or error."""
+    job = await asyncio.to_thread(with_session, lambda db: db.get(GenerationJob, job_id))
+    if job is None:
+        return
+    params = job.params or {}
+    status = None
+    try:
+        if job.kind == "resume":
+            resume_id = params["resume_id"]
+            resume_data = await asyncio.to_thread(with_session, load_resume_generation, job.user_id, resume_id)
+            result = await generate_resume_with_ai(resume_data, params.get("job_description"))
+            store, target_id = store_generated_resume, resume_id
+        else:
+            cover_letter_id = params["cover_letter_id"]
+            args = await asyncio.to_thread(
+                with_session, load_cover_letter_generation, job.user_id, cover_letter_id, params["resume_id"],
+            )
+            result = await generate_cover_letter(**args)
+            store, target_id = store_generated_cover_letter, cover_letter_id
+        error = None
+        if not result.get("success"):
+            error = "Generation failed"
+        elif params.get("upgrade") and result.get("method") != "huggingface":
+            result, status = None, "kept_rule_based"
+            error = "The model did not respond; the rule-based content was kept"
+        else:
+            stored = await asyncio.to_thread(
+                with_session, store, job.user_id, target_id, result["generated_content"], params.get("replaces"),
+            )
+            if stored == MISSING:
+                error = "The resume or cover letter was deleted during generation"
+            elif stored == SUPERSEDED:
+                result, status = None, "superseded"
+                error = "The content was changed meanwhile and was kept"
+    except Exception as e:
+        result, error = None, str(e) or e.__class__.__name__
+    await asyncio.to_thread(with_session, finish_job, job_id, worker, result, error, status)
+
+
+class GenerationWorker:
+    """Runs queued generation jobs on an event loop in a background thread."""
+
+    def __init__(self, concurrency: int = 8, poll_seconds: float = 2.0):
+        self.concurrency = concurrency
+        self.poll_seconds = poll_seconds
+        self.worker_id = uuid.uuid4().hex
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def notify(self) -> None:
+        """Wake the worker after a job was committed to the queue."""
+        self._wake.set()
+
+    def start(self) -> None:
+        """Start the worker thread (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="generation-worker", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+
+    def _run(self) -> None:
+        asyncio.run(self._main())
+
+    async def _main(self) -> None:
+        running: Set[asyncio.Task] = set()
+        next_requeue = 0.0
+        loop = asyncio.get_running_loop()
+        while not self._stop.is_set():
+            self._wake.clear()
+            try:
+                if loop.time() >= next_requeue:
+                    await asyncio.to_thread(with_session, requeue_stale_jobs)
+                    next_requeue = loop.time() + REQUEUE_CHECK_SECONDS
+                while len(running) < self.concurrency:
+                    job_id = await asyncio.to_thread(with_session, claim_next_job, self.worker_id)
+                    if job_id is None:
+                        break
+                    task = loop.create_task(run_job(job_id, self.worker_id))
+                    running.add(task)
+                    task.add_done_callback(self._job_done(running))
+            except Exception as e:
+                print(f"Generation worker poll failed: {e}")
+            await asyncio.to_thread(self._wake.wait, self.poll_seconds)
+        if running:
+            await asyncio.wait(running)
+        await inference_client.aclose(all_loops=False)
+
+    def _job_done(self, running: Set[asyncio.Task]):
+        def done(task: asyncio.Task) -> None:
+            running.discard(task)
+            self._wake.set()  # a slot is free
+        return done
+
+
+generation_worker = GenerationWorker(
+    concurrency=settings.GENERATION_JOB_CONCURRENCY,
+    poll_seconds=settings.GENERATION_JOB_POLL_SECONDS,
+)
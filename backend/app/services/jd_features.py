@@ -0,0 +1,118 @@
+"""
+Shared features of the job descriptions pasted into the AI endpoints.
+Each distinct JD is tokenized once and its term vector and extracted skills are kept in
+memory. Near-duplicates (the same posting with whitespace, casing, or footer differences)
+are found through an exact-hash fast path and a MinHash/LSH index, and reuse the features
+of the first copy seen.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List
+
+from app.config import settings
+from app.ai_engine.minhash import LSHIndex, MinHasher, shingles
+from app.ai_engine.resume_scorer import tokenize, compute_tf
+from app.ai_engine.skill_analyzer import extract_skills_from_text, skill_taxonomy
+from app.services.documents import job_description_hash
+
+# Exact-hash shortcuts kept per posting; further variants still resolve through LSH
+MAX_ALIASES = 32
+
+
+class JobDescriptionFeatures:
+    """Worker-wide LRU of JD features with near-duplicate lookup."""
+
+    def __init__(self, max_size: int = 2048, threshold: float = 0.9, num_perm: int = 64, bands: int = 8):
+        self.max_size = max_size
+        self.threshold = threshold
+        self.hasher = MinHasher(num_perm=num_perm)
+        self.lsh = LSHIndex(bands=bands, rows=num_perm // bands)
+        self.exact_hits = 0
+        self.near_hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._aliases: Dict[str, str] = {}  # normalized-text hash -> entry key
+        self._lock = threading.Lock()
+
+    def lookup(self, text: str) -> Dict[str, Any]:
+        """
+        Features for a JD: {"key", "text", "tf", "token_count", "required_skills"}.
+        "text" is the first-seen copy of the posting and "key" its job_description_hash, so
+        results derived from it (scores, skills) can be shared by all its near-duplicates.
+        "required_skills" is (taxonomy source_hash, skills) once extracted; read skills with
+        required_skills().
+        """
+        text_hash = job_description_hash(text)
+        with self._lock:
+            entry = self._touch(self._aliases.get(text_hash))
+            if entry is not None:
+                self.exact_hits += 1
+                return entry
+
+        tokens = tokenize(text)
+        shingle_set = shingles(tokens)
+        signature = self.hasher.signature(shingle_set) if shingle_set else None
+
+        with self._lock:
+            match = self.lsh.nearest(signature, self.threshold) if signature else None
+            entry = self._touch(match[0]) if match else None
+            if entry is not None:
+                self.near_hits += 1
+                if len(entry["aliases"]) < MAX_ALIASES:
+                    self._aliases[text_hash] = entry["key"]
+                    entry["aliases"].append(text_hash)
+                return entry
+
+            self.misses += 1
+            entry = self._touch(self._aliases.get(text_hash))  # added concurrently
+            if entry is None:
+                entry = {
+                    "key": text_hash,
+                    "text": text,
+                    "tf": compute_tf(tokens),
+                    "token_count": len(tokens),
+                    "required_skills": None,
+                    "aliases": [text_hash],
+                }
+                self._entries[text_hash] = entry
+                self._aliases[text_hash] = text_hash
+                if signature:
+                    self.lsh.add(text_hash, signature)
+                self._evict()
+            return entry
+
+    def required_skills(self, entry: Dict[str, Any]) -> List[str]:
+        """
+        Skills extracted from the JD, computed on first use and shared by its near-duplicates.
+        Re-extracted when the skill taxonomy has been reloaded since.
+        """
+        source_hash = skill_taxonomy.current().source_hash
+        cached = entry["required_skills"]
+        if cached is not None and cached[0] == source_hash:
+            return cached[1]
+        skills = extract_skills_from_text(entry["text"])
+        entry["required_skills"] = (source_hash, skills)
+        return skills
+
+    def _touch(self, key):
+        if key is None:
+            return None
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_size:
+            key, entry = self._entries.popitem(last=False)
+            self.lsh.remove(key)
+            for alias in entry["aliases"]:
+                if self._aliases.get(alias) == key:
+                    del self._aliases[alias]
+
+
+jd_features = JobDescriptionFeatures(
+    max_size=settings.JD_FEATURE_CACHE_SIZE,
+    threshold=settings.JD_DUPLICATE_THRESHOLD,
+)
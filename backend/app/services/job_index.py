@@ -0,0 +1,99 @@
+"""
+Job matching index over stored job descriptions.
+Per-user inverted indexes of normalized TF-IDF job-description vectors, built once per worker,
+updated incrementally as JDs are created or deleted, and queried with a resume's term vector.
+A user's resumes are only ever matched against that user's own JDs.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session, contains_eager
+
+from app.config import settings
+from app.models.models import JobDescription, JobDescriptionVector
+from app.ai_engine.inverted_index import InvertedIndex
+from app.services.corpus import get_corpus_index
+from app.services.documents import job_description_tf, job_description_vector
+
+# Overlap when catching up on other workers' writes, to tolerate clock skew between writers
+SYNC_OVERLAP = timedelta(seconds=5)
+
+
+class JobIndex:
+    """Worker-wide inverted indexes of job descriptions, one per owning user."""
+
+    def __init__(self, refresh_seconds: int = 300):
+        self.refresh_seconds = refresh_seconds
+        self.indexes: Dict[int, InvertedIndex] = {}
+        self._owners: Dict[int, int] = {}  # job description id -> user id
+        self._last_updated: Optional[datetime] = None
+        self._synced_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def ensure_loaded(self, db: Session) -> "JobIndex":
+        """
+        Build the index on first use, then periodically pick up JDs stored by other workers.
+        JDs deleted elsewhere are filtered out when search hits are loaded.
+        """
+        synced_at = self._synced_at
+        if synced_at is not None and time.monotonic() - synced_at < self.refresh_seconds:
+            return self
+        with self._lock:
+            if self._synced_at is None or time.monotonic() - self._synced_at >= self.refresh_seconds:
+                query = (
+                    db.query(JobDescription)
+                    .outerjoin(JobDescription.vector)
+                    .options(contains_eager(JobDescription.vector))
+                )
+                if self._last_updated is not None:
+                    # JDs stored before ingestion have no vector yet; it is backfilled below
+                    query = query.filter(or_(
+                        JobDescriptionVector.updated_at >= self._last_updated - SYNC_OVERLAP,
+                        JobDescriptionVector.job_description_id.is_(None),
+                    ))
+                for jd in query.yield_per(500):
+                    self._add(db, jd)
+                db.commit()  # persist vectors backfilled for JDs stored before ingestion
+                self._synced_at = time.monotonic()
+        return self
+
+    def _add(self, db: Session, jd: JobDescription) -> None:
+        vector = job_description_vector(jd)
+        self._owners[jd.id] = jd.user_id
+        self.indexes.setdefault(jd.user_id, InvertedIndex()).add(
+            jd.id, get_corpus_index().tfidf(job_description_tf(vector))
+        )
+        if vector.updated_at is not None:  # None until a backfilled vector is flushed
+            updated = vector.updated_at.replace(tzinfo=None)
+            if self._last_updated is None or updated > self._last_updated:
+                self._last_updated = updated
+
+    def add(self, db: Session, jd: JobDescription) -> None:
+        """Index a newly stored job description (must have an id)."""
+        self.ensure_loaded(db)
+        self._add(db, jd)
+
+    def remove(self, jd_id: int) -> None:
+        index = self.indexes.get(self._owners.pop(jd_id, None))
+        if index is not None:
+            index.remove(jd_id)
+
+    def search(self, db: Session, user_id: int, resume_tf: Dict[str, float], k: int) -> List[Tuple[int, float]]:
+        """Top-k (job description id, cosine similarity) among a user's JDs for a resume term-frequency vector."""
+        self.ensure_loaded(db)
+        index = self.indexes.get(user_id)
+        if index is None:
+            return []
+        return index.search(get_corpus_index().tfidf(resume_tf), k)
+
+
+job_index = JobIndex(refresh_seconds=settings.CORPUS_REFRESH_SECONDS)
+
+
+def get_job_index(db: Session) -> JobIndex:
+    """Return the worker-wide job index, building it on first use."""
+    return job_index.ensure_loaded(db)
@@ -0,0 +1,138 @@
+"""
+Cache of inference responses in front of the HuggingFace client.
+Keyed by the inference client's request key (a hash of the model URL, prompt and generation
+parameters). An in-memory LRU with a TTL and a byte budget serves hot prompts; the optional
+llm_response_cache table keeps responses across restarts and shares them between workers.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.models import LLMResponseCacheEntry
+from app.utils.cache import TTLCache
+
+# Prune expired and excess rows of the persistent tier every this many writes
+PRUNE_EVERY = 100
+
+
+def _utf8_size(text: str) -> int:
+    return len(text.encode("utf-8"))
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+class LLMResponseCache:
+    """Two-tier response cache: memory LRU in front of the optional llm_response_cache table."""
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        max_bytes: int = 16 * 1024 * 1024,
+        ttl_seconds: int = 86400,
+        persistent: bool = False,
+        persistent_max_entries: int = 50000,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.persistent = persistent
+        self.persistent_max_entries = persistent_max_entries
+        self.memory = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds, max_bytes=max_bytes, sizeof=_utf8_size)
+        self.persistent_hits = 0
+        self.errors = 0
+        self._writes = 0
+
+    async def get(self, key: str) -> Optional[str]:
+        text = self.memory.get(key)
+        if text is not None or not self.persistent:
+            return text
+        text, remaining = await asyncio.to_thread(self._load, key)
+        if text is None:
+            return None
+        self.persistent_hits += 1
+        self.memory.put(key, text, ttl_seconds=remaining)
+        return text
+
+    async def put(self, key: str, text: str) -> None:
+        self.memory.put(key, text)
+        if self.persistent:
+            await asyncio.to_thread(self._store, key, text)
+
+    def _load(self, key: str) -> Tuple[Optional[str], float]:
+        db = SessionLocal()
+        try:
+            row = db.get(LLMResponseCacheEntry, key)
+            if row is None:
+                return None, 0.0
+            remaining = (_as_utc(row.expires_at) - datetime.now(timezone.utc)).total_seconds()
+            return (row.response, remaining) if remaining > 0 else (None, 0.0)
+        except Exception as e:
+            self.errors += 1
+            print(f"LLM cache read failed: {e}")
+            return None, 0.0
+        finally:
+            db.close()
+
+    def _store(self, key: str, text: str) -> None:
+        db = SessionLocal()
+        try:
+            now = datetime.now(timezone.utc)
+            db.merge(LLMResponseCacheEntry(
+                cache_key=key, response=text, created_at=now, expires_at=now + timedelta(seconds=self.ttl_seconds),
+            ))
+            self._writes += 1
+            if self._writes % PRUNE_EVERY == 0:
+                db.flush()
+                self._prune(db, now)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            self.errors += 1
+            print(f"LLM cache write failed: {e}")
+        finally:
+            db.close()
+
+    def _prune(self, db: Session, now: datetime) -> None:
+        """Drop expired rows, then the oldest rows beyond the persistent size limit."""
+        db.query(LLMResponseCacheEntry).filter(LLMResponseCacheEntry.expires_at <= now).delete(synchronize_session=False)
+        excess = (
+            db.query(LLMResponseCacheEntry.cache_key)
+            .order_by(LLMResponseCacheEntry.created_at.desc())
+            .offset(self.persistent_max_entries)
+            .subquery()
+        )
+        db.query(LLMResponseCacheEntry).filter(
+            LLMResponseCacheEntry.cache_key.in_(select(excess.c.cache_key))
+        ).delete(synchronize_session=False)
+
+    def stats(self) -> Dict[str, Any]:
+        memory = self.memory
+        lookups = memory.hits + memory.misses
+        hits = memory.hits + self.persistent_hits
+        return {
+            "entries": len(memory),
+            "bytes": memory.bytes,
+            "memory_hits": memory.hits,
+            "persistent_hits": self.persistent_hits,
+            "misses": memory.misses - self.persistent_hits,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "evictions": memory.evictions,
+            "expirations": memory.expirations,
+            "persistent": self.persistent,
+            "errors": self.errors,
+        }
+
+
+llm_cache = LLMResponseCache(
+    max_size=settings.LLM_CACHE_SIZE,
+    max_bytes=settings.LLM_CACHE_MAX_BYTES,
+    ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+    persistent=settings.LLM_CACHE_PERSISTENT,
+    persistent_max_entries=settings.LLM_CACHE_PERSISTENT_MAX_ENTRIES,
+)
@@ -0,0 +1,83 @@
+"""
+Candidate search index over all stored resumes.
+An inverted index of normalized TF-IDF resume vectors (built from the same tokenizer and
+section vectors as resume scoring), kept per worker and queried with a job description.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.models import Resume
+from app.ai_engine.inverted_index import InvertedIndex
+from app.ai_engine.resume_scorer import tokenize, compute_tf
+from app.services.corpus import get_corpus_index
+from app.services.resume_profiles import get_resume_profile
+
+# Overlap when catching up on other workers' edits, to tolerate clock skew between writers
+SYNC_OVERLAP = timedelta(seconds=5)
+
+
+class ResumeIndex:
+    """Worker-wide inverted index of resumes."""
+
+    def __init__(self, refresh_seconds: int = 300):
+        self.refresh_seconds = refresh_seconds
+        self.index = InvertedIndex()
+        self._last_updated: Optional[datetime] = None
+        self._synced_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def ensure_loaded(self, db: Session) -> "ResumeIndex":
+        """
+        Build the index on first use, then periodically re-index resumes changed by other workers.
+        Resumes deleted elsewhere are filtered out when search hits are loaded.
+        """
+        synced_at = self._synced_at
+        if synced_at is not None and time.monotonic() - synced_at < self.refresh_seconds:
+            return self
+        with self._lock:
+            if self._synced_at is None or time.monotonic() - self._synced_at >= self.refresh_seconds:
+                query = db.query(Resume)
+                if self._last_updated is not None:
+                    query = query.filter(Resume.updated_at >= self._last_updated - SYNC_OVERLAP)
+                for resume in query.yield_per(200):
+                    self._add(db, resume, get_resume_profile(db, resume))
+                db.commit()  # persist section vectors built for older resumes
+                self._synced_at = time.monotonic()
+        return self
+
+    def _add(self, db: Session, resume: Resume, profile: Dict[str, Any]) -> None:
+        self.index.add(resume.id, get_corpus_index().tfidf(profile["tf"]))
+        if resume.updated_at is not None:
+            updated = resume.updated_at.replace(tzinfo=None)
+            if self._last_updated is None or updated > self._last_updated:
+                self._last_updated = updated
+
+    def add(self, db: Session, resume: Resume, profile: Dict[str, Any]) -> None:
+        """Index (or re-index) a stored resume from its scoring profile."""
+        self.ensure_loaded(db)
+        self._add(db, resume, profile)
+
+    def remove(self, resume_id: int) -> None:
+        self.index.remove(resume_id)
+
+    def search(self, db: Session, job_description: str, k: int) -> List[Tuple[int, float]]:
+        """Top-k (resume id, cosine similarity) for a job description."""
+        self.ensure_loaded(db)
+        tokens = tokenize(job_description)
+        if not tokens:
+            return []
+        return self.index.search(get_corpus_index().tfidf(compute_tf(tokens)), k)
+
+
+resume_index = ResumeIndex(refresh_seconds=settings.CORPUS_REFRESH_SECONDS)
+
+
+def get_resume_index(db: Session) -> ResumeIndex:
+    """Return the worker-wide resume index, building it on first use."""
+    return resume_index.ensure_loaded(db)
@@ -0,0 +1,106 @@
+"""
+Per-resume scoring profiles (term vectors plus JD-independent scores).
+Term counts are persisted per resume section in `resume_section_vectors` and only the
+sections whose text changed are re-tokenized. Merged profiles are also cached per worker,
+keyed by resume id and a fingerprint of the scored fields.
+"""
+
+import hashlib
+import json
+from typing import Dict, Any, Iterable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.models import Resume, ResumeSectionVector
+from app.ai_engine.resume_scorer import build_resume_profile, extract_section_texts, section_term_counts
+from app.services.documents import resume_scoring_data
+from app.utils.cache import LRUCache
+from app.utils.db import upsert_replace
+
+PROFILE_CACHE_SIZE = 2048
+
+
+def resume_fingerprint(resume_data: Dict[str, Any]) -> str:
+    """Stable hash of the scored resume fields."""
+    payload = json.dumps(resume_data, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def changed_sections(old_data: Dict[str, Any], new_data: Dict[str, Any]) -> List[str]:
+    """Names of the scored sections whose text differs between two versions of a resume."""
+    old_texts = extract_section_texts(old_data)
+    new_texts = extract_section_texts(new_data)
+    return [section for section, text in new_texts.items() if old_texts.get(section) != text]
+
+
+resume_profiles = LRUCache(max_size=PROFILE_CACHE_SIZE)
+
+
+def refresh_section_vectors(
+    db: Session,
+    resume: Resume,
+    sections: Optional[Iterable[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Bring the stored section vectors of a resume up to date and return its merged profile.
+    Only the listed sections are re-tokenized; with sections=None every section is checked
+    against its stored content hash. Writes join the caller's transaction; the caller commits.
+    The resume must have an id (flush new resumes first).
+    """
+    resume_data = resume_scoring_data(resume)
+    texts = extract_section_texts(resume_data)
+    stored = {
+        section: (content_hash, term_counts)
+        for section, content_hash, term_counts in db.query(
+            ResumeSectionVector.section, ResumeSectionVector.content_hash, ResumeSectionVector.term_counts,
+        ).filter(ResumeSectionVector.resume_id == resume.id)
+    }
+    vectors = {section: term_counts for section, (_, term_counts) in stored.items()}
+
+    if sections is None:
+        sections = [
+            section for section, text in texts.items()
+            if (section in stored and stored[section][0] != _text_hash(text))
+            or (section not in stored and text.strip())
+        ]
+    # Upserts and bulk deletes, so concurrent refreshes of one resume (say, two requests
+    # lazily building the vectors of an old resume) overwrite each other instead of failing
+    upserts, emptied = [], []
+    for section in sections:
+        text = texts.get(section, "")
+        counts = section_term_counts(text)
+        if not counts:
+            if vectors.pop(section, None) is not None:
+                emptied.append(section)
+            continue
+        upserts.append({
+            "resume_id": resume.id, "section": section, "content_hash": _text_hash(text), "term_counts": counts,
+        })
+        vectors[section] = counts
+    upsert_replace(db, ResumeSectionVector, ("resume_id", "section"), upserts, ("content_hash", "term_counts"))
+    if emptied:
+        db.query(ResumeSectionVector).filter(
+            ResumeSectionVector.resume_id == resume.id, ResumeSectionVector.section.in_(emptied),
+        ).delete(synchronize_session=False)
+
+    merged: Dict[str, int] = {}
+    for term_counts in vectors.values():
+        for term, count in term_counts.items():
+            merged[term] = merged.get(term, 0) + count
+
+    profile = build_resume_profile(resume_data, term_counts=merged)
+    resume_profiles.put((resume.id, resume_fingerprint(resume_data)), profile)
+    return profile
+
+
+def get_resume_profile(db: Session, resume: Resume) -> Dict[str, Any]:
+    """Return the scoring profile of a resume from the worker cache or its stored section vectors."""
+    key = (resume.id, resume_fingerprint(resume_scoring_data(resume)))
+    profile = resume_profiles.get(key)
+    if profile is None:
+        profile = refresh_section_vectors(db, resume)
+    return profile
@@ -0,0 +1,28 @@
+"""
+Normalized skill sets of stored resumes, derived server-side for skill gap analysis.
+Cached per worker, keyed by resume id, a fingerprint of the skill-bearing fields, and the
+skill taxonomy version, so an edit or a taxonomy reload yields a fresh set.
+"""
+
+from typing import FrozenSet
+
+from app.models.models import Resume
+from app.ai_engine.skill_analyzer import extract_resume_skills, skill_taxonomy
+from app.services.resume_profiles import resume_fingerprint
+from app.utils.cache import LRUCache
+
+SKILL_SET_CACHE_SIZE = 2048
+SKILL_FIELDS = ("skills", "projects", "experience", "internships")
+
+resume_skill_sets = LRUCache(max_size=SKILL_SET_CACHE_SIZE)
+
+
+def get_resume_skills(resume: Resume) -> FrozenSet[str]:
+    """Normalized skills of a resume (listed skills, project technologies, bullets)."""
+    data = {field: getattr(resume, field) for field in SKILL_FIELDS}
+    key = (resume.id, resume_fingerprint(data), skill_taxonomy.current().source_hash)
+    skills = resume_skill_sets.get(key)
+    if skills is None:
+        skills = frozenset(extract_resume_skills(data))
+        resume_skill_sets.put(key, skills)
+    return skills
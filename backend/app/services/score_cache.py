@@ -0,0 +1,79 @@
+"""
+Content-addressed cache of resume scores.
+Keyed by a hash of the scored resume fields and the normalized job description text.
+Hot entries live in an in-memory LRU; every entry also points at its stored ResumeScore
+row, so repeated scoring of an unchanged resume returns that row instead of a new one.
+"""
+
+import hashlib
+from typing import Dict, Any, Optional
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.models import Resume, ResumeScore, ScoreCacheEntry
+from app.services.documents import resume_scoring_data
+from app.services.resume_profiles import resume_fingerprint
+from app.utils.cache import LRUCache
+from app.utils.db import upsert_replace
+
+# Bump when scoring logic changes so old entries stop matching
+SCORER_VERSION = "1"
+
+
+class ScoreCache:
+    """Two-tier score cache: memory LRU in front of the score_cache_entries table."""
+
+    def __init__(self, max_size: int = 4096):
+        self.memory = LRUCache(max_size=max_size)
+
+    def key_for(self, resume: Resume, jd_hash: str, mode: str = "") -> str:
+        """Cache key of a resume version scored against a JD (see documents.job_description_hash)."""
+        fingerprint = resume_fingerprint(resume_scoring_data(resume))
+        raw = f"{SCORER_VERSION}:{mode}:{resume.id}:{fingerprint}:{jd_hash}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, db: Session, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached score (as response fields) or None."""
+        cached = self.memory.get(key)
+        if cached is not None:
+            return cached
+        score = (
+            db.query(ResumeScore)
+            .join(ScoreCacheEntry, ScoreCacheEntry.score_id == ResumeScore.id)
+            .filter(ScoreCacheEntry.cache_key == key)
+            .first()
+        )
+        if score is None:
+            return None
+        cached = _score_fields(score)
+        self.memory.put(key, cached)
+        return cached
+
+    def put(self, db: Session, key: str, score: ResumeScore) -> Dict[str, Any]:
+        """
+        Record a freshly stored score row (must be flushed). The caller commits.
+        Upserted, so identical requests scored at the same time cannot conflict on the key.
+        """
+        upsert_replace(db, ScoreCacheEntry, ("cache_key",), [{"cache_key": key, "score_id": score.id}], ("score_id",))
+        cached = _score_fields(score)
+        self.memory.put(key, cached)
+        return cached
+
+
+def _score_fields(score: ResumeScore) -> Dict[str, Any]:
+    return {
+        "id": score.id,
+        "resume_id": score.resume_id,
+        "overall_score": score.overall_score,
+        "keyword_match_score": score.keyword_match_score,
+        "format_score": score.format_score,
+        "content_score": score.content_score,
+        "missing_keywords": score.missing_keywords,
+        "suggestions": score.suggestions,
+        "detailed_analysis": score.detailed_analysis,
+        "created_at": score.created_at,
+    }
+
+
+score_cache = ScoreCache(max_size=settings.SCORE_CACHE_SIZE)
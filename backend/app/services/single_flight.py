@@ -0,0 +1,148 @@
+"""
+Single-flight coalescing of identical inference requests.
+Concurrent calls with the same request key share one upstream call and all receive its
+result. Within a worker the first caller runs the call as a task the others await; in
+shared mode a row in inflight_generations also elects one leader across workers, and
+the other workers poll that row for the leader's result.
+"""
+
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.models import InflightGeneration
+
+# Finished rows older than this are deleted when a leader finishes
+FINISHED_RETENTION = timedelta(minutes=10)
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+class SingleFlight:
+    """Per-worker request coalescing, optionally shared across workers through the database."""
+
+    def __init__(self, shared: bool = False, poll_seconds: float = 0.25, lease_seconds: float = 90.0):
+        self.shared = shared
+        self.poll_seconds = poll_seconds
+        self.lease_seconds = lease_seconds
+        self.leaders = 0
+        self.followers = 0
+        self.remote_followers = 0
+        self._calls: Dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Optional[str]]]) -> Optional[str]:
+        """Run fn once for every concurrent caller with this key and return its result."""
+        loop = asyncio.get_running_loop()
+        task = self._calls.get(key)
+        if task is None or task.get_loop() is not loop:
+            self.leaders += 1
+            task = loop.create_task(self._run(key, fn))
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.followers += 1
+        # A caller that disconnects must not cancel the call the others are waiting on
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+    async def _run(self, key: str, fn: Callable[[], Awaitable[Optional[str]]]) -> Optional[str]:
+        if not self.shared:
+            return await fn()
+        deadline = time.monotonic() + self.lease_seconds
+        while True:
+            owner = uuid.uuid4().hex
+            state, result = await asyncio.to_thread(self._claim, key, owner)
+            if state == "leader":
+                result = None
+                try:
+                    result = await fn()
+                finally:
+                    await asyncio.to_thread(self._finish, key, owner, result)
+                return result
+            if state == "done":
+                self.remote_followers += 1
+                return result
+            if time.monotonic() >= deadline:
+                return await fn()  # the other worker's call outlived its lease
+            await asyncio.sleep(self.poll_seconds)
+
+    def _claim(self, key: str, owner: str) -> Tuple[str, Optional[str]]:
+        """
+        Become the leader for a key, or report that another worker is generating it
+        ("follower") or has just finished ("done", with its result).
+        """
+        db = SessionLocal()
+        try:
+            now = datetime.now(timezone.utc)
+            db.add(InflightGeneration(request_key=key, owner=owner, started_at=now))
+            try:
+                db.commit()
+                return "leader", None
+            except IntegrityError:
+                db.rollback()
+            row = db.get(InflightGeneration, key)
+            if row is None:
+                return "follower", None  # deleted meanwhile; claim again on the next poll
+            if row.finished_at is not None and now - _as_utc(row.finished_at) <= timedelta(seconds=self.poll_seconds * 2):
+                return "done", row.response
+            stale = row.finished_at is not None or now - _as_utc(row.started_at) > timedelta(seconds=self.lease_seconds)
+            if not stale:
+                return "follower", None
+            # Take over a finished or abandoned row, unless another worker got there first
+            claimed = db.query(InflightGeneration).filter(
+                InflightGeneration.request_key == key, InflightGeneration.owner == row.owner,
+            ).update({
+                "owner": owner, "started_at": now, "finished_at": None, "response": None,
+            }, synchronize_session=False)
+            db.commit()
+            return ("leader" if claimed else "follower"), None
+        except Exception as e:
+            db.rollback()
+            print(f"Single-flight claim failed: {e}")
+            return "leader", None  # without the database, generate locally
+        finally:
+            db.close()
+
+    def _finish(self, key: str, owner: str, result: Optional[str]) -> None:
+        db = SessionLocal()
+        try:
+            now = datetime.now(timezone.utc)
+            db.query(InflightGeneration).filter(
+                InflightGeneration.request_key == key, InflightGeneration.owner == owner,
+            ).update({"finished_at": now, "response": result}, synchronize_session=False)
+            db.query(InflightGeneration).filter(
+                InflightGeneration.finished_at < now - FINISHED_RETENTION,
+            ).delete(synchronize_session=False)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            print(f"Single-flight finish failed: {e}")
+        finally:
+            db.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "in_flight": len(self._calls),
+            "leaders": self.leaders,
+            "followers": self.followers,
+            "remote_followers": self.remote_followers,
+            "shared": self.shared,
+        }
+
+
+single_flight = SingleFlight(
+    shared=settings.GENERATION_SINGLE_FLIGHT_SHARED,
+    poll_seconds=settings.GENERATION_SINGLE_FLIGHT_POLL_SECONDS,
+    lease_seconds=settings.HF_TIMEOUT_SECONDS + 30,
+)
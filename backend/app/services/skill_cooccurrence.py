@@ -0,0 +1,185 @@
+"""
+Skill co-occurrence matrix over stored job descriptions and resumes.
+Each document contributes its normalized skill set plus a role item (JD title or resume
+target role); pair counts are kept sparse and turned into precomputed top-N neighbour
+lists (cosine-normalized counts), so ranking missing skills costs O(missing skills).
+
+A background thread catches up on new JDs and edited resumes every refresh interval and
+rebuilds everything periodically to drop documents deleted by other workers.
+"""
+
+import math
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, FrozenSet, Iterable, Optional, Set
+
+from sqlalchemy.orm import Session, selectinload
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.models import JobDescription, Resume
+from app.ai_engine.skill_analyzer import role_item
+from app.services.documents import job_description_vector
+from app.services.resume_skills import get_resume_skills
+
+# Overlap when catching up on edited resumes, to tolerate clock skew between writers
+SYNC_OVERLAP = timedelta(seconds=5)
+
+
+def _document_items(skills: Iterable[str], role: Optional[str]) -> FrozenSet[str]:
+    role = role_item(role)
+    return frozenset(skills) | {role} if role else frozenset(skills)
+
+
+class _Matrix:
+    """Sparse symmetric co-occurrence counts and the item set of every counted document."""
+
+    def __init__(self):
+        self.pairs: Dict[str, Counter] = {}
+        self.doc_freq: Counter = Counter()
+        self.documents: Dict[tuple, FrozenSet[str]] = {}
+        self.max_jd_id = 0
+        self.resumes_updated: Optional[datetime] = None
+
+    def set_document(self, key: tuple, items: FrozenSet[str], dirty: Set[str]) -> None:
+        old = self.documents.get(key, frozenset())
+        if old == items:
+            return
+        self._apply(old, -1)
+        self._apply(items, 1)
+        if items:
+            self.documents[key] = items
+        else:
+            self.documents.pop(key, None)
+        dirty |= old | items
+
+    def _apply(self, items: Iterable[str], sign: int) -> None:
+        items = list(items)
+        for a in items:
+            self.doc_freq[a] += sign
+            if self.doc_freq[a] <= 0:
+                del self.doc_freq[a]
+            row = self.pairs.setdefault(a, Counter())
+            for b in items:
+                if a != b:
+                    row[b] += sign
+                    if row[b] <= 0:
+                        del row[b]
+            if not row:
+                del self.pairs[a]
+
+
+class SkillCooccurrence:
+    """Worker-wide co-occurrence matrix with precomputed neighbour lists."""
+
+    def __init__(self, refresh_seconds: int = 300, rebuild_seconds: int = 3600, top_n: int = 20):
+        self.refresh_seconds = refresh_seconds
+        self.rebuild_seconds = rebuild_seconds
+        self.top_n = top_n
+        self._matrix = _Matrix()
+        self._neighbours: Dict[str, Dict[str, float]] = {}
+        self._rebuilt_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def neighbours(self, item: str) -> Dict[str, float]:
+        """Top-N co-occurring items of a skill or role item, with weights in 0..1."""
+        return self._neighbours.get(item, {})
+
+    def _top_n(self, matrix: _Matrix, item: str) -> Dict[str, float]:
+        row = matrix.pairs.get(item)
+        if not row:
+            return {}
+        df = matrix.doc_freq
+        weights = {other: count / math.sqrt(df[item] * df[other]) for other, count in row.items()}
+        top = sorted(weights.items(), key=lambda kv: kv[1], reverse=True)[:self.top_n]
+        return dict(top)
+
+    def _load(self, db: Session, matrix: _Matrix, dirty: Set[str]) -> None:
+        """Count JDs newer than the matrix's high-water mark and resumes edited since its last sync."""
+        jds = (
+            db.query(JobDescription)
+            .options(selectinload(JobDescription.vector))
+            .filter(JobDescription.id > matrix.max_jd_id)
+            .order_by(JobDescription.id)
+        )
+        for jd in jds.yield_per(500):
+            job_description_vector(jd)  # backfills required_skills of JDs stored before ingestion
+            items = _document_items(jd.required_skills or (), jd.title)
+            matrix.set_document(("jd", jd.id), items, dirty)
+            matrix.max_jd_id = max(matrix.max_jd_id, jd.id)
+
+        resumes = db.query(Resume)
+        if matrix.resumes_updated is not None:
+            resumes = resumes.filter(Resume.updated_at >= matrix.resumes_updated - SYNC_OVERLAP)
+        for resume in resumes.yield_per(200):
+            items = _document_items(get_resume_skills(resume), resume.target_job_role)
+            matrix.set_document(("resume", resume.id), items, dirty)
+            if resume.updated_at is not None:
+                updated = resume.updated_at.replace(tzinfo=None)
+                if matrix.resumes_updated is None or updated > matrix.resumes_updated:
+                    matrix.resumes_updated = updated
+        db.commit()
+
+    def refresh(self, db: Session) -> None:
+        """Catch up incrementally, or rebuild from scratch when the rebuild interval has passed."""
+        if self._rebuilt_at is None or time.monotonic() - self._rebuilt_at >= self.rebuild_seconds:
+            matrix = _Matrix()
+            self._load(db, matrix, set())
+            neighbours = {item: self._top_n(matrix, item) for item in matrix.doc_freq}
+            with self._lock:
+                self._matrix, self._neighbours = matrix, neighbours
+            self._rebuilt_at = time.monotonic()
+            return
+
+        dirty: Set[str] = set()
+        with self._lock:
+            self._load(db, self._matrix, dirty)
+            self._update_neighbours(dirty)
+
+    def _update_neighbours(self, dirty: Set[str]) -> None:
+        """Recompute the neighbour lists that may have changed (caller holds the lock)."""
+        # A changed document frequency rescales the weights of every item paired with it
+        affected = set(dirty)
+        for item in dirty:
+            affected.update(self._matrix.pairs.get(item, ()))
+            affected.update(self._neighbours.get(item, ()))
+        for item in affected:
+            top = self._top_n(self._matrix, item)
+            if top:
+                self._neighbours[item] = top  # single-key swaps; readers never lock
+            else:
+                self._neighbours.pop(item, None)
+
+    def start(self) -> None:
+        """Start the background refresh thread (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="skill-cooccurrence", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            db = SessionLocal()
+            try:
+                self.refresh(db)
+            except Exception as e:
+                db.rollback()
+                print(f"Skill co-occurrence refresh failed: {e}")
+            finally:
+                db.close()
+            self._stop.wait(self.refresh_seconds)
+
+
+skill_cooccurrence = SkillCooccurrence(
+    refresh_seconds=settings.CORPUS_REFRESH_SECONDS,
+    rebuild_seconds=settings.SKILL_COOCCURRENCE_REBUILD_SECONDS,
+    top_n=settings.SKILL_NEIGHBOURS_TOP_N,
+)
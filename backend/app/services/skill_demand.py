@@ -0,0 +1,108 @@
+"""
+Skill demand statistics per job role.
+Every stored skill analysis adds its required skills to the `skill_demand` aggregate
+(role x month x skill -> count, plus all-roles and all-time rollups), so "most demanded
+skills for a role" is an index range read instead of a scan of `skill_analyses`.
+"""
+
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.models import CorpusStat, SkillAnalysis, SkillDemand
+from app.utils.db import upsert_add
+
+ALL_ROLES = "*"
+ALL_TIME = "all"
+ANALYSES = "*"  # skill key of the per-role analysis count
+MAX_ROLE_LENGTH = 200
+MAX_SKILL_LENGTH = 100
+# Marker row in corpus_stats: set once skill_demand holds every stored analysis
+BACKFILL_MARKER = "skill_demand_backfilled"
+
+
+def demand_role(job_role: Optional[str]) -> str:
+    """Normalized role key ("general" when no role was given)."""
+    return " ".join((job_role or "general").lower().split())[:MAX_ROLE_LENGTH] or "general"
+
+
+def month_bucket(when: Optional[datetime] = None) -> str:
+    return (when or datetime.now(timezone.utc)).strftime("%Y-%m")
+
+
+def _deltas(counts: Counter, job_role: Optional[str], skills: Iterable[str], when: Optional[datetime]) -> None:
+    role = demand_role(job_role)
+    items = {s[:MAX_SKILL_LENGTH] for s in skills if s} | {ANALYSES}
+    for r in (role, ALL_ROLES):
+        for bucket in (month_bucket(when), ALL_TIME):
+            for skill in items:
+                counts[(r, bucket, skill)] += 1
+
+
+def record_analysis(db: Session, job_role: Optional[str], required_skills: Iterable[str],
+                    when: Optional[datetime] = None) -> None:
+    """Count one stored analysis; the write joins the caller's transaction."""
+    ensure_backfilled(db)
+    counts: Counter = Counter()
+    _deltas(counts, job_role, required_skills, when)
+    upsert_add(db, SkillDemand, ("job_role", "bucket", "skill"), "count", counts)
+
+
+_backfilled = False
+
+
+def ensure_backfilled(db: Session) -> None:
+    """Aggregate analyses stored before skill_demand existed (once per database)."""
+    global _backfilled
+    if _backfilled:
+        return
+    if db.get(CorpusStat, BACKFILL_MARKER) is not None or _backfill():
+        _backfilled = True
+
+
+def _backfill() -> bool:
+    """
+    Rebuild skill_demand from skill_analyses in a transaction of its own, claimed by
+    inserting the marker row first: a worker whose insert conflicts leaves the backfill
+    to the one that holds it. True once the marker is committed (by either).
+    """
+    db = SessionLocal()
+    try:
+        db.add(CorpusStat(name=BACKFILL_MARKER, value=1))
+        db.flush()
+        db.query(SkillDemand).delete()
+        counts: Counter = Counter()
+        query = db.query(SkillAnalysis.job_role, SkillAnalysis.required_skills, SkillAnalysis.created_at)
+        for job_role, required_skills, created_at in query.yield_per(1000):
+            _deltas(counts, job_role, required_skills or (), created_at)
+        upsert_add(db, SkillDemand, ("job_role", "bucket", "skill"), "count", counts)
+        db.commit()
+        return True
+    except IntegrityError:
+        db.rollback()
+        return db.get(CorpusStat, BACKFILL_MARKER) is not None
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def top_skills(db: Session, job_role: Optional[str] = None, bucket: str = ALL_TIME,
+               limit: int = 20) -> Tuple[int, List[Tuple[str, int]]]:
+    """(number of analyses, [(skill, count)] most demanded first) for a role (None = all roles)."""
+    ensure_backfilled(db)
+    role = demand_role(job_role) if job_role else ALL_ROLES
+    base = db.query(SkillDemand).filter(SkillDemand.job_role == role, SkillDemand.bucket == bucket)
+    total = base.filter(SkillDemand.skill == ANALYSES).first()
+    rows = (
+        base.filter(SkillDemand.skill != ANALYSES)
+        .order_by(SkillDemand.count.desc(), SkillDemand.skill)
+        .limit(limit)
+        .all()
+    )
+    return (total.count if total else 0), [(row.skill, row.count) for row in rows]
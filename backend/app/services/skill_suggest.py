@@ -0,0 +1,150 @@
+"""
+Skill autocomplete.
+A compressed prefix trie over taxonomy skills, their aliases, and skills listed on stored
+resumes, ranked by how many resumes list each skill. The trie is rebuilt by a background
+thread every refresh interval, and sooner when a saved resume lists a skill it lacks.
+"""
+
+import threading
+from collections import Counter
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.models import Resume
+from app.ai_engine.prefix_trie import PrefixTrie
+from app.ai_engine.skill_analyzer import normalize_skill, skill_taxonomy
+
+MAX_SKILL_LENGTH = 50
+# Skills outside the taxonomy are only suggested once this many resumes list them
+MIN_OBSERVED_RESUMES = 2
+# Wait after a new skill is seen, so a burst of saves triggers one rebuild
+REBUILD_DEBOUNCE_SECONDS = 1.0
+
+
+def _listed_skills(skills) -> Iterable[str]:
+    for group in skills or []:
+        items = group.get("items") if isinstance(group, dict) else group
+        if isinstance(items, str):
+            items = items.replace("\n", ",").split(",")
+        for item in items or []:
+            if isinstance(item, str) and item.strip():
+                yield item
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+class SkillSuggester:
+    """Worker-wide autocomplete trie with background rebuilds."""
+
+    def __init__(self, refresh_seconds: int = 300, top_k: int = 10):
+        self.refresh_seconds = refresh_seconds
+        self.top_k = top_k
+        self._trie: Optional[PrefixTrie] = None
+        self._known: FrozenSet[str] = frozenset()  # skills the current trie completes to
+        # Resumes listing each off-taxonomy skill that too few resumes list to be suggested yet
+        self._pending: Dict[str, FrozenSet[int]] = {}
+        self._pending_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def suggest(self, db: Session, query: str, limit: int) -> List[Tuple[str, float]]:
+        """Best (skill, popularity) completions of a typed prefix."""
+        trie = self._trie
+        if trie is None:
+            with self._lock:
+                if self._trie is None:
+                    self.rebuild(db)
+            trie = self._trie
+        prefix = normalize_query(query)
+        return trie.complete(prefix, limit) if prefix else []
+
+    def observe(self, resume_id: int, skills) -> None:
+        """
+        Note the skills of a saved resume. A skill that enough distinct resumes now list to
+        enter the trie schedules a rebuild; re-saving the same resume does not count again.
+        """
+        if self._trie is None:
+            return
+        wake = False
+        with self._pending_lock:
+            for skill in _listed_skills(skills):
+                name = normalize_skill(skill)
+                if name in self._known or len(name) > MAX_SKILL_LENGTH:
+                    continue
+                resumes = self._pending.get(name, frozenset()) | {resume_id}
+                self._pending[name] = resumes
+                wake = wake or len(resumes) >= MIN_OBSERVED_RESUMES
+        if wake:
+            self._wake.set()
+
+    def rebuild(self, db: Session) -> None:
+        popularity: Counter = Counter()
+        listed_by: Dict[str, List[int]] = {}
+        for resume_id, skills in db.query(Resume.id, Resume.skills).yield_per(500):
+            names = {normalize_skill(s) for s in _listed_skills(skills)}
+            for name in names:
+                if len(name) <= MAX_SKILL_LENGTH:
+                    popularity[name] += 1
+                    if popularity[name] < MIN_OBSERVED_RESUMES:
+                        listed_by.setdefault(name, []).append(resume_id)
+
+        forms = skill_taxonomy.current().surface_forms()
+        taxonomy_skills = {skill for _, skill in forms}
+        forms.extend(
+            (name, name) for name, count in popularity.items()
+            if name not in taxonomy_skills and count >= MIN_OBSERVED_RESUMES
+        )
+        pending = {
+            name: frozenset(resume_ids) for name, resume_ids in listed_by.items()
+            if name not in taxonomy_skills and popularity[name] < MIN_OBSERVED_RESUMES
+        }
+
+        entries = []
+        for surface, skill in forms:
+            score = popularity.get(skill, 0)
+            entries.append((surface, skill, score))
+            # Later words of multi-word skills also complete ("learn" -> machine learning)
+            for i, ch in enumerate(surface):
+                if ch == " " and i + 1 < len(surface):
+                    entries.append((surface[i + 1:], skill, score))
+        trie = PrefixTrie(entries, top_k=self.top_k)
+        with self._pending_lock:
+            self._pending = pending
+        self._known = frozenset(skill for _, skill in forms)
+        self._trie = trie
+
+    def start(self) -> None:
+        """Start the background rebuild thread (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="skill-suggest", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            db = SessionLocal()
+            try:
+                self.rebuild(db)
+            except Exception as e:
+                db.rollback()
+                print(f"Skill suggestion rebuild failed: {e}")
+            finally:
+                db.close()
+            if self._wake.wait(self.refresh_seconds):
+                self._stop.wait(REBUILD_DEBOUNCE_SECONDS)
+                self._wake.clear()
+
+
+skill_suggester = SkillSuggester(refresh_seconds=settings.CORPUS_REFRESH_SECONDS)
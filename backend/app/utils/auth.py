@@ -60,11 +60,8 @@ def decode_access_token(token: str) -> dict:
         )
 
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-) -> User:
-    """Dependency to get the current authenticated user from JWT token."""
+def _authenticate(token: str, db: Session) -> User:
+    """Resolve a JWT to an active user, raising 401/403 otherwise."""
     payload = decode_access_token(token)
     user_id = payload.get("sub")
     if user_id is None:
@@ -86,6 +83,27 @@ async def get_current_user(
     return user
 
 
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db)
+) -> User:
+    """Dependency to get the current authenticated user from JWT token."""
+    return _authenticate(token, db)
+
+
+def get_current_user_id(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db)
+) -> int:
+    """
+    Dependency for async routes that wait on slow upstreams: authenticates in the threadpool
+    and releases the database connection, returning only the user's id.
+    """
+    user_id = _authenticate(token, db).id
+    db.rollback()
+    return user_id
+
+
 async def get_current_admin(current_user: User = Depends(get_current_user)) -> User:
     """Dependency to verify the user has admin role."""
     if current_user.role != "admin":
@@ -0,0 +1,52 @@
+"""
+Database helpers shared by the services.
+"""
+
+from typing import Any, Dict, List, Sequence, Union
+
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+
+def _insert(db: Session, model):
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    return dialect.insert(model.__table__)
+
+
+def upsert_add(db: Session, model, key: Union[str, Sequence[str]], value: str, rows: Dict[Any, float]) -> None:
+    """
+    Add deltas to counter rows, inserting missing keys (single executemany statement).
+    key names the primary key column, or columns when rows are keyed by tuples.
+    """
+    if not rows:
+        return
+    keys = [key] if isinstance(key, str) else list(key)
+    table = model.__table__
+    stmt = _insert(db, model)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c[k] for k in keys],
+        set_={value: table.c[value] + stmt.excluded[value]},
+    )
+    params = []
+    for k, v in rows.items():
+        row = dict(zip(keys, k)) if len(keys) > 1 else {keys[0]: k}
+        row[value] = v
+        params.append(row)
+    db.execute(stmt, params)
+
+
+def upsert_replace(db: Session, model, key: Sequence[str], rows: List[Dict[str, Any]], columns: Sequence[str]) -> None:
+    """
+    Insert rows, overwriting the listed columns of rows whose key already exists, so
+    concurrent writers of the same key never conflict (single executemany statement).
+    """
+    if not rows:
+        return
+    table = model.__table__
+    stmt = _insert(db, model)
+    set_ = {column: stmt.excluded[column] for column in columns}
+    if "updated_at" in table.c:
+        set_["updated_at"] = func.now()
+    stmt = stmt.on_conflict_do_update(index_elements=[table.c[k] for k in key], set_=set_)
+    db.execute(stmt, rows)
@@ -0,0 +1,48 @@
+"""
+Throughput of batch skill extraction across the process pool, against a serial loop.
+
+Usage (from backend/):
+    python -m benchmarks.bench_batch_extraction [--jds 20000] [--chars 3000] [--workers 1 2 4 8]
+"""
+
+import argparse
+import os
+import random
+import time
+
+from app.ai_engine.skill_analyzer import extract_skills_batch, extract_skills_from_text
+from benchmarks.bench_skill_extraction import _job_description
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jds", type=int, default=20000)
+    parser.add_argument("--chars", type=int, default=3000)
+    parser.add_argument("--workers", type=int, nargs="+", default=None)
+    parser.add_argument("--chunk-size", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    worker_counts = args.workers or sorted({1, 2, 4, 8, cores} & set(range(1, cores + 1)))
+    rng = random.Random(args.seed)
+    texts = [_job_description(rng, args.chars) for _ in range(args.jds)]
+
+    start = time.perf_counter()
+    expected = [extract_skills_from_text(text) for text in texts]
+    serial = time.perf_counter() - start
+    print(f"{args.jds} JDs of ~{args.chars} chars, {cores} cores")
+    print(f"{'workers':>8}{'seconds':>10}{'JDs/sec':>10}{'speedup':>10}")
+    print(f"{'serial':>8}{serial:>10.2f}{args.jds / serial:>10.0f}{1:>9.1f}x")
+
+    for workers in worker_counts:
+        extract_skills_batch(texts[:workers * 2], workers=workers, chunk_size=1)  # start the pool
+        start = time.perf_counter()
+        result, _ = extract_skills_batch(texts, workers=workers, chunk_size=args.chunk_size)
+        seconds = time.perf_counter() - start
+        assert result == expected, "batch extraction differs from extract_skills_from_text"
+        print(f"{workers:>8}{seconds:>10.2f}{args.jds / seconds:>10.0f}{serial / seconds:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Throughput of micro-batched inference requests against one request per prompt.
+
+Runs a local stub of the inference endpoint that serves --replicas requests at a time;
+each request costs --request-ms plus --prompt-ms per prompt in it, like a model server
+with fixed per-request overhead that generates a batch together.
+
+Usage (from backend/):
+    python -m benchmarks.bench_micro_batching [--prompts 400] [--concurrency 100] [--batch-sizes 1 4 8 16]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import threading
+import time
+
+import uvicorn
+
+from app.ai_engine.inference_client import InferenceClient
+
+
+def _stub_app(replicas: int, request_seconds: float, prompt_seconds: float):
+    slots = {}
+
+    async def app(scope, receive, send):
+        if scope["type"] != "http":
+            return
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        inputs = json.loads(body)["inputs"]
+        prompts = inputs if isinstance(inputs, list) else [inputs]
+        slot = slots.setdefault(asyncio.get_running_loop(), asyncio.Semaphore(replicas))
+        async with slot:
+            await asyncio.sleep(request_seconds + prompt_seconds * len(prompts))
+        generations = [[{"generated_text": f"generated for: {prompt}"}] for prompt in prompts]
+        out = generations if isinstance(inputs, list) else generations[0]
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+        await send({"type": "http.response.body", "body": json.dumps(out).encode()})
+    return app
+
+
+def _start_stub(replicas: int, request_seconds: float, prompt_seconds: float) -> str:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    app = _stub_app(replicas, request_seconds, prompt_seconds)
+    server = uvicorn.Server(uvicorn.Config(app, port=port, log_level="error"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return f"http://127.0.0.1:{port}/model"
+
+
+async def _run(client: InferenceClient, prompts: int, concurrency: int) -> float:
+    queue = iter(range(prompts))
+    failures = 0
+
+    async def caller() -> None:
+        nonlocal failures
+        for i in queue:
+            text = await client.query(f"Write a resume summary for candidate {i}", max_tokens=200)
+            if f"candidate {i} " not in (text or ""):
+                failures += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(caller() for _ in range(concurrency)))
+    seconds = time.perf_counter() - start
+    await client.aclose()
+    assert failures == 0, f"{failures} prompts got no or the wrong generation"
+    return seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--prompts", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--wait-ms", type=float, default=5.0)
+    parser.add_argument("--replicas", type=int, default=4)
+    parser.add_argument("--request-ms", type=float, default=50.0)
+    parser.add_argument("--prompt-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    os.environ["HUGGINGFACE_API_KEY"] = "bench"
+    url = _start_stub(args.replicas, args.request_ms / 1000, args.prompt_ms / 1000)
+    print(f"{args.prompts} prompts from {args.concurrency} callers; stub: {args.replicas} replicas, "
+          f"{args.request_ms:g} ms per request + {args.prompt_ms:g} ms per prompt")
+    print(f"{'batch':>6}{'seconds':>10}{'prompts/s':>11}{'requests':>10}{'speedup':>9}")
+    baseline = None
+    for size in args.batch_sizes:
+        client = InferenceClient(url=url, batch_size=size, batch_wait=args.wait_ms / 1000)
+        seconds = asyncio.run(_run(client, args.prompts, args.concurrency))
+        baseline = baseline or seconds
+        requests = client.batcher.batches if client.batcher else args.prompts
+        print(f"{size:>6}{seconds:>10.2f}{args.prompts / seconds:>11.0f}{requests:>10}{baseline / seconds:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
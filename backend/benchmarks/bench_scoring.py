@@ -0,0 +1,117 @@
+"""
+Compare TF-IDF and BM25 resume scoring side by side on a synthetic corpus.
+
+Usage (from backend/):
+    python -m benchmarks.bench_scoring [--docs 2000] [--queries 200]
+
+Collection statistics (document frequencies, average length) are computed once up front,
+as CorpusIndex does, so the timings cover only per-query scoring work.
+"""
+
+import argparse
+import math
+import random
+import statistics
+import time
+from collections import Counter
+
+from app.ai_engine.resume_scorer import (
+    analyze_resume_score,
+    build_resume_profile,
+    tokenize,
+)
+
+VOCABULARY = [
+    "python", "java", "javascript", "react", "django", "fastapi", "postgresql", "docker",
+    "kubernetes", "aws", "terraform", "kafka", "spark", "airflow", "pandas", "tensorflow",
+    "pytorch", "graphql", "redis", "mongodb", "linux", "ci", "cd", "agile", "microservices",
+    "backend", "frontend", "api", "testing", "security", "monitoring", "analytics", "design",
+    "leadership", "mentoring", "scalable", "distributed", "systems", "cloud", "data",
+]
+
+
+def _text(rng: random.Random, n_words: int) -> str:
+    return " ".join(rng.choice(VOCABULARY) for _ in range(n_words))
+
+
+def _resume(rng: random.Random, n_words: int) -> dict:
+    return {
+        "target_job_role": "Software Engineer",
+        "experience": [{"title": "Engineer", "company": "Acme", "description": _text(rng, n_words * 3 // 4)}],
+        "skills": [{"category": "Tech", "items": rng.sample(VOCABULARY, 8)}],
+        "projects": [{"name": "Project", "description": _text(rng, n_words // 4)}],
+    }
+
+
+def _time(fn, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), max(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--docs", type=int, default=2000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    resumes = [_resume(rng, rng.randint(80, 600)) for _ in range(args.docs)]
+    job_descriptions = [_text(rng, rng.randint(40, 200)) for _ in range(args.queries)]
+
+    profiles = [build_resume_profile(resume) for resume in resumes]
+    doc_freq = Counter()
+    total_length = 0
+    for profile in profiles:
+        doc_freq.update(profile["tf"].keys())
+        total_length += profile["token_count"]
+    n_docs = len(profiles)
+    avg_doc_length = total_length / n_docs
+
+    def idf(terms):
+        return {t: math.log((n_docs + 1) / (doc_freq.get(t, 0) + 1)) + 1 for t in terms}
+
+    def bm25_idf(terms):
+        return {
+            t: math.log(1 + (n_docs - doc_freq.get(t, 0) + 0.5) / (doc_freq.get(t, 0) + 0.5))
+            for t in terms
+        }
+
+    pairs = [(rng.randrange(n_docs), jd) for jd in job_descriptions]
+
+    def run(mode):
+        lookup = bm25_idf if mode == "bm25" else idf
+        return lambda: [
+            analyze_resume_score(resumes[i], jd, idf_lookup=lookup, profile=profiles[i],
+                                 mode=mode, avg_doc_length=avg_doc_length)
+            for i, jd in pairs
+        ]
+
+    print(f"{n_docs} resumes, avg length {avg_doc_length:.0f} tokens, {len(pairs)} queries")
+    print(f"{'mode':<8}{'median ms/query':>18}{'worst ms/query':>18}")
+    for mode in ("tfidf", "bm25"):
+        median, worst = _time(run(mode), runs=5)
+        print(f"{mode:<8}{median / len(pairs):>18.4f}{worst / len(pairs):>18.4f}")
+
+    # Length sensitivity: the same content repeated makes a resume longer without adding evidence.
+    base = _resume(rng, 120)
+    project = base["projects"][0]
+    padded = dict(base, projects=[dict(project, description=" ".join([project["description"]] * 6))])
+    jd = job_descriptions[0]
+    print("\nscore of the same resume, normal vs padded project description")
+    for mode in ("tfidf", "bm25"):
+        lookup = bm25_idf if mode == "bm25" else idf
+        scores = [
+            analyze_resume_score(r, jd, idf_lookup=lookup, mode=mode, avg_doc_length=avg_doc_length)["overall_score"]
+            for r in (base, padded)
+        ]
+        print(f"{mode:<8}{scores[0]:>10.1f}{scores[1]:>10.1f}")
+    print(f"\nunique JD terms per query: {statistics.mean(len(set(tokenize(jd))) for jd in job_descriptions):.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Compare the single-pass skill matcher against the previous per-skill regex loop,
+and compiling the skill taxonomy against loading its snapshot.
+
+Usage (from backend/):
+    python -m benchmarks.bench_skill_extraction [--sizes 500 5000 50000] [--runs 20]
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import statistics
+import time
+
+from app.ai_engine.skill_analyzer import extract_skills_from_text, skill_taxonomy
+from app.ai_engine.skill_taxonomy import SkillTaxonomy, compile_taxonomy, _open_snapshot
+
+TECH_SKILLS = set(skill_taxonomy.current().skill_names())
+
+FILLER = (
+    "we are looking for an engineer to join our growing team and build reliable services "
+    "that scale with our customers while collaborating closely with product and design"
+).split()
+
+
+def regex_extract_skills(text: str):
+    """The previous implementation: one re.search per dictionary entry."""
+    text_lower = text.lower()
+    found_skills = []
+    for skill in TECH_SKILLS:
+        pattern = r'\b' + re.escape(skill) + r'\b'
+        if re.search(pattern, text_lower):
+            found_skills.append(skill)
+    words = re.findall(r'\b[A-Z][A-Za-z\+\#]+\b', text)
+    for word in words:
+        if word.lower() in TECH_SKILLS and word.lower() not in found_skills:
+            found_skills.append(word.lower())
+    return sorted(set(found_skills))
+
+
+def _job_description(rng: random.Random, n_chars: int) -> str:
+    skills = sorted(TECH_SKILLS)
+    words = []
+    length = 0
+    while length < n_chars:
+        word = rng.choice(skills) if rng.random() < 0.05 else rng.choice(FILLER)
+        if rng.random() < 0.1:
+            word = word.capitalize() + ","
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)
+
+
+def _median_ms(fn, text, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn(text)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 5000, 50000])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{len(TECH_SKILLS)} dictionary skills")
+    print(f"{'chars':>8}{'regex ms':>12}{'automaton ms':>15}{'speedup':>10}  differences")
+    for size in args.sizes:
+        text = _job_description(rng, size)
+        old = _median_ms(regex_extract_skills, text, args.runs)
+        new = _median_ms(extract_skills_from_text, text, args.runs)
+        diff = set(regex_extract_skills(text)) ^ set(extract_skills_from_text(text))
+        print(f"{size:>8}{old:>12.3f}{new:>15.3f}{old / new:>9.1f}x  {sorted(diff) or '-'}")
+
+    raw = skill_taxonomy.source_path.read_bytes()
+    source_hash = hashlib.sha256(raw).digest()
+    compile_ms = _median_ms(lambda _: SkillTaxonomy(compile_taxonomy(json.loads(raw), source_hash)), None, 5)
+    load_ms = _median_ms(lambda _: _open_snapshot(skill_taxonomy.snapshot_path), None, args.runs)
+    print(f"\ntaxonomy compile {compile_ms:.3f} ms, snapshot load {load_ms:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
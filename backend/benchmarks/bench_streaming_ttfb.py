@@ -0,0 +1,117 @@
+"""
+Time to first byte of streamed resume generation, against waiting for the full response.
+
+Runs a local stub of the inference endpoint that emits one token every --token-ms (as
+server-sent events when the request asks to stream, else the whole text at the end).
+
+Usage (from backend/):
+    python -m benchmarks.bench_streaming_ttfb [--tokens 200] [--token-ms 20] [--runs 5]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import threading
+import time
+
+import uvicorn
+
+from app.ai_engine.inference_client import inference_client
+from app.ai_engine.resume_generator import generate_resume_with_ai, stream_resume_with_ai
+
+RESUME = {
+    "personal_info": {"name": "Ada Lovelace", "email": "ada@example.com"},
+    "education": [{"degree": "BSc Mathematics", "institution": "University of London", "year": "1835"}],
+    "skills": [{"category": "Languages", "items": ["Python", "SQL", "Go"]}],
+    "experience": [{"role": "Engineer", "company": "Analytical Engines", "duration": "2 years",
+                    "bullets": ["built the first program", "worked with the team on data pipelines"]}],
+    "projects": [{"name": "Bernoulli numbers", "description": "wrote an algorithm", "technologies": ["Notes"]}],
+    "target_job_role": "Software Engineer",
+}
+
+
+def _stub_app(tokens: int, token_seconds: float):
+    async def app(scope, receive, send):
+        if scope["type"] != "http":
+            return
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        stream = json.loads(body or b"{}").get("stream")
+        content_type = b"text/event-stream" if stream else b"application/json"
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", content_type)]})
+        words = []
+        for i in range(tokens):
+            await asyncio.sleep(token_seconds)
+            words.append(f" word{i}")
+            if stream:
+                event = {"token": {"id": i, "text": words[-1], "special": False}, "generated_text": None}
+                await send({"type": "http.response.body", "body": f"data:{json.dumps(event)}\n\n".encode(), "more_body": True})
+        tail = b"" if stream else json.dumps([{"generated_text": "".join(words)}]).encode()
+        await send({"type": "http.response.body", "body": tail})
+    return app
+
+
+def _start_stub(tokens: int, token_seconds: float) -> str:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(_stub_app(tokens, token_seconds), port=port, log_level="error"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return f"http://127.0.0.1:{port}/model"
+
+
+async def _streamed() -> tuple:
+    start = time.perf_counter()
+    first = None
+    method = None
+    async for event in stream_resume_with_ai(RESUME):
+        if first is None:
+            first = time.perf_counter() - start
+        if event["event"] == "done":
+            method = event["result"]["method"]
+    return first, time.perf_counter() - start, method
+
+
+async def _buffered() -> tuple:
+    start = time.perf_counter()
+    result = await generate_resume_with_ai(RESUME)
+    seconds = time.perf_counter() - start
+    return seconds, seconds, result["method"]
+
+
+async def _measure(runs: int) -> None:
+    print(f"{'mode':>10}{'method':>12}{'TTFB ms':>10}{'total ms':>10}")
+    for name, fn in (("buffered", _buffered), ("streamed", _streamed)):
+        samples = [await fn() for _ in range(runs)]
+        ttfb = statistics.median(s[0] for s in samples) * 1000
+        total = statistics.median(s[1] for s in samples) * 1000
+        print(f"{name:>10}{samples[0][2]:>12}{ttfb:>10.1f}{total:>10.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tokens", type=int, default=200)
+    parser.add_argument("--token-ms", type=float, default=20.0)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    inference_client.url = _start_stub(args.tokens, args.token_ms / 1000)
+    print(f"stub upstream: {args.tokens} tokens, one every {args.token_ms:g} ms")
+    os.environ["HUGGINGFACE_API_KEY"] = "bench"
+    asyncio.run(_measure(args.runs))
+    print("no API key (rule-based fallback):")
+    del os.environ["HUGGINGFACE_API_KEY"]
+    asyncio.run(_measure(args.runs))
+
+
+if __name__ == "__main__":
+    main()
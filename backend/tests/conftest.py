@@ -0,0 +1,44 @@
+"""
+Shared fixtures: every test gets an empty SQLite database (SessionLocal is rebound to it)
+and a user with a bearer token. No network is used.
+"""
+
+import pytest
+from sqlalchemy import create_engine
+
+from app.database import Base, SessionLocal
+from app.models import models
+from app.utils.auth import create_access_token, hash_password
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    original = SessionLocal.kw["bind"]
+    SessionLocal.configure(bind=engine)
+    yield engine
+    SessionLocal.configure(bind=original)
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    session = SessionLocal()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def user(db):
+    user = models.User(
+        email="ann@example.com", username="ann", full_name="Ann Person", hashed_password=hash_password("secret1"),
+    )
+    db.add(user)
+    db.commit()
+    return user
+
+
+@pytest.fixture
+def auth_headers(user):
+    return {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
@@ -0,0 +1,51 @@
+"""
+Corpus IDF index: built in a session of its own, and in-memory counts follow committed changes only.
+"""
+
+import pytest
+
+from app.ai_engine.resume_scorer import corpus_idf
+from app.models.models import CorpusStat, CorpusTerm, Resume
+from app.services.corpus import DOC_COUNT, CorpusIndex, corpus_index
+
+
+@pytest.fixture(autouse=True)
+def fresh_index(monkeypatch, engine):
+    monkeypatch.setattr(corpus_index, "doc_freq", {})
+    monkeypatch.setattr(corpus_index, "doc_count", 0)
+    monkeypatch.setattr(corpus_index, "total_length", 0.0)
+    monkeypatch.setattr(corpus_index, "_loaded_at", None)
+
+
+def test_idf_matches_scorer():
+    index = CorpusIndex()
+    index.doc_freq, index.doc_count = {"python": 3, "sql": 1}, 4
+    assert index.idf(["python", "sql", "rust"]) == corpus_idf(index.doc_freq, 4, ["python", "sql", "rust"])
+
+
+def test_rebuild_leaves_caller_transaction_alone(db, user):
+    db.add(Resume(user_id=user.id, title="Draft", target_job_role="Python developer"))
+    corpus_index.ensure_loaded()
+    db.rollback()
+    assert db.query(Resume).count() == 0
+    assert db.get(CorpusStat, DOC_COUNT).value == 0
+
+
+def test_change_applies_on_commit(db):
+    corpus_index.ensure_loaded()
+    corpus_index.record_change(db, new_terms={"python"}, new_length=5)
+    assert corpus_index.doc_count == 0
+    db.commit()
+    assert corpus_index.doc_count == 1
+    assert corpus_index.doc_freq == {"python": 1}
+    assert corpus_index.total_length == 5
+
+
+def test_rolled_back_change_is_dropped(db):
+    corpus_index.ensure_loaded()
+    corpus_index.record_change(db, new_terms={"python"}, new_length=5)
+    db.rollback()
+    db.commit()
+    assert corpus_index.doc_count == 0
+    assert corpus_index.doc_freq == {}
+    assert db.get(CorpusTerm, "python") is None
@@ -0,0 +1,208 @@
+"""
+Generation jobs: submit, poll, run and the worker, with query_huggingface stubbed out.
+"""
+
+import asyncio
+import time
+from datetime import timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.ai_engine import cover_letter_generator, resume_generator
+from app.main import app
+from app.models.models import CoverLetter, GenerationJob, Resume
+from app.services.generation_jobs import (
+    GenerationWorker, claim_next_job, finish_job, requeue_stale_jobs, run_job, submit_job,
+)
+from app.services import generation_jobs
+
+RESUME = {
+    "title": "R1",
+    "personal_info": {"name": "Ann Person", "email": "ann@example.com"},
+    "skills": [{"category": "Languages", "items": ["Python", "SQL"]}],
+    "experience": [{"company": "Acme", "role": "Engineer", "bullets": ["built REST APIs"]}],
+    "target_job_role": "Backend Engineer",
+}
+
+
+@pytest.fixture
+def model(monkeypatch):
+    """Stub for query_huggingface: answers with `reply` (None means the model is down)."""
+    class Model:
+        reply = "AI generated content"
+        prompts = []
+
+        async def query(self, prompt, max_tokens=1500):
+            self.prompts.append(prompt)
+            return self.reply
+
+    stub = Model()
+    monkeypatch.setattr(resume_generator, "query_huggingface", stub.query)
+    monkeypatch.setattr(cover_letter_generator, "query_huggingface", stub.query)
+    return stub
+
+
+@pytest.fixture
+def resume(db, user):
+    resume = Resume(user_id=user.id, **RESUME)
+    db.add(resume)
+    db.commit()
+    return resume
+
+
+@pytest.fixture
+def cover_letter(db, user):
+    cl = CoverLetter(user_id=user.id, title="CL", company_name="Acme", job_title="Engineer", tone="formal")
+    db.add(cl)
+    db.commit()
+    return cl
+
+
+@pytest.fixture
+def client(engine):
+    return TestClient(app)
+
+
+def _run(db, user_id, kind, params):
+    job = submit_job(db, user_id, kind, params)
+    db.commit()
+    assert claim_next_job(db, "test-worker") == job.id
+    asyncio.run(run_job(job.id, "test-worker"))
+    db.expire_all()
+    return db.get(GenerationJob, job.id)
+
+
+def test_submit_rejects_unknown_kind(db, user):
+    with pytest.raises(ValueError):
+        submit_job(db, user.id, "portfolio", {})
+
+
+def test_claim_takes_each_job_once(db, user):
+    first = submit_job(db, user.id, "resume", {"resume_id": 1})
+    second = submit_job(db, user.id, "resume", {"resume_id": 1})
+    db.commit()
+    assert claim_next_job(db, "a") == first.id
+    assert claim_next_job(db, "b") == second.id
+    assert claim_next_job(db, "c") is None
+
+
+def test_only_the_current_claim_finishes_a_job(db, user, monkeypatch):
+    job = submit_job(db, user.id, "resume", {"resume_id": 1})
+    db.commit()
+    assert claim_next_job(db, "slow") == job.id
+    # The slow worker looks dead: the job is requeued and claimed by another worker
+    monkeypatch.setattr(generation_jobs, "REQUEUE_AFTER", timedelta(seconds=-1))
+    assert requeue_stale_jobs(db) == 1
+    assert claim_next_job(db, "fast") == job.id
+
+    assert finish_job(db, job.id, "fast", {"generated_content": "fast"})
+    assert not finish_job(db, job.id, "slow", {"generated_content": "slow"})
+    db.expire_all()
+    stored = db.get(GenerationJob, job.id)
+    assert stored.status == "succeeded"
+    assert stored.result == {"generated_content": "fast"}
+
+
+def test_resume_job_stores_model_output(db, user, resume, model):
+    job = _run(db, user.id, "resume", {"resume_id": resume.id, "job_description": "Python backend"})
+    assert job.status == "succeeded"
+    assert job.result["method"] == "huggingface"
+    db.refresh(resume)
+    assert resume.generated_content == "AI generated content"
+    assert "Python backend" in model.prompts[0]
+
+
+def test_job_falls_back_to_rule_based(db, user, resume, model):
+    model.reply = None
+    job = _run(db, user.id, "resume", {"resume_id": resume.id})
+    assert job.status == "succeeded"
+    assert job.result["method"] == "rule_based"
+    db.refresh(resume)
+    assert "ANN PERSON" in resume.generated_content
+
+
+def test_cover_letter_job(db, user, resume, cover_letter, model):
+    job = _run(db, user.id, "cover_letter", {"cover_letter_id": cover_letter.id, "resume_id": resume.id})
+    assert job.status == "succeeded"
+    db.refresh(cover_letter)
+    assert cover_letter.generated_content == "AI generated content"
+
+
+def test_missing_resume_fails_job(db, user, model):
+    job = _run(db, user.id, "resume", {"resume_id": 999})
+    assert job.status == "failed"
+    assert job.error == "Resume not found"
+
+
+def test_upgrade_replaces_unchanged_rule_based_content(db, user, resume, model):
+    resume.generated_content = "rule-based"
+    db.commit()
+    job = _run(db, user.id, "resume", {"resume_id": resume.id, "upgrade": True, "replaces": "rule-based"})
+    assert job.status == "succeeded"
+    db.refresh(resume)
+    assert resume.generated_content == "AI generated content"
+
+
+def test_upgrade_keeps_newer_content(db, user, resume, model):
+    resume.generated_content = "edited by the user"
+    db.commit()
+    job = _run(db, user.id, "resume", {"resume_id": resume.id, "upgrade": True, "replaces": "rule-based"})
+    assert job.status == "superseded"
+    assert job.result is None
+    db.refresh(resume)
+    assert resume.generated_content == "edited by the user"
+
+
+def test_upgrade_without_model_keeps_rule_based(db, user, resume, model):
+    model.reply = None
+    resume.generated_content = "rule-based"
+    db.commit()
+    job = _run(db, user.id, "resume", {"resume_id": resume.id, "upgrade": True, "replaces": "rule-based"})
+    assert job.status == "kept_rule_based"
+    assert job.result is None
+    db.refresh(resume)
+    assert resume.generated_content == "rule-based"
+
+
+def test_submit_and_poll_endpoints(client, auth_headers, db, resume, model):
+    response = client.post("/api/ai/jobs/generate-resume", json={"resume_id": resume.id}, headers=auth_headers)
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] == "queued"
+
+    assert claim_next_job(db, "test-worker") == job["id"]
+    asyncio.run(run_job(job["id"], "test-worker"))
+    polled = client.get(f"/api/ai/jobs/{job['id']}", headers=auth_headers).json()
+    assert polled["status"] == "succeeded"
+    assert polled["result"]["generated_content"] == "AI generated content"
+
+
+def test_endpoints_are_scoped_to_the_user(client, auth_headers, db, user, resume):
+    response = client.post("/api/ai/jobs/generate-resume", json={"resume_id": 999}, headers=auth_headers)
+    assert response.status_code == 404
+    other = submit_job(db, user.id + 1, "resume", {"resume_id": resume.id})
+    db.commit()
+    assert client.get(f"/api/ai/jobs/{other.id}", headers=auth_headers).status_code == 404
+
+
+def test_worker_runs_queued_jobs(db, user, resume, model):
+    worker = GenerationWorker(concurrency=2, poll_seconds=0.05)
+    ids = [
+        submit_job(db, user.id, "resume", {"resume_id": resume.id, "job_description": f"jd {i}"}).id
+        for i in range(3)
+    ]
+    db.commit()
+    worker.start()
+    try:
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            db.expire_all()
+            statuses = {db.get(GenerationJob, job_id).status for job_id in ids}
+            if statuses == {"succeeded"}:
+                break
+            time.sleep(0.05)
+    finally:
+        worker.stop()
+    assert statuses == {"succeeded"}
+    assert len(model.prompts) == 3
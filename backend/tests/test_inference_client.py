@@ -0,0 +1,101 @@
+"""
+Inference client connection pools: one per event loop, closed by aclose(); and the circuit
+breaker outcome of streamed calls.
+"""
+
+import asyncio
+import json
+import threading
+
+import httpx
+
+from app.ai_engine.inference_client import InferenceClient
+from app.services.circuit_breaker import CircuitBreaker
+
+
+def test_one_pool_per_event_loop():
+    client = InferenceClient(url="http://127.0.0.1:9/model")
+    other = asyncio.new_event_loop()
+    thread = threading.Thread(target=other.run_forever, daemon=True)
+    thread.start()
+
+    async def pool():
+        return client._get_client()
+
+    async def main():
+        own, theirs = set(), set()
+        for _ in range(50):
+            own.add(id(await pool()))
+            theirs.add(id(asyncio.run_coroutine_threadsafe(pool(), other).result()))
+        assert len(own) == 1 and len(theirs) == 1 and own != theirs
+        await client.aclose()
+        assert len(client._clients) == 0
+
+    try:
+        asyncio.run(main())
+    finally:
+        other.call_soon_threadsafe(other.stop)
+        thread.join()
+        other.close()
+
+
+def test_aclose_current_loop_only():
+    client = InferenceClient(url="http://127.0.0.1:9/model")
+    other = asyncio.new_event_loop()
+
+    async def pool():
+        return client._get_client()
+
+    kept = other.run_until_complete(pool())
+
+    async def main():
+        await pool()
+        await client.aclose(all_loops=False)
+        assert list(client._clients.values()) == [kept]
+
+    asyncio.run(main())
+    other.run_until_complete(client.aclose())
+    other.close()
+    assert kept.is_closed
+
+
+def _sse_client(tokens):
+    def handler(request):
+        body = "".join(f"data:{json.dumps({'token': {'text': t, 'special': False}})}\n\n" for t in tokens)
+        return httpx.Response(200, headers={"content-type": "text/event-stream"}, text=body)
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def _half_open_breaker():
+    breaker = CircuitBreaker(open_seconds=0)
+    breaker._open(0.0)
+    return breaker
+
+
+def test_abandoned_stream_releases_probe(monkeypatch):
+    monkeypatch.setenv("HUGGINGFACE_API_KEY", "test")
+    client = InferenceClient(url="http://inference.test/model")
+    client.breaker = breaker = _half_open_breaker()
+    monkeypatch.setattr(client, "_get_client", lambda: _sse_client(["a", "b", "c"]))
+
+    async def main():
+        stream = client.stream("prompt")
+        assert await stream.__anext__() == "a"
+        await stream.aclose()  # the HTTP client disconnected
+
+    asyncio.run(main())
+    assert breaker.state == "half_open"  # no outcome was recorded
+    assert breaker.allow()  # and the next call may probe
+
+
+def test_completed_stream_closes_breaker(monkeypatch):
+    monkeypatch.setenv("HUGGINGFACE_API_KEY", "test")
+    client = InferenceClient(url="http://inference.test/model")
+    client.breaker = breaker = _half_open_breaker()
+    monkeypatch.setattr(client, "_get_client", lambda: _sse_client(["a", "b"]))
+
+    async def main():
+        return [text async for text in client.stream("prompt")]
+
+    assert asyncio.run(main()) == ["a", "b"]
+    assert breaker.state == "closed"
@@ -0,0 +1,31 @@
+"""
+Skills cached on pasted JD features follow skill taxonomy reloads.
+"""
+
+from app.ai_engine.skill_analyzer import skill_taxonomy
+from app.services.jd_features import JobDescriptionFeatures
+
+JD = "Backend engineer: Python, SQL and Zorblax on Kubernetes."
+
+
+class Taxonomy:
+    def __init__(self, source_hash, skills):
+        self.source_hash = source_hash
+        self.skills = skills
+
+    def find(self, text):
+        return {skill for skill in self.skills if skill in text.lower()}
+
+
+def test_skills_are_reextracted_after_taxonomy_reload(monkeypatch):
+    features = JobDescriptionFeatures()
+    taxonomy = Taxonomy(b"v1", {"python", "sql"})
+    monkeypatch.setattr(skill_taxonomy, "current", lambda: taxonomy)
+
+    entry = features.lookup(JD)
+    assert features.required_skills(entry) == ["python", "sql"]
+    taxonomy.skills = set()  # cached while the taxonomy is unchanged
+    assert features.required_skills(features.lookup(JD + " ")) == ["python", "sql"]
+
+    taxonomy = Taxonomy(b"v2", {"python", "sql", "zorblax"})
+    assert features.required_skills(features.lookup(JD)) == ["python", "sql", "zorblax"]
@@ -0,0 +1,57 @@
+"""
+Job matching index: users only match their own job descriptions, and syncing picks up
+JDs committed out of id order by other workers.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.models import JobDescription, Resume, User
+from app.services import job_index as job_index_module
+from app.services.job_index import JobIndex
+from app.utils.auth import hash_password
+
+DESCRIPTION = "Backend engineer with Python, SQL and REST API experience"
+
+
+@pytest.fixture(autouse=True)
+def fresh_index(monkeypatch):
+    monkeypatch.setattr(job_index_module, "job_index", JobIndex())
+
+
+@pytest.fixture
+def other_user(db):
+    other = User(email="bob@example.com", username="bob", full_name="Bob Person", hashed_password=hash_password("secret1"))
+    db.add(other)
+    db.commit()
+    return other
+
+
+def test_match_jobs_only_returns_own_job_descriptions(db, user, other_user, auth_headers):
+    resume = Resume(user_id=user.id, title="R1", skills=[{"category": "Languages", "items": ["Python", "SQL"]}])
+    db.add_all([
+        resume,
+        JobDescription(user_id=user.id, title="Mine", description=DESCRIPTION),
+        JobDescription(user_id=other_user.id, title="Theirs", description=DESCRIPTION),
+    ])
+    db.commit()
+
+    response = TestClient(app).post("/api/ai/match-jobs", json={"resume_id": resume.id}, headers=auth_headers)
+
+    assert response.status_code == 200
+    assert [item["title"] for item in response.json()["results"]] == ["Mine"]
+
+
+def test_sync_picks_up_lower_id_committed_later(db, user):
+    db.add(JobDescription(id=10, user_id=user.id, title="First", description=DESCRIPTION))
+    db.commit()
+    index = JobIndex(refresh_seconds=0)
+    index.ensure_loaded(db)
+
+    # Another worker commits a JD whose id was allocated before the one already indexed
+    db.add(JobDescription(id=5, user_id=user.id, title="Second", description=DESCRIPTION))
+    db.commit()
+    hits = index.search(db, user.id, {"python": 0.5, "sql": 0.5}, 10)
+
+    assert {jd_id for jd_id, _ in hits} == {5, 10}
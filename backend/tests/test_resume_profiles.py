@@ -0,0 +1,67 @@
+"""
+Section vectors of a resume refreshed by concurrent requests.
+"""
+
+import threading
+
+from app.database import SessionLocal
+from app.models.models import Resume, ResumeSectionVector
+from app.services import resume_profiles
+from app.services.resume_profiles import refresh_section_vectors
+
+RESUME = {
+    "title": "R1",
+    "personal_info": {"name": "Ann Person"},
+    "skills": [{"category": "Languages", "items": ["Python", "SQL"]}],
+    "experience": [{"company": "Acme", "role": "Engineer", "bullets": ["built REST APIs"]}],
+}
+
+
+def _other_request_refreshes(resume_id):
+    db = SessionLocal()
+    try:
+        refresh_section_vectors(db, db.get(Resume, resume_id))
+        db.commit()
+    finally:
+        db.close()
+
+
+def test_concurrent_first_refresh_does_not_conflict(db, user, monkeypatch):
+    resume = Resume(user_id=user.id, **RESUME)
+    db.add(resume)
+    db.commit()
+
+    # The other request stores the vectors after this one read none, before it writes
+    section_term_counts = resume_profiles.section_term_counts
+    raced = []
+
+    def racing_term_counts(text):
+        if not raced:
+            raced.append(True)
+            thread = threading.Thread(target=_other_request_refreshes, args=(resume.id,))
+            thread.start()
+            thread.join()
+        return section_term_counts(text)
+
+    monkeypatch.setattr(resume_profiles, "section_term_counts", racing_term_counts)
+    profile = refresh_section_vectors(db, resume)
+    db.commit()
+
+    rows = db.query(ResumeSectionVector).filter(ResumeSectionVector.resume_id == resume.id).all()
+    assert raced
+    assert {"skills", "experience"} <= {row.section for row in rows}
+    assert profile["token_count"] > 0
+
+
+def test_emptied_section_is_deleted(db, user):
+    resume = Resume(user_id=user.id, **RESUME)
+    db.add(resume)
+    db.commit()
+    refresh_section_vectors(db, resume)
+    db.commit()
+
+    resume.experience = []
+    refresh_section_vectors(db, resume, ["experience"])
+    db.commit()
+    rows = db.query(ResumeSectionVector).filter(ResumeSectionVector.resume_id == resume.id).all()
+    assert {"skills"} == {row.section for row in rows} - {"personal_info"}
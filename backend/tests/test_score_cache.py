@@ -0,0 +1,38 @@
+"""
+Score cache entries are upserted, so identical scores stored at the same time share one key.
+"""
+
+from app.database import SessionLocal
+from app.models.models import Resume, ResumeScore, ScoreCacheEntry
+from app.services.score_cache import ScoreCache
+
+
+def _store_score(db, resume_id, overall):
+    score = ResumeScore(user_id=db.get(Resume, resume_id).user_id, resume_id=resume_id, overall_score=overall)
+    db.add(score)
+    db.flush()
+    return score
+
+
+def test_put_repoints_an_existing_key(db, user):
+    resume = Resume(user_id=user.id, title="R1")
+    db.add(resume)
+    db.commit()
+    first = _store_score(db, resume.id, 70.0)
+    ScoreCache().put(db, "key", first)
+    db.commit()
+
+    # Another request that scored the same content commits its own row under the same key
+    other = SessionLocal()
+    try:
+        second = _store_score(other, resume.id, 71.0)
+        cached = ScoreCache().put(other, "key", second)
+        other.commit()
+        second_id = second.id
+    finally:
+        other.close()
+
+    assert cached["overall_score"] == 71.0
+    db.expire_all()
+    assert db.query(ScoreCacheEntry).count() == 1
+    assert db.get(ScoreCacheEntry, "key").score_id == second_id
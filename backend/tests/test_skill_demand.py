@@ -0,0 +1,51 @@
+"""
+Skill demand backfill: claimed once per database, and only remembered once committed.
+"""
+
+import pytest
+
+from app.database import SessionLocal
+from app.models.models import CorpusStat, SkillAnalysis
+from app.services import skill_demand
+from app.services.skill_demand import BACKFILL_MARKER, ensure_backfilled, record_analysis, top_skills
+
+
+@pytest.fixture(autouse=True)
+def fresh_process(monkeypatch):
+    monkeypatch.setattr(skill_demand, "_backfilled", False)
+
+
+@pytest.fixture
+def analyses(db, user):
+    for skills in (["Python", "SQL"], ["Python"]):
+        db.add(SkillAnalysis(user_id=user.id, job_role="Backend Engineer", required_skills=skills))
+    db.commit()
+
+
+def test_backfill_counts_existing_analyses(db, analyses):
+    total, skills = top_skills(db, "Backend Engineer")
+    assert total == 2
+    assert skills == [("Python", 2), ("SQL", 1)]
+
+
+def test_backfill_survives_caller_rollback(db, user, analyses):
+    record_analysis(db, "Backend Engineer", ["Go"])
+    db.rollback()
+    assert db.get(CorpusStat, BACKFILL_MARKER) is not None
+    assert top_skills(db, "Backend Engineer")[0] == 2
+
+
+def test_claimed_backfill_is_not_repeated(db, analyses):
+    other = SessionLocal()
+    other.add(CorpusStat(name=BACKFILL_MARKER, value=1))
+    other.commit()
+    other.close()
+    ensure_backfilled(db)  # another worker holds the claim: no rebuild, no IntegrityError
+    assert skill_demand._backfilled
+    assert top_skills(db, "Backend Engineer")[0] == 0
+
+
+def test_lost_claim_without_marker_is_retried(db, analyses, monkeypatch):
+    monkeypatch.setattr(skill_demand, "_backfill", lambda: False)
+    ensure_backfilled(db)
+    assert not skill_demand._backfilled
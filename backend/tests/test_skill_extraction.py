@@ -0,0 +1,19 @@
+"""
+Batch skill extraction reports the number of worker processes that actually ran it.
+"""
+
+from app.ai_engine.skill_analyzer import extract_skills_batch, extract_skills_from_text
+
+TEXTS = ["Python and SQL developer", "React and TypeScript", "Docker, Kubernetes and AWS"]
+
+
+def test_small_batch_runs_in_process():
+    skills, workers = extract_skills_batch(TEXTS, workers=4, chunk_size=10)
+    assert skills == [extract_skills_from_text(text) for text in TEXTS]
+    assert workers == 1
+
+
+def test_pooled_batch_reports_workers_used():
+    skills, workers = extract_skills_batch(TEXTS, workers=8, chunk_size=1)
+    assert skills == [extract_skills_from_text(text) for text in TEXTS]
+    assert workers == 3  # one chunk per text
@@ -0,0 +1,49 @@
+"""
+Skill autocomplete: an off-taxonomy skill wakes a rebuild only once a second distinct resume lists it.
+"""
+
+from app.models.models import Resume
+from app.services.skill_suggest import SkillSuggester
+
+SKILLS = [{"category": "Tools", "items": ["Zorblax"]}]
+
+
+def _suggester(db):
+    suggester = SkillSuggester()
+    suggester.rebuild(db)
+    return suggester
+
+
+def test_resaving_the_only_resume_does_not_wake(db, user):
+    resume = Resume(user_id=user.id, title="R1", skills=SKILLS)
+    db.add(resume)
+    db.commit()
+    suggester = _suggester(db)
+
+    for _ in range(3):
+        suggester.observe(resume.id, SKILLS)
+    assert not suggester._wake.is_set()
+
+
+def test_second_resume_wakes_and_rebuild_suggests(db, user):
+    first = Resume(user_id=user.id, title="R1", skills=SKILLS)
+    db.add(first)
+    db.commit()
+    suggester = _suggester(db)
+
+    second = Resume(user_id=user.id, title="R2", skills=SKILLS)
+    db.add(second)
+    db.commit()
+    suggester.observe(second.id, SKILLS)
+    assert suggester._wake.is_set()
+
+    suggester.rebuild(db)
+    assert [skill for skill, _ in suggester.suggest(db, "zorb", 5)] == ["zorblax"]
+
+
+def test_two_new_resumes_between_rebuilds_wake(db, user):
+    suggester = _suggester(db)
+    suggester.observe(1, SKILLS)
+    assert not suggester._wake.is_set()
+    suggester.observe(2, SKILLS)
+    assert suggester._wake.is_set()
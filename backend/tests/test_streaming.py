@@ -0,0 +1,162 @@
+"""
+Streamed generation endpoints, with stream_huggingface stubbed out. Events the app sends and
+steps of the stubbed upstream go into one log, so their order shows what the client got when.
+"""
+
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.ai_engine import inference_client as inference_module
+from app.ai_engine.inference_client import InferenceError
+from app.ai_engine.resume_generator import _rule_based_sections
+from app.main import app
+from app.models.models import CoverLetter, Resume
+from app.routes import ai_features
+from app.services.generation import store_generated_cover_letter, store_generated_resume
+
+RESUME = {
+    "title": "R1",
+    "personal_info": {"name": "Ann Person", "email": "ann@example.com"},
+    "education": [{"degree": "BSc Computer Science", "institution": "State University", "year": "2020"}],
+    "skills": [{"category": "Languages", "items": ["Python", "SQL"]}],
+    "experience": [{"company": "Acme", "role": "Engineer", "bullets": ["built REST APIs"]}],
+    "target_job_role": "Backend Engineer",
+}
+
+
+@pytest.fixture
+def log():
+    return []
+
+
+@pytest.fixture
+def client(engine, log):
+    async def recording_app(scope, receive, send):
+        async def recording_send(message):
+            if message["type"] == "http.response.body" and message.get("body", b"").startswith(b"event: "):
+                event, data = message["body"].decode().strip().split("\n")
+                log.append(("sent", event[len("event: "):], json.loads(data[len("data: "):])))
+            await send(message)
+        await app(scope, receive, recording_send)
+    return TestClient(recording_app)
+
+
+@pytest.fixture
+def upstream(monkeypatch, log):
+    """Stub for stream_huggingface yielding `tokens`, then raising `error` if set."""
+    class Upstream:
+        tokens = ["Ann ", "Person, ", "backend engineer"]
+        error = None
+
+        async def stream(self, prompt, max_tokens=1500):
+            for text in self.tokens:
+                log.append(("upstream", "token", text))
+                yield text
+                await asyncio.sleep(0)
+            if self.error:
+                raise self.error
+            log.append(("upstream", "finished", None))
+
+    stub = Upstream()
+    monkeypatch.setattr(inference_module, "stream_huggingface", stub.stream)
+    return stub
+
+
+@pytest.fixture
+def stores(monkeypatch, log):
+    def logged(store):
+        def wrapper(db, user_id, target_id, content, expected=None):
+            log.append(("stored", store.__name__, content))
+            return store(db, user_id, target_id, content, expected)
+        return wrapper
+    monkeypatch.setattr(ai_features, "store_generated_resume", logged(store_generated_resume))
+    monkeypatch.setattr(ai_features, "store_generated_cover_letter", logged(store_generated_cover_letter))
+
+
+@pytest.fixture
+def resume(db, user):
+    resume = Resume(user_id=user.id, **RESUME)
+    db.add(resume)
+    db.commit()
+    return resume
+
+
+def _events(log):
+    return [(event, data) for source, event, data in log if source == "sent"]
+
+
+def _position(log, entry):
+    return next(i for i, item in enumerate(log) if item[:2] == entry)
+
+
+def test_first_token_is_sent_before_upstream_finishes(client, auth_headers, log, upstream, stores, resume):
+    response = client.post("/api/ai/generate-resume/stream", json={"resume_id": resume.id}, headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert _position(log, ("sent", "token")) < _position(log, ("upstream", "finished"))
+    events = _events(log)
+    assert [data["text"] for event, data in events if event == "token"] == upstream.tokens
+    assert events[-1][0] == "done"
+    assert events[-1][1]["method"] == "huggingface"
+
+
+def test_done_is_sent_after_the_content_is_stored(client, auth_headers, db, log, upstream, stores, resume):
+    client.post("/api/ai/generate-resume/stream", json={"resume_id": resume.id}, headers=auth_headers)
+
+    assert _position(log, ("stored", "store_generated_resume")) < _position(log, ("sent", "done"))
+    assert [event for event, _ in _events(log)].count("done") == 1
+    db.refresh(resume)
+    assert resume.generated_content == "Ann Person, backend engineer"
+
+
+def test_mid_stream_failure_resets_and_falls_back(client, auth_headers, db, log, upstream, stores, resume):
+    upstream.error = InferenceError("connection reset")
+    client.post("/api/ai/generate-resume/stream", json={"resume_id": resume.id}, headers=auth_headers)
+
+    events = _events(log)
+    names = [event for event, _ in events]
+    reset = names.index("reset")
+    assert names[:reset] == ["token"] * len(upstream.tokens)
+    fallback = [data["text"] for event, data in events[reset + 1:] if event == "token"]
+    assert "".join(fallback) == "\n".join(_rule_based_sections(RESUME))
+    assert events[-1][0] == "done"
+    assert events[-1][1]["method"] == "rule_based"
+    db.refresh(resume)
+    assert resume.generated_content == events[-1][1]["generated_content"]
+
+
+def test_without_api_key_streams_rule_based_sections(client, auth_headers, monkeypatch, log, stores, resume):
+    monkeypatch.delenv("HUGGINGFACE_API_KEY", raising=False)
+    client.post("/api/ai/generate-resume/stream", json={"resume_id": resume.id}, headers=auth_headers)
+
+    events = _events(log)
+    sections = _rule_based_sections(RESUME)
+    tokens = [data["text"] for event, data in events if event == "token"]
+    assert len(tokens) == len(sections) > 1
+    assert tokens == [sections[0]] + ["\n" + section for section in sections[1:]]
+    assert events[-1][0] == "done"
+    assert events[-1][1]["method"] == "rule_based"
+
+
+def test_cover_letter_stream(client, auth_headers, db, user, log, upstream, stores, resume):
+    cl = CoverLetter(user_id=user.id, title="CL", company_name="Acme", job_title="Engineer", tone="formal")
+    db.add(cl)
+    db.commit()
+    client.post(
+        "/api/ai/generate-cover-letter/stream",
+        json={"cover_letter_id": cl.id, "resume_id": resume.id}, headers=auth_headers,
+    )
+
+    assert _position(log, ("sent", "token")) < _position(log, ("upstream", "finished"))
+    assert _position(log, ("stored", "store_generated_cover_letter")) < _position(log, ("sent", "done"))
+    db.refresh(cl)
+    assert cl.generated_content == "Ann Person, backend engineer"
+
+
+def test_stream_of_another_users_resume_is_not_found(client, auth_headers, upstream, resume):
+    response = client.post("/api/ai/generate-resume/stream", json={"resume_id": resume.id + 1}, headers=auth_headers)
+    assert response.status_code == 404
@@ -65,21 +65,89 @@ export const portfolioAPI = {
     delete: (id) => api.delete(`/api/portfolios/${id}`),
 };
 
+// ─── Job Descriptions ───
+export const jobDescriptionAPI = {
+    create: (data) => api.post('/api/job-descriptions/', data),
+    bulkCreate: (data) => api.post('/api/job-descriptions/bulk', data),
+    getAll: () => api.get('/api/job-descriptions/'),
+    getById: (id) => api.get(`/api/job-descriptions/${id}`),
+    delete: (id) => api.delete(`/api/job-descriptions/${id}`),
+};
+
+// Read server-sent events from a POST endpoint (EventSource only supports GET).
+// Calls onEvent(event, data) for each event and resolves with the data of the "done" event.
+const streamEvents = async (path, data, onEvent) => {
+    const token = localStorage.getItem('token');
+    const res = await fetch(`${API_BASE_URL}${path}`, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+            ...(token ? { Authorization: `Bearer ${token}` } : {}),
+        },
+        body: JSON.stringify(data),
+    });
+    if (!res.ok) throw new Error(`Request failed with status ${res.status}`);
+    const reader = res.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let result = null;
+    for (;;) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        let end;
+        while ((end = buffer.indexOf('\n\n')) !== -1) {
+            const message = buffer.slice(0, end);
+            buffer = buffer.slice(end + 2);
+            let event = 'message';
+            let payload = '';
+            for (const line of message.split('\n')) {
+                if (line.startsWith('event:')) event = line.slice(6).trim();
+                else if (line.startsWith('data:')) payload += line.slice(5).trim();
+            }
+            const parsed = payload ? JSON.parse(payload) : {};
+            if (event === 'done') result = parsed;
+            onEvent?.(event, parsed);
+        }
+    }
+    return result;
+};
+
 // ─── AI Features ───
 export const aiAPI = {
     generateResume: (data) => api.post('/api/ai/generate-resume', data),
     generateCoverLetter: (data) => api.post('/api/ai/generate-cover-letter', data),
+    streamResume: (data, onEvent) => streamEvents('/api/ai/generate-resume/stream', data, onEvent),
+    streamCoverLetter: (data, onEvent) => streamEvents('/api/ai/generate-cover-letter/stream', data, onEvent),
+    submitResumeJob: (data) => api.post('/api/ai/jobs/generate-resume', data),
+    submitCoverLetterJob: (data) => api.post('/api/ai/jobs/generate-cover-letter', data),
+    generateResumeHedged: (data) => api.post('/api/ai/generate-resume/hedged', data),
+    generateCoverLetterHedged: (data) => api.post('/api/ai/generate-cover-letter/hedged', data),
+    getJob: (id) => api.get(`/api/ai/jobs/${id}`),
     scoreResume: (data) => api.post('/api/ai/score-resume', data),
+    scoreResumeBatch: (data) => api.post('/api/ai/score-resume/batch', data),
+    rankResumes: (data) => api.post('/api/ai/rank-resumes', data),
+    matchJobs: (data) => api.post('/api/ai/match-jobs', data),
     skillAnalysis: (data) => api.post('/api/ai/skill-analysis', data),
     generatePortfolio: (data) => api.post('/api/ai/generate-portfolio', data),
     downloadPDF: (id) => api.get(`/api/ai/download-pdf/${id}`, { responseType: 'blob' }),
 };
 
+// ─── Skills ───
+export const skillsAPI = {
+    suggest: (q, limit = 10) => api.get('/api/skills/suggest', { params: { q, limit } }),
+};
+
 // ─── Admin ───
 export const adminAPI = {
     getDashboard: () => api.get('/api/admin/dashboard'),
     getUsers: () => api.get('/api/admin/users'),
     toggleUserActive: (id) => api.put(`/api/admin/users/${id}/toggle-active`),
+    searchCandidates: (data) => api.post('/api/admin/candidates/search', data),
+    getLLMCacheStats: () => api.get('/api/admin/metrics/llm-cache'),
+    getSingleFlightStats: () => api.get('/api/admin/metrics/single-flight'),
+    getInferenceBreakerStats: () => api.get('/api/admin/metrics/inference-breaker'),
+    getSkillDemand: (params) => api.get('/api/admin/analytics/skill-demand', { params }),
 };
 
 export default api;